@@ -1,7 +1,7 @@
 "use client";
 
 import { useState, useMemo } from "react";
-import { companiesData } from "@/lib/mocks";
+import { companiesData } from "@/lib/mocks/companies";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { Switch } from "@/components/ui/switch";
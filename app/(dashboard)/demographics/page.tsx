@@ -1,7 +1,7 @@
 "use client";
 
 import { Doughnut, Bar } from "react-chartjs-2";
-import { demographicsData } from "@/lib/mocks";
+import { demographicsData } from "@/lib/mocks/demographics";
 import { useState } from "react";
 import { Button } from "@/components/ui/button";
 
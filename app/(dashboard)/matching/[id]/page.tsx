@@ -8,7 +8,8 @@ import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Badge } from "@/components/ui/badge";
 import { Separator } from "@/components/ui/separator";
 
-import { researchers } from "@/lib/mocks";
+import { researchers } from "@/lib/mocks/researchers";
+import { researcherNeighbors } from "@/lib/mocks/neighbors";
 import { notFound } from "next/navigation";
 
 export default function ResearcherDetailPage({ params }: { params: { id: string } }) {
@@ -18,6 +19,11 @@ export default function ResearcherDetailPage({ params }: { params: { id: string
         notFound();
     }
 
+    // Precomputed by generate_mocks_v2.py: embedding neighbours, best first
+    const neighbors = ((researcherNeighbors as Record<string, { id: string; similarity: number }[]>)[researcher.id] ?? [])
+        .map((n) => ({ ...n, researcher: researchers.find((r) => r.id === n.id) }))
+        .filter((n) => n.researcher);
+
     return (
         <div className="flex flex-col gap-6 p-6">
             <div>
@@ -113,6 +119,32 @@ export default function ResearcherDetailPage({ params }: { params: { id: string
                             </CardContent>
                         </Card>
                     </div>
+
+                    {neighbors.length > 0 && (
+                        <Card>
+                            <CardHeader>
+                                <CardTitle>Similar Collaborators</CardTitle>
+                                <CardDescription>Researchers with the closest research profiles</CardDescription>
+                            </CardHeader>
+                            <CardContent className="grid gap-3">
+                                {neighbors.map(({ id, similarity, researcher: neighbor }) => (
+                                    <Link key={id} href={`/matching/${id}`} className="flex items-center justify-between gap-4 rounded-md p-2 hover:bg-muted">
+                                        <div className="flex items-center gap-3">
+                                            <Avatar className="h-8 w-8">
+                                                <AvatarImage src={neighbor!.image_url} />
+                                                <AvatarFallback>{neighbor!.name_ko[0]}</AvatarFallback>
+                                            </Avatar>
+                                            <div>
+                                                <div className="text-sm font-medium">{neighbor!.name_ko}</div>
+                                                <div className="text-xs text-muted-foreground">{neighbor!.position} @ {neighbor!.department}</div>
+                                            </div>
+                                        </div>
+                                        <Badge variant="outline">{Math.round(similarity * 100)}%</Badge>
+                                    </Link>
+                                ))}
+                            </CardContent>
+                        </Card>
+                    )}
                 </div>
             </div>
         </div>
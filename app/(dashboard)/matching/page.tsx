@@ -7,7 +7,7 @@ import { Input } from "@/components/ui/input";
 import { Card, CardContent, CardDescription, CardFooter, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
-import { researchers } from "@/lib/mocks";
+import { researchers } from "@/lib/mocks/researchers";
 
 export default function MatchingPage() {
     const researcherList = researchers;
@@ -2,7 +2,8 @@
 
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { FaUsers, FaFlask, FaTrophy, FaChartLine, FaSearch, FaBuilding } from "react-icons/fa";
-import { demographicsData, performanceData } from "@/lib/mocks";
+import { demographicsData } from "@/lib/mocks/demographics";
+import { performanceData } from "@/lib/mocks/performance";
 import Link from "next/link";
 import { Button } from "@/components/ui/button";
 
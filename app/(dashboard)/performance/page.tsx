@@ -1,7 +1,7 @@
 "use client";
 
 import { Bar } from "react-chartjs-2";
-import { performanceData, avgStatsData } from "@/lib/mocks";
+import { performanceData, avgStatsData } from "@/lib/mocks/performance";
 import { useState } from "react";
 import { Button } from "@/components/ui/button";
 import { FaSackDollar, FaBook } from "react-icons/fa6";
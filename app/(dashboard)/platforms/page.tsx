@@ -1,7 +1,9 @@
 "use client";
 
 import { Pie, Bar } from "react-chartjs-2";
-import { platformData, demographicsData, recruitmentData } from "@/lib/mocks";
+import { platformData } from "@/lib/mocks/platforms";
+import { demographicsData } from "@/lib/mocks/demographics";
+import { recruitmentData } from "@/lib/mocks/recruitment";
 import { FaWandMagicSparkles } from "react-icons/fa6";
 
 export default function PlatformsPage() {
@@ -7,7 +7,8 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { FaSearch, FaUserMd, FaFlask, FaRobot, FaArrowLeft, FaMicrochip, FaHandshake, FaArrowRight } from "react-icons/fa";
-import { researchers as mockResearchers, recruitmentData as mockRecruitmentData } from "@/lib/mocks";
+import { researchers as mockResearchers } from "@/lib/mocks/researchers";
+import { recruitmentData as mockRecruitmentData } from "@/lib/mocks/recruitment";
 
 export default function SearchPage() {
     const [query, setQuery] = useState("");
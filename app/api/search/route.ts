@@ -30,9 +30,12 @@ export async function POST(req: Request) {
         }
 
         // 1. Generate embedding for the query
+        // EMBEDDING_DIMENSIONS must match `migrate_data.py --dimensions` when embeddings are stored truncated
+        const dimensions = process.env.EMBEDDING_DIMENSIONS ? Number(process.env.EMBEDDING_DIMENSIONS) : undefined;
         const embeddingResponse = await openai.embeddings.create({
             model: 'text-embedding-3-small',
             input: query,
+            ...(dimensions ? { dimensions } : {}),
         });
 
         const embedding = embeddingResponse.data[0].embedding;
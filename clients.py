@@ -0,0 +1,267 @@
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+from rate_limiter import percentile
+
+load_dotenv('.env.local')
+
+SUPABASE_ENV = ["NEXT_PUBLIC_SUPABASE_URL", "NEXT_PUBLIC_SUPABASE_ANON_KEY"]
+OPENAI_ENV = ["OPENAI_API_KEY"]
+
+# One pool per client, shared by every thread of a script
+MAX_CONNECTIONS = 20
+KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 30.0
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 120.0
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+# Methods that may be repeated after the server saw them; POST (insert, rpc) only retries on 429
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+GATEWAY_STATUS = (502, 503, 504)
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+DEFAULT_PIPELINE_DEPTH = 8
+
+
+def require_env(*names):
+    """Values of `names`; exits with the usual message when one is not set."""
+    missing = [n for n in names if not os.environ.get(n)]
+    if missing:
+        print(f"Error: Missing environment variables ({', '.join(missing)}). Please check .env.local")
+        raise SystemExit(1)
+    return [os.environ[n] for n in names]
+
+
+class LatencyHistogram:
+    """Request latencies per endpoint ("METHOD /path"), bucketed in milliseconds, plus retry counts."""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.samples = {}
+        self.retries = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, seconds):
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append(seconds)
+
+    def retried(self, endpoint):
+        with self._lock:
+            self.retries[endpoint] = self.retries.get(endpoint, 0) + 1
+
+    def counts(self, endpoint):
+        """Calls per bucket: <= each bound in buckets_ms, then one overflow bucket."""
+        counts = [0] * (len(self.buckets_ms) + 1)
+        for seconds in self.samples.get(endpoint, []):
+            ms = seconds * 1000
+            counts[next((i for i, bound in enumerate(self.buckets_ms) if ms <= bound), len(self.buckets_ms))] += 1
+        return counts
+
+    def report(self):
+        lines = []
+        for endpoint in sorted(self.samples):
+            samples = self.samples[endpoint]
+            bounds = [f"<={b}" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}"]
+            buckets = " ".join(f"{b}:{c}" for b, c in zip(bounds, self.counts(endpoint)) if c)
+            retries = self.retries.get(endpoint, 0)
+            lines.append(f"{endpoint}: {len(samples)} calls, p50 {percentile(samples, 50) * 1000:.0f} ms, "
+                         f"p95 {percentile(samples, 95) * 1000:.0f} ms, p99 {percentile(samples, 99) * 1000:.0f} ms"
+                         f"{f', {retries} retried' if retries else ''} [ms {buckets}]")
+        return "\n".join(lines)
+
+
+latencies = LatencyHistogram()
+
+
+def retry_delay(attempt, retry_after=None, backoff=DEFAULT_BACKOFF):
+    # The server's Retry-After (seconds) wins; otherwise exponential backoff with jitter
+    try:
+        return min(MAX_BACKOFF, max(0.0, float(retry_after)))
+    except (TypeError, ValueError):
+        return min(MAX_BACKOFF, backoff * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+
+class PooledTransport:
+    """Wraps an httpx-style transport: records per-endpoint latency and retries transient failures.
+
+    429s are retried for every method and 502/503/504 or dropped connections only for
+    idempotent ones, so an insert is never applied twice. Connection failures are retried
+    for every method (the request never reached the server). Works for httpx and for the
+    httpx fork the OpenAI SDK ships, given that package as `http`.
+    """
+
+    def __init__(self, http, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, histogram=latencies, http2=False):
+        limits = http.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=KEEPALIVE_CONNECTIONS,
+                             keepalive_expiry=KEEPALIVE_EXPIRY)
+        self.transport = http.HTTPTransport(limits=limits, http2=http2)
+        self.connect_errors = (http.ConnectError, http.ConnectTimeout)
+        self.dropped_errors = (http.ReadError, http.RemoteProtocolError)
+        self.retries = retries
+        self.backoff = backoff
+        self.histogram = histogram
+
+    def retryable(self, method, status):
+        return status == 429 or (status in GATEWAY_STATUS and method in IDEMPOTENT_METHODS)
+
+    def handle_request(self, request):
+        endpoint = f"{request.method} {request.url.path}"
+        for attempt in range(self.retries + 1):
+            started = time.perf_counter()
+            try:
+                response = self.transport.handle_request(request)
+            except (self.connect_errors + self.dropped_errors) as e:
+                self.histogram.record(endpoint, time.perf_counter() - started)
+                if attempt == self.retries or not (isinstance(e, self.connect_errors)
+                                                   or request.method in IDEMPOTENT_METHODS):
+                    raise
+                delay = retry_delay(attempt, backoff=self.backoff)
+            else:
+                self.histogram.record(endpoint, time.perf_counter() - started)
+                if attempt == self.retries or not self.retryable(request.method, response.status_code):
+                    return response
+                delay = retry_delay(attempt, response.headers.get('retry-after'), self.backoff)
+                response.close()
+            self.histogram.retried(endpoint)
+            time.sleep(delay)
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def supabase_client(key_name="NEXT_PUBLIC_SUPABASE_ANON_KEY"):
+    """Supabase client whose PostgREST / storage / functions calls share one keep-alive HTTP/2 pool."""
+    import httpx
+    from supabase import create_client
+    from supabase.lib.client_options import SyncClientOptions
+
+    url, key = require_env("NEXT_PUBLIC_SUPABASE_URL", key_name)
+    session = httpx.Client(transport=PooledTransport(httpx, http2=True), follow_redirects=True,
+                           timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT))
+    return create_client(url, key, options=SyncClientOptions(httpx_client=session))
+
+
+def supabase_admin_client():
+    # Service role key if available to bypass RLS, otherwise the anon key + policies
+    require_env(*SUPABASE_ENV)
+    if os.environ.get("SUPABASE_SERVICE_ROLE_KEY"):
+        return supabase_client("SUPABASE_SERVICE_ROLE_KEY")
+    return supabase_client()
+
+
+def openai_client():
+    """OpenAI client on a pooled keep-alive session. OPENAI_BASE_URL can point it at a local fake server.
+
+    The transport does not retry: BatchEmbedder retries embeddings itself so 429s reach its rate limiter.
+    """
+    from openai import DefaultHttpxClient, OpenAI
+
+    api_key, = require_env(*OPENAI_ENV)
+    # The SDK may be built on its own httpx fork; the transport has to come from the same package
+    http = sys.modules[DefaultHttpxClient.__mro__[1].__module__.split('.')[0]]
+    session = DefaultHttpxClient(transport=PooledTransport(http, retries=0))
+    return OpenAI(api_key=api_key, max_retries=0, http_client=session)
+
+
+class Lazy:
+    """Proxy that builds its object (a client, a cache) on first use, once, from any thread.
+
+    Importing a script therefore neither reads credentials, opens connections nor creates
+    files, and `override()` swaps in a fake backend before (or instead of) the real one.
+    Every other attribute is the wrapped object's; the proxy's own names are ones no
+    wrapped object uses, so it never hides their methods (EmbeddingCache.get, dict.get, ...).
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+        self._lock = threading.Lock()
+
+    def resolve(self):
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._factory()
+        return self._value
+
+    def override(self, value):
+        with self._lock:
+            self._value = value
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+
+supabase = Lazy(supabase_client)
+supabase_admin = Lazy(supabase_admin_client)
+openai = Lazy(openai_client)
+
+
+def use(supabase=None, supabase_admin=None, openai=None):
+    """Swap in fake backends for tests, e.g. use(supabase=FakeSupabase(), openai=FakeOpenAI())."""
+    fakes = {'supabase': supabase, 'supabase_admin': supabase_admin, 'openai': openai}
+    for name, fake in fakes.items():
+        if fake is not None:
+            globals()[name].override(fake)
+
+
+def pipelined(func, items, depth=DEFAULT_PIPELINE_DEPTH):
+    """Yield func(item) for each item, in order, keeping up to `depth` calls in flight on the shared pool.
+
+    For independent requests that cannot be batched into one (per-row updates, chunked deletes).
+    An exception is raised when its result is reached.
+    """
+    if depth <= 1:
+        yield from (func(item) for item in items)
+        return
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= depth:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def benchmark(n, delay_ms, depth):
+    # Simulated round trips: serial calls against `depth` in flight
+    def call(item):
+        time.sleep(delay_ms / 1000)
+        return item
+
+    started = time.perf_counter()
+    serial = list(pipelined(call, range(n), 1))
+    serial_time = time.perf_counter() - started
+    started = time.perf_counter()
+    overlapped = list(pipelined(call, range(n), depth))
+    overlapped_time = time.perf_counter() - started
+    assert overlapped == serial, "pipelined results out of order"
+    print(f"{n} calls at {delay_ms} ms: serial {serial_time:.2f}s, depth {depth} {overlapped_time:.2f}s "
+          f"({serial_time / overlapped_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pipelined requests against serial round trips.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[200])
+    parser.add_argument('--latency-ms', type=int, default=40, help="Simulated round trip per call")
+    parser.add_argument('--depth', type=int, default=DEFAULT_PIPELINE_DEPTH)
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n, args.latency_ms, args.depth)
@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_STATE_PATH = '.cache/crawl_state.sqlite'
+
+
+class CrawlState:
+    """Per-researcher record of what the image scraper fetched, committed after every profile.
+
+    A run is a checkpoint boundary: `start_run(resume=True)` reuses the last unfinished run,
+    so profiles already checked in it are skipped after a crash.
+    """
+
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                name TEXT PRIMARY KEY,
+                profile_url TEXT,
+                image_url TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT,
+                file_path TEXT,
+                status TEXT,
+                checked_at REAL,
+                changed_at REAL,
+                run_id INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at REAL,
+                finished_at REAL
+            );
+        """)
+        self._conn.commit()
+        self.run_id = None
+
+    def start_run(self, resume=False):
+        with self._lock:
+            if resume:
+                row = self._conn.execute(
+                    "SELECT id FROM runs WHERE finished_at IS NULL ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+                if row:
+                    self.run_id = row['id']
+                    return self.run_id, True
+            cursor = self._conn.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),))
+            self._conn.commit()
+            self.run_id = cursor.lastrowid
+            return self.run_id, False
+
+    def finish_run(self):
+        with self._lock:
+            self._conn.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (time.time(), self.run_id))
+            self._conn.commit()
+
+    def get(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM profiles WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+    def done_in_current_run(self, name):
+        state = self.get(name)
+        return bool(state) and state['run_id'] == self.run_id
+
+    def record(self, name, **fields):
+        """Upsert the given columns for `name` and commit (the checkpoint)."""
+        fields['checked_at'] = time.time()
+        fields['run_id'] = self.run_id
+        columns = ', '.join(fields)
+        placeholders = ', '.join('?' for _ in fields)
+        updates = ', '.join(f"{c} = excluded.{c}" for c in fields)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO profiles (name, {columns}) VALUES (?, {placeholders}) "
+                f"ON CONFLICT(name) DO UPDATE SET {updates}",
+                [name, *fields.values()],
+            )
+            self._conn.commit()
+
+    def status_counts(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM profiles WHERE run_id = ? GROUP BY status", (self.run_id,)
+            ).fetchall()
+        return {r['status']: r['n'] for r in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,244 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# OpenAI accepts up to 2048 inputs and ~300k tokens per embeddings request.
+# Stay well below both so a single oversized row never sinks a whole batch.
+DEFAULT_MAX_ITEMS = 256
+DEFAULT_MAX_TOKENS = 100000
+DEFAULT_MODEL = "text-embedding-3-small"
+NON_RETRYABLE_STATUS = (400, 401, 403, 404, 422)
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _encoding = None
+
+
+def clean_text(text):
+    return str(text).replace("\n", " ")
+
+
+def estimate_tokens(text):
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    # Without tiktoken, over-estimate: Hangul is ~1-1.5 tokens per syllable (3 UTF-8 bytes),
+    # ASCII is ~4 characters per token.
+    return len(text.encode('utf-8')) // 2 + 1
+
+
+def iter_batches(texts, max_items=DEFAULT_MAX_ITEMS, max_tokens=DEFAULT_MAX_TOKENS):
+    """Yield lists of indices into `texts`, bounded by item count and token budget."""
+    batch = []
+    batch_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(i)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+class BatchEmbedder:
+    """Embeds many texts per request while keeping results aligned with the input order.
+
+    `client` is anything exposing `client.embeddings.create(input=[...], model=...)`,
+    so an `OpenAI(base_url=...)` pointed at a local fake server works the same way.
+    With a `cache` (see embedding_cache.EmbeddingCache) only uncached texts are sent.
+    With `concurrency` > 1 batches are sent from a thread pool, paced by `limiter`
+    (see rate_limiter.RateLimiter).
+    """
+
+    def __init__(self, client, model=DEFAULT_MODEL, max_items=DEFAULT_MAX_ITEMS,
+                 max_tokens=DEFAULT_MAX_TOKENS, max_retries=3, backoff=1.0, cache=None,
+                 concurrency=1, limiter=None):
+        self.client = client
+        self.cache = cache
+        self.concurrency = concurrency
+        self.limiter = limiter
+        self.latencies = []
+        self.model = model
+        self.max_items = max_items
+        self.max_tokens = max_tokens
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+
+    def _request(self, texts):
+        if self.limiter is not None:
+            self.limiter.acquire(sum(estimate_tokens(t) for t in texts))
+        with self._count_lock:
+            self.request_count += 1
+        started = time.perf_counter()
+        response = self.client.embeddings.create(input=texts, model=self.model)
+        self.latencies.append(time.perf_counter() - started)
+        if self.limiter is not None:
+            self.limiter.recover()
+        data = sorted(response.data, key=lambda d: d.index)
+        if len(data) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, got {len(data)}")
+        return [d.embedding for d in data]
+
+    def _embed_batch(self, texts):
+        last_error = None
+        status = None
+        for attempt in range(self.max_retries):
+            try:
+                return self._request(texts)
+            except Exception as e:
+                last_error = e
+                status = getattr(e, 'status_code', None)
+                # Bad input won't succeed on retry; go straight to splitting
+                if status in NON_RETRYABLE_STATUS:
+                    break
+                if status == 429 and self.limiter is not None:
+                    self.limiter.throttle()
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.backoff * (2 ** attempt))
+
+        if len(texts) == 1 or status not in NON_RETRYABLE_STATUS:
+            # Rate limits, 5xx and timeouts are not about the input: splitting would only multiply requests
+            print(f"Error embedding {len(texts)} text(s) ({texts[0][:40]}...): {last_error}")
+            return [None] * len(texts)
+
+        # Split so only the half containing the bad input keeps failing.
+        mid = len(texts) // 2
+        return self._embed_batch(texts[:mid]) + self._embed_batch(texts[mid:])
+
+    def iter_embed(self, texts):
+        """Yield (index, embedding) pairs as soon as each batch finishes.
+
+        Cached texts come first; with concurrency > 1 batches arrive in completion order.
+        Embedding is None where a single text could not be embedded.
+        """
+        texts = [clean_text(t) for t in texts]
+        if self.cache is not None:
+            cached = self.cache.get_many(self.model, texts)
+        else:
+            cached = [None] * len(texts)
+
+        missing = []
+        for i, embedding in enumerate(cached):
+            if embedding is None:
+                missing.append(i)
+            else:
+                yield i, embedding
+        missing_texts = [texts[i] for i in missing]
+
+        def run(indices):
+            batch_texts = [missing_texts[i] for i in indices]
+            embeddings = self._embed_batch(batch_texts)
+            if self.cache is not None:
+                self.cache.put_many(self.model, batch_texts, embeddings)
+            return [(missing[i], embedding) for i, embedding in zip(indices, embeddings)]
+
+        batches = iter_batches(missing_texts, self.max_items, self.max_tokens)
+        if self.concurrency > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                futures = [pool.submit(run, indices) for indices in batches]
+                for future in as_completed(futures):
+                    yield from future.result()
+        else:
+            for indices in batches:
+                yield from run(indices)
+
+    def embed(self, texts):
+        """Return one embedding per text (None where a single text could not be embedded)."""
+        results = [None] * len(texts)
+        for i, embedding in self.iter_embed(texts):
+            results[i] = embedding
+        return results
+
+
+class FakeEmbeddingsHandler(BaseHTTPRequestHandler):
+    """A stand-in /embeddings endpoint for check_batcher.
+
+    Inputs containing "BAD" get a 400; while `server.busy` is positive each request
+    gets `server.busy_status` and decrements it. Vectors are [len(text), 1.0].
+    """
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        server = self.server
+        with server.lock:
+            server.requests.append(len(body['input']))
+            busy = server.busy > 0
+            server.busy -= busy
+        if busy:
+            self.reply(server.busy_status, {'error': {'message': 'busy', 'type': 'server_error'}})
+        elif any('BAD' in text for text in body['input']):
+            self.reply(400, {'error': {'message': 'bad input', 'type': 'invalid_request_error'}})
+        else:
+            data = [{'object': 'embedding', 'index': i, 'embedding': [float(len(text)), 1.0]}
+                    for i, text in enumerate(body['input'])]
+            self.reply(200, {'object': 'list', 'data': data, 'model': body['model'],
+                             'usage': {'prompt_tokens': 0, 'total_tokens': 0}})
+
+    def reply(self, status, payload):
+        encoded = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, *args):
+        pass
+
+
+def check_batcher(backoff=0.05):
+    """Run BatchEmbedder through the OpenAI client against a local fake endpoint."""
+    from openai import OpenAI
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeEmbeddingsHandler)
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OpenAI(api_key='check', base_url=f"http://127.0.0.1:{server.server_port}/v1", max_retries=0)
+
+    def run(texts, busy=0, busy_status=503):
+        server.requests, server.busy, server.busy_status = [], busy, busy_status
+        embedder = BatchEmbedder(client, max_items=len(texts), max_retries=3, backoff=backoff)
+        started = time.perf_counter()
+        results = embedder.embed(texts)
+        return results, list(server.requests), time.perf_counter() - started
+
+    try:
+        texts = [f"text {i}" * (i + 1) for i in range(10)]
+        texts[7] = "BAD input"
+        results, requests, _ = run(texts)
+        # A 400 is not retried; bisecting isolates the bad text and keeps the rest
+        assert results[7] is None, results[7]
+        assert all(r == [float(len(t)), 1.0] for i, (r, t) in enumerate(zip(results, texts)) if i != 7), results
+        assert requests == [10, 5, 5, 2, 3, 1, 2], requests
+
+        texts = ["a", "bb", "ccc", "dddd"]
+        results, requests, elapsed = run(texts, busy=99, busy_status=503)
+        # Server errors are retried max_retries times with backoff, never split
+        assert results == [None] * 4 and requests == [4, 4, 4], (results, requests)
+        assert elapsed >= backoff * (1 + 2) * 0.9, elapsed
+
+        results, requests, _ = run(texts, busy=2, busy_status=429)
+        assert results == [[float(len(t)), 1.0] for t in texts] and requests == [4, 4, 4], (results, requests)
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+    print("BatchEmbedder checks passed (400 bisected to the bad text, 503 retried without splitting, "
+          "429 recovered)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check BatchEmbedder's split-on-4xx and retry/backoff "
+                                                 "behaviour against a local fake embeddings endpoint.")
+    parser.add_argument('--backoff', type=float, default=0.05, help="Backoff base for the check, in seconds")
+    args = parser.parse_args()
+    check_batcher(args.backoff)
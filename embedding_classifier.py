@@ -0,0 +1,165 @@
+import argparse
+import hashlib
+import time
+
+import numpy as np
+
+from embedding_batcher import DEFAULT_MODEL
+from embedding_cache import normalize_text
+from keyword_classifier import KeywordClassifier, PLATFORM_KEYWORDS, synthetic_titles
+
+SEED_PERCENTILE = 10
+
+
+def project_text(title, project):
+    # The text migrate_data.py embeds for a project, so cached vectors are reused
+    title = '' if title is None or title != title else title
+    project = '' if project is None or project != project else project
+    return normalize_text(f"{title} {project}")
+
+
+def platform_text(platform, keywords):
+    return f"{platform}: {', '.join(keywords)}"
+
+
+class CacheOnlyEmbedder:
+    """Embedder that only reads an EmbeddingCache: texts that were never embedded get None."""
+
+    def __init__(self, cache, model=DEFAULT_MODEL):
+        self.cache = cache
+        self.model = model
+
+    def embed(self, texts):
+        return self.cache.get_many(self.model, texts)
+
+
+class FakeEmbedder:
+    """Deterministic offline stand-in for BatchEmbedder: hashed character bigrams, L2-normalized."""
+
+    def __init__(self, dims=256, model='fake-hashing'):
+        self.dims = dims
+        self.model = model
+
+    def embed(self, texts):
+        vectors = []
+        for text in texts:
+            vector = np.zeros(self.dims, dtype=np.float32)
+            text = normalize_text(text)
+            for i in range(len(text) - 1):
+                digest = hashlib.blake2b(text[i:i + 2].encode('utf-8'), digest_size=4).digest()
+                vector[int.from_bytes(digest, 'little') % self.dims] += 1
+            norm = np.linalg.norm(vector)
+            vectors.append((vector / norm if norm else vector).tolist())
+        return vectors
+
+
+def unit_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def normalized_matrix(vectors, dims=None):
+    """(n, dims) float32 rows scaled to unit length, plus a mask of rows that had a vector."""
+    present = np.array([v is not None for v in vectors], dtype=bool)
+    if dims is None:
+        dims = next((len(v) for v in vectors if v is not None), 0)
+    matrix = np.zeros((len(vectors), dims), dtype=np.float32)
+    if present.any():
+        matrix[present] = np.asarray([v for v in vectors if v is not None], dtype=np.float32)
+    return unit_rows(matrix), present
+
+
+class EmbeddingClassifier:
+    """Assigns NTIS projects to platforms by cosine similarity to per-platform centroids.
+
+    Centroids are the mean of each platform's description vector and of the projects the
+    keyword lists label (`fit`). A project is scored against every centroid in one matrix
+    multiply and takes the closest platform if its similarity reaches `min_similarity`
+    (by default the 10th percentile of the seed projects' own similarities). Projects with
+    no embedding, or too far from every centroid, fall back to the keyword classifier.
+    """
+
+    def __init__(self, embedder, platform_keywords=PLATFORM_KEYWORDS, min_similarity=None):
+        self.embedder = embedder
+        self.platforms = list(platform_keywords)
+        self.platform_keywords = platform_keywords
+        self.keywords = KeywordClassifier(platform_keywords)
+        self.min_similarity = min_similarity
+        self.centroids = None
+        self.seeds = 0
+        self.sources = {'embedding': 0, 'keyword': 0, 'none': 0}
+
+    def fit(self, titles, projects):
+        started = time.perf_counter()
+        descriptions = [platform_text(p, words) for p, words in self.platform_keywords.items()]
+        vectors = self.embedder.embed(descriptions + [project_text(t, p) for t, p in zip(titles, projects)])
+        matrix, present = normalized_matrix(vectors)
+        if not present.any():
+            print("Embedding classifier: no cached embeddings, using keywords only")
+            return self
+        n_platforms = len(self.platforms)
+        labels = self.keywords.classify(titles)
+        seed_index = np.array([self.platforms.index(l) if l else -1 for l in labels], dtype=np.int64)
+        seeded = (seed_index >= 0) & present[n_platforms:]
+        # Sum of unit vectors per platform: its description plus every seed project
+        membership = np.zeros((n_platforms, len(vectors)), dtype=np.float32)
+        membership[np.arange(n_platforms), np.arange(n_platforms)] = present[:n_platforms]
+        membership[seed_index[seeded], n_platforms + np.flatnonzero(seeded)] = 1
+        centroids = unit_rows(membership @ matrix)
+        self.centroids = centroids
+        self.seeds = int(seeded.sum())
+        if self.min_similarity is None and self.seeds:
+            own = (matrix[n_platforms:][seeded] * centroids[seed_index[seeded]]).sum(axis=1)
+            self.min_similarity = float(np.percentile(own, SEED_PERCENTILE))
+        elif self.min_similarity is None:
+            self.min_similarity = 0.0
+        print(f"Embedding classifier: {self.seeds} seed projects, min similarity {self.min_similarity:.3f} "
+              f"({time.perf_counter() - started:.2f}s)")
+        return self
+
+    def classify(self, titles, projects=None):
+        """Best platform per project, or None where neither embeddings nor keywords match."""
+        if self.centroids is None:
+            return self.keywords.classify(titles)
+        projects = projects if projects is not None else [''] * len(titles)
+        matrix, present = normalized_matrix(self.embedder.embed([project_text(t, p) for t, p in zip(titles, projects)]),
+                                            self.centroids.shape[1])
+        scores = matrix @ self.centroids.T
+        best = scores.argmax(axis=1)
+        accepted = present & (scores[np.arange(len(titles)), best] >= self.min_similarity)
+        results = [self.platforms[b] if a else None for b, a in zip(best.tolist(), accepted.tolist())]
+        fallback = [i for i, a in enumerate(accepted.tolist()) if not a]
+        for i, label in zip(fallback, self.keywords.classify([titles[i] for i in fallback])):
+            results[i] = label
+        self.sources['embedding'] += int(accepted.sum())
+        self.sources['keyword'] += sum(1 for i in fallback if results[i])
+        self.sources['none'] += sum(1 for i in fallback if not results[i])
+        return results
+
+    def summary(self):
+        return ", ".join(f"{count} by {source}" for source, count in self.sources.items())
+
+
+def benchmark(n):
+    titles = synthetic_titles(n)
+    projects = [''] * n
+    classifier = EmbeddingClassifier(FakeEmbedder())
+    started = time.perf_counter()
+    classifier.fit(titles, projects)
+    fitted = time.perf_counter() - started
+    started = time.perf_counter()
+    labels = classifier.classify(titles, projects)
+    elapsed = time.perf_counter() - started
+    keyword_labels = classifier.keywords.classify(titles)
+    matched = sum(1 for b in keyword_labels if b)
+    agree = sum(1 for a, b in zip(labels, keyword_labels) if b and a == b) / max(1, matched)
+    print(f"{n} projects: fit {fitted:.2f}s, classify {elapsed:.2f}s incl. fake embedding ({classifier.summary()}), "
+          f"{agree:.1%} agreement with keywords where keywords match")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the centroid classifier offline with the fake embedder.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n)
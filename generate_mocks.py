@@ -1,30 +1,27 @@
 import pandas as pd
 import json
 import numpy as np
+from keyword_classifier import KeywordClassifier, PLATFORM_KEYWORDS
+from mock_aggregates import clean_float, clean_list, clean_str
+from mock_writer import ModuleWriter
+from spreadsheet_cache import read_workbook
 
-def clean_float(x):
-    if pd.isna(x):
-        return 0
-    return float(x)
-
-def clean_str(x):
-    if pd.isna(x):
-        return ""
-    return str(x).strip()
-
-def clean_list(x):
-    if pd.isna(x):
-        return []
-    return [s.strip() for s in str(x).split(',') if s.strip()]
+PLATFORM_COLUMNS = ['정밀의료기기', '정밀재생', '면역-마이크로바이옴', '신약', '데이터', '혁신형의사과학자']
+TOTAL_COLUMNS = ['name', 'department', 'title', 'specialty', 'paper_2025', 'budget_pi_25', 'EST_STRT_YR',
+                 *PLATFORM_COLUMNS]
+NTIS_COLUMNS = ['title', 'project', 'year', 'budget', 'pi']
+# Kept out of the way of @/lib/mocks (lib/mocks/index.ts, written by generate_mocks_v2.py):
+# a lib/mocks.ts here would shadow it and hand the pages this older single module
+OUTPUT_PATH = 'lib/mocks/legacy.ts'
 
 try:
-    df = pd.read_excel('total_df.xlsx')
+    df = read_workbook('total_df.xlsx', TOTAL_COLUMNS)
     
     # 1. Process Researchers
     researchers = []
     
     # Platform columns
-    platforms = ['정밀의료기기', '정밀재생', '면역-마이크로바이옴', '신약', '데이터', '혁신형의사과학자']
+    platforms = PLATFORM_COLUMNS
     platform_keys = ['device', 'regen', 'immune', 'drug', 'data', 'doctor_scientist'] # Mapping for internal use if needed, but for now we just need stats
     
     for idx, row in df.iterrows():
@@ -180,7 +177,7 @@ try:
 
     # 7. Calculate Recruitment Data (NTIS)
     try:
-        ntis_df = pd.read_excel('ntis_results.xlsx')
+        ntis_df = read_workbook('ntis_results.xlsx', NTIS_COLUMNS)
         
         # Identify non-platform researchers (names)
         # We need to match by name since IDs might not align perfectly or we just use names for simplicity
@@ -195,33 +192,16 @@ try:
             (ntis_df['pi_clean'].isin(non_platform_names))
         ].copy()
         
-        # Platform Keywords for Matching
-        platform_keywords = {
-            '데이터': ['데이터', 'AI', '인공지능', '빅데이터', '클라우드', '머신러닝', '딥러닝', '스마트'],
-            '의사과학자': ['의사과학자', '혁신형', '양성'],
-            '정밀재생': ['재생', '줄기세포', '오가노이드', '조직공학', '바이오프린팅'],
-            '정밀의료기기': ['의료기기', '디바이스', '로봇', '센서', '영상', '진단기기', '웨어러블'],
-            '면역/마이크로': ['면역', '마이크로바이옴', '백신', '감염', '바이러스', '항체'],
-            '신약': ['신약', '약물', '치료제', '항암제', '표적', '후보물질']
-        }
-        
-        # Match Projects
+        # Match Projects (platform keywords, all titles in one pass)
+        titles = [clean_str(t) for t in target_projects['title']]
+        best_matches = KeywordClassifier(PLATFORM_KEYWORDS).classify(titles)
         matched_projects = []
         platform_potential = {p: 0 for p in ui_platform_labels}
         
-        for _, row in target_projects.iterrows():
-            title = clean_str(row['title'])
-            budget = clean_float(row['budget']) / 100000000 # Convert to Eok
-            pi = clean_str(row['pi'])
-            
-            best_match = None
-            max_matches = 0
-            
-            for p_name, keywords in platform_keywords.items():
-                matches = sum(1 for k in keywords if k in title)
-                if matches > max_matches:
-                    max_matches = matches
-                    best_match = p_name
+        for title, best_match, raw_budget, raw_pi, raw_project in zip(
+                titles, best_matches, target_projects['budget'], target_projects['pi'], target_projects['project']):
+            budget = clean_float(raw_budget) / 100000000 # Convert to Eok
+            pi = clean_str(raw_pi)
             
             # If no match found but we need to assign it? 
             # Or just keep it as 'Unmatched'? User said "match relevant platforms".
@@ -236,7 +216,7 @@ try:
                     'pi': pi,
                     'budget': round(budget, 1),
                     'platform': best_match,
-                    'project_name': clean_str(row['project'])
+                    'project_name': clean_str(raw_project)
                 })
         
         # Sort projects by budget desc
@@ -328,9 +308,9 @@ try:
         
     output.append("];")
     
-    with open('lib/mocks.ts', 'w', encoding='utf-8') as f:
-        f.write("\n".join(output))
-    print("Successfully generated lib/mocks.ts")
+    with ModuleWriter(OUTPUT_PATH, header="// Generated by generate_mocks.py (legacy single module); do not edit.\n") as writer:
+        writer.write("\n".join(output))
+    print(f"Successfully generated {OUTPUT_PATH}")
 
 except Exception as e:
     print("Error:", e)
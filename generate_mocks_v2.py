@@ -1,322 +1,277 @@
-import pandas as pd
-import json
+import os
 import numpy as np
-import traceback
+import argparse
+from mock_aggregates import (POSITION_LABELS, SOURCE_PLATFORMS, PLATFORM_MAP, UI_PLATFORM_LABELS, YEAR_BINS,
+                             YEAR_LABELS, build_researcher_frame, researcher_aggregates)
+from embedding_cache import DEFAULT_CACHE_PATH, EmbeddingCache, cache_state
+from embedding_classifier import CacheOnlyEmbedder, EmbeddingClassifier, FakeEmbedder, normalized_matrix
+from keyword_classifier import KeywordClassifier, PLATFORM_KEYWORDS
+from name_matcher import NameIndex
+from near_duplicates import NearDuplicateIndex
+from record_builder import RESEARCHER_TEXT_COLUMNS, researcher_texts
+from researcher_neighbors import neighbor_lists, top_k_neighbors
+from ntis_stream import RecruitmentAnalyzer, iter_ntis_chunks
+from spreadsheet_cache import cached_meta, read_workbook, workbook_columns
+from stats_cube import available_years, cube_columns, refresh_cube, year_slice
+from mock_writer import (MOCKS_DIR, ModuleWriter, file_sha256, fingerprint, load_manifest, save_manifest,
+                         stale_modules, write_index, report_sizes)
 
-def clean_str(x):
-    if pd.isna(x): return ""
-    return str(x).strip()
-
-def clean_float(x):
-    if pd.isna(x): return 0
-    return float(x)
-
-def clean_list(x):
-    if pd.isna(x): return []
-    return [s.strip() for s in str(x).split(',') if s.strip()]
-
-def clean_name(name):
-    if pd.isna(name): return ""
-    return str(name).strip().replace(" ", "")
-
-def generate_mocks():
-    print("Starting mock generation...")
-    
-    # 1. Load Data
-    try:
-        total_df = pd.read_excel('total_df.xlsx')
-        ntis_df = pd.read_excel('ntis_results.xlsx')
-        print("Files loaded successfully.")
-    except Exception as e:
-        print(f"Error loading files: {e}")
-        return
-
-    # 2. Process Researchers (Total DF)
-    researchers = []
-    platforms = ['정밀의료기기', '정밀재생', '면역-마이크로바이옴', '신약', '데이터', '혁신형의사과학자']
-    ui_platform_labels = ['데이터', '의사과학자', '정밀재생', '정밀의료기기', '면역/마이크로', '신약']
-    platform_map = {
-        '정밀의료기기': '정밀의료기기',
-        '정밀재생': '정밀재생',
-        '면역-마이크로바이옴': '면역/마이크로',
-        '신약': '신약',
-        '데이터': '데이터',
-        '혁신형의사과학자': '의사과학자'
+# Static data (companies page)
+COMPANIES_DATA = [
+    {
+        "id": "1",
+        "name": "Lunit (루닛)",
+        "type": "internal",
+        "platform": "data",
+        "desc": "딥러닝 기반의 암 진단 보조 소프트웨어 개발. 구로병원 영상의학과 데이터 활용 이력 보유.",
+        "icon": "fa-cube",
+        "color": "indigo",
+        "tags": ["CXR", "Mammography", "데이터플랫폼"]
+    },
+    {
+        "id": "2",
+        "name": "Genexine (제넥신)",
+        "type": "external",
+        "platform": "drug",
+        "desc": "혁신적인 면역 항암제 및 DNA 백신 기술 보유. 개방형 실험실 입주 기업.",
+        "icon": "fa-dna",
+        "color": "emerald",
+        "tags": ["Immunotherapy", "DNA_Vaccine"]
+    },
+    {
+        "id": "3",
+        "name": "Vuno (뷰노)",
+        "type": "internal",
+        "platform": "data",
+        "desc": "생체신호 기반의 AI 예측 솔루션 개발. 중환자실 모니터링 시스템 공동 연구.",
+        "icon": "fa-cube",
+        "color": "indigo",
+        "tags": ["VitalSign", "AI_Prediction"]
+    },
+    {
+        "id": "4",
+        "name": "Coreline Soft",
+        "type": "external",
+        "platform": "device",
+        "desc": "3D 의료 영상 분석 및 시뮬레이션 소프트웨어. 흉부 CT 분석 기술 협력.",
+        "icon": "fa-cube",
+        "color": "slate",
+        "tags": ["3D_Imaging", "Simulation"]
+    },
+    {
+        "id": "5",
+        "name": "Rokit Healthcare",
+        "type": "external",
+        "platform": "regen",
+        "desc": "4D 바이오 프린팅 기술을 활용한 장기 재생 플랫폼 개발.",
+        "icon": "fa-dna",
+        "color": "emerald",
+        "tags": ["BioPrinting", "Regenerative"]
     }
+]
 
-    # Track platform status for recruitment filtering
-    platform_researcher_names = set()
-    all_researcher_names = set()
-
-    for idx, row in total_df.iterrows():
-        # Basic Info
-        name = clean_str(row.get('name', ''))
-        clean_name_str = clean_name(name)
-        all_researcher_names.add(clean_name_str)
-        
-        # Platforms
-        my_platforms = []
-        for p in platforms:
-            if clean_float(row.get(p, 0)) == 1:
-                my_platforms.append(platform_map[p])
-        
-        if my_platforms:
-            platform_researcher_names.add(clean_name_str)
-
-        # Budget (Won -> Eok)
-        budget = clean_float(row.get('budget_pi_25', 0)) / 100000000
-        
-        # Position Mapping
-        raw_position = clean_str(row.get('title', ''))
-        if not raw_position:
-            position = "정보없음"
-        elif raw_position in ['교수', '부교수', '조교수', '임상조교수']:
-            position = raw_position
-        else:
-            position = "기타"
-
-        researcher = {
-            "id": str(idx + 1),
+def researcher_records(frame):
+    columns = ['id', 'name_ko', 'department', 'position', 'keywords', 'publications', 'budget', 'platforms']
+    for rid, name, dept, position, keywords, publications, budget, platforms in zip(
+            *(frame[c].tolist() for c in columns)):
+        yield {
+            "id": rid,
             "name_ko": name,
             "name_en": "",
-            "department": clean_str(row.get('department', '')),
+            "department": dept,
             "position": position,
             "email": "",
             "phone": "",
-            "image_url": f"https://api.dicebear.com/7.x/avataaars/svg?seed={idx+1}",
-            "keywords": clean_list(row.get('specialty', '')),
-            "major_research": clean_list(row.get('specialty', ''))[0] if clean_list(row.get('specialty', '')) else "",
+            "image_url": f"https://api.dicebear.com/7.x/avataaars/svg?seed={rid}",
+            "keywords": keywords,
+            "major_research": keywords[0] if keywords else "",
             "lab_info": "",
-            "publications": int(clean_float(row.get('paper_2025', 0))),
+            "publications": publications,
             "projects": 0,
             "citations": 0,
-            "budget": round(budget, 1),
-            "est_start_year": clean_float(row.get('EST_STRT_YR', 0)),
-            "platforms": my_platforms
+            "budget": budget,
+            "platforms": platforms
         }
-        researchers.append(researcher)
 
-    # 3. Calculate Platform Budget (Current)
-    # Note: If a researcher is in multiple platforms, their budget counts for EACH.
-    platform_budget_map = {p: 0 for p in ui_platform_labels}
-    platform_breakdown = {p: {pos: 0 for pos in ['교수', '부교수', '조교수', '임상조교수', '기타', '정보없음']} for p in ui_platform_labels}
-    
-    non_participating_budget = 0
+# lib/mocks/ modules, in index.ts order
+MODULES = ['demographics', 'performance', 'platforms', 'recruitment', 'companies', 'researchers', 'neighbors']
+GENERATOR_SOURCES = ['generate_mocks_v2.py', 'mock_aggregates.py', 'stats_cube.py', 'ntis_stream.py',
+                     'keyword_classifier.py', 'embedding_classifier.py', 'name_matcher.py', 'near_duplicates.py',
+                     'researcher_neighbors.py', 'record_builder.py', 'mock_writer.py']
+NEIGHBOR_COUNT = 5
+# Written by migrate_data.py; read only, nothing is embedded here
+EMBEDDING_CACHE_PATH = os.environ.get("EMBEDDING_CACHE_PATH", DEFAULT_CACHE_PATH)
 
-    for r in researchers:
-        if r['platforms']:
-            for p in r['platforms']:
-                platform_budget_map[p] += r['budget']
-                # Breakdown
-                if r['position'] in platform_breakdown[p]:
-                    platform_breakdown[p][r['position']] += 1
-        else:
-            non_participating_budget += r['budget']
+def embedding_state(classifier):
+    # Read-only: fingerprinting must not create the cache database or its directory
+    return cache_state(EMBEDDING_CACHE_PATH) if classifier == 'embedding' else None
 
-    # Prepare lists for export
-    platform_budget_list = [round(platform_budget_map[p], 1) for p in ui_platform_labels]
-    platform_budget_list.append(round(non_participating_budget, 1)) # Add non-participating at end
+def embedder_for(classifier):
+    """Cached (or fake) embeddings, or None when keywords only / there is no cache."""
+    if classifier == 'fake':
+        return FakeEmbedder()
+    if classifier == 'embedding':
+        if os.path.exists(EMBEDDING_CACHE_PATH):
+            return CacheOnlyEmbedder(EmbeddingCache(EMBEDDING_CACHE_PATH))
+        print(f"No embedding cache at {EMBEDDING_CACHE_PATH} (run migrate_data.py first); using keywords")
+    return None
 
-    # Prepare breakdown for export (transpose to {pos: [count per platform]})
-    final_position_labels = ['교수', '부교수', '조교수', '임상조교수', '기타', '정보없음']
-    export_breakdown = {pos: [] for pos in final_position_labels}
-    for pos in final_position_labels:
-        for p in ui_platform_labels:
-            export_breakdown[pos].append(platform_breakdown[p][pos])
+def platform_classifier(classifier):
+    """Centroid classifier over cached (or fake) project embeddings; keywords when there are none."""
+    embedder = embedder_for(classifier)
+    if embedder is None:
+        return KeywordClassifier(PLATFORM_KEYWORDS)
+    ntis = read_workbook('ntis_results.xlsx', ['title', 'project'])
+    return EmbeddingClassifier(embedder).fit(ntis['title'].tolist(), ntis['project'].tolist())
 
-    # 4. Calculate Recruitment Data (NTIS)
-    # Target: Researchers who are NOT in platform_researcher_names
-    target_names = all_researcher_names - platform_researcher_names
-    
-    ntis_df['pi_clean'] = ntis_df['pi'].apply(clean_name)
-    
-    # Ensure year is numeric
-    ntis_df['year'] = pd.to_numeric(ntis_df['year'], errors='coerce')
-    print("Years found in NTIS:", ntis_df['year'].unique())
-    
-    # Filter NTIS
-    target_projects = ntis_df[
-        (ntis_df['year'] == 2025) & 
-        (ntis_df['pi_clean'].isin(target_names))
-    ].copy()
-    
-    # Remove duplicates (title, project, year, pi)
-    initial_count = len(target_projects)
-    target_projects.drop_duplicates(subset=['title', 'project', 'year', 'pi'], inplace=True)
-    dedup_count = len(target_projects)
-    print(f"Found {dedup_count} projects for 2025 matching target researchers (removed {initial_count - dedup_count} duplicates).")
-    
-    # Platform Keywords
-    platform_keywords = {
-        '데이터': ['데이터', 'AI', '인공지능', '빅데이터', '클라우드', '머신러닝', '딥러닝', '스마트'],
-        '의사과학자': ['의사과학자', '혁신형', '양성'],
-        '정밀재생': ['재생', '줄기세포', '오가노이드', '조직공학', '바이오프린팅'],
-        '정밀의료기기': ['의료기기', '디바이스', '로봇', '센서', '영상', '진단기기', '웨어러블'],
-        '면역/마이크로': ['면역', '마이크로바이옴', '백신', '감염', '바이러스', '항체'],
-        '신약': ['신약', '약물', '치료제', '항암제', '표적', '후보물질']
-    }
-    
-    matched_projects = []
-    recruitment_potential_map = {p: 0 for p in ui_platform_labels}
-    
-    for _, row in target_projects.iterrows():
-        title = clean_str(row['title'])
-        budget = clean_float(row['budget']) / 100000000
-        pi = clean_str(row['pi'])
-        
-        best_match = None
-        max_matches = 0
-        
-        for p_name, keywords in platform_keywords.items():
-            matches = sum(1 for k in keywords if k in title)
-            if matches > max_matches:
-                max_matches = matches
-                best_match = p_name
-        
-        if best_match:
-            recruitment_potential_map[best_match] += budget
-            matched_projects.append({
-                'title': title,
-                'pi': pi,
-                'budget': round(budget, 1),
-                'platform': best_match,
-                'project_name': clean_str(row['project'])
-            })
-            
-    matched_projects.sort(key=lambda x: x['budget'], reverse=True)
-    
-    recruitment_data = {
-        'totalPotential': round(sum(p['budget'] for p in matched_projects), 1),
-        'platformPotential': {k: round(v, 1) for k, v in recruitment_potential_map.items()},
-        'topProjects': matched_projects[:20]
-    }
+def researcher_neighbors(total_df, frame, classifier, k=NEIGHBOR_COUNT):
+    """{researcher id: [{id, similarity}]} from the researchers' cached (or fake) embeddings."""
+    embedder = embedder_for(classifier)
+    if embedder is None:
+        print("Neighbours: skipped (needs --classifier embedding or fake)")
+        return {}
+    matrix, present = normalized_matrix(embedder.embed(researcher_texts(total_df)))
+    indices, scores = top_k_neighbors(matrix, k, present)
+    lists = neighbor_lists(frame['id'].tolist(), indices, scores)
+    print(f"Neighbours: top-{k} for {len(lists)} of {len(frame)} researchers")
+    return {rid: [{'id': other, 'similarity': similarity} for other, similarity in neighbors]
+            for rid, neighbors in lists.items()}
 
-    # 5. Demographics & Other Stats (Simplified for brevity, copying logic)
-    # Position Counts
-    titles = [r['position'] for r in researchers]
-    title_counts = pd.Series(titles).value_counts()
-    final_position_counts = [int(title_counts.get(t, 0)) for t in final_position_labels]
-    
-    # Dept Top 10
-    depts = [r['department'] for r in researchers if r['department']]
-    dept_counts = pd.Series(depts).value_counts().head(10)
-    dept_labels = dept_counts.index.tolist()
-    dept_values = dept_counts.values.tolist()
-    
-    dept_breakdown = {pos: [] for pos in final_position_labels}
-    for dept in dept_labels:
-        dept_researchers = [r for r in researchers if r['department'] == dept]
-        for pos in final_position_labels:
-            count = sum(1 for r in dept_researchers if r['position'] == pos)
-            dept_breakdown[pos].append(count)
-            
-    # Year Distribution
-    year_bins = [0, 1980, 1985, 1990, 1995, 2000, 2005, 2010, 2015, 9999]
-    year_labels = ['1980이전', '1980-84', '1985-89', '1990-94', '1995-99', '2000-04', '2005-09', '2010-14', '2015이후']
-    years = [r['est_start_year'] for r in researchers if r['est_start_year'] > 1900]
-    year_hist, _ = np.histogram(years, bins=year_bins)
-    year_values = year_hist.tolist()
+def module_fingerprints(year, classifier='keyword'):
+    """Per-module hash of everything the module is computed from."""
+    total_hash = cached_meta('total_df.xlsx')[1]['sha256']
+    ntis_hash = cached_meta('ntis_results.xlsx')[1]['sha256']
+    code = [file_sha256(path) for path in GENERATOR_SOURCES]
+    config = [POSITION_LABELS, SOURCE_PLATFORMS, PLATFORM_MAP, UI_PLATFORM_LABELS, YEAR_BINS, YEAR_LABELS]
+    researchers = fingerprint(code, config, total_hash, year)
+    embeddings = embedding_state(classifier)
+    fingerprints = {m: researchers for m in MODULES}
+    fingerprints['recruitment'] = fingerprint(code, config, PLATFORM_KEYWORDS, total_hash, ntis_hash, year,
+                                              classifier, embeddings)
+    fingerprints['companies'] = fingerprint(code, COMPANIES_DATA)
+    fingerprints['neighbors'] = fingerprint(code, total_hash, classifier, embeddings)
+    return fingerprints
+
+def generate_mocks(year=None, incremental=False, classifier='keyword'):
+    print("Starting mock generation...")
     
-    # Performance
-    perf_df = pd.DataFrame(researchers)
-    perf_agg = perf_df.groupby('department')[['budget', 'publications']].sum().reset_index()
-    perf_agg = perf_agg.sort_values('budget', ascending=False).head(7)
-    performance_data = []
-    for _, row in perf_agg.iterrows():
-        performance_data.append({
-            'name': row['department'],
-            'budget': round(row['budget'], 1),
-            'papers': int(row['publications'])
-        })
+    # 1. Load Data
+    try:
+        years = available_years(workbook_columns('total_df.xlsx'))
+        year = year or years[-1]
+        if year not in years:
+            print(f"No budget/paper columns for {year} in total_df.xlsx")
+            return
+        fingerprints = module_fingerprints(year, classifier)
+        manifest = load_manifest()
+        stale = stale_modules(manifest, fingerprints) if incremental else list(fingerprints)
+        if not stale:
+            print(f"{MOCKS_DIR}/ is up to date (year {year}); nothing to do.")
+            return
+        if incremental:
+            print(f"Rebuilding {stale}")
+        if set(stale) - {'companies'}:
+            total_df = read_workbook('total_df.xlsx', cube_columns(years) + RESEARCHER_TEXT_COLUMNS)
+        if 'recruitment' in stale:
+            ntis_chunks = iter_ntis_chunks('ntis_results.xlsx')
+        print(f"Files loaded successfully (year {year}, available {years}).")
+    except Exception as e:
+        print(f"Error loading files: {e}")
+        return
+
+    datasets = {}
+    if set(stale) - {'companies'}:
+        # 2. Process Researchers (Total DF) in one columnar pass
+        ui_platform_labels = UI_PLATFORM_LABELS
+        final_position_labels = POSITION_LABELS
+        frame, membership = build_researcher_frame(total_df, year)
+        researcher_stats = researcher_aggregates(frame)
+
+    if set(stale) & {'demographics', 'performance', 'platforms'}:
+        # 3. Aggregates (platform budget/breakdown, demographics, performance, averages) are
+        # slices of the multi-year stats cube; only years whose columns changed are recomputed
+        cube, changed, _ = refresh_cube(total_df, years=years)
+        if changed:
+            print(f"Stats cube recomputed for {changed}")
+        aggregates = year_slice(cube, year)
+        datasets['demographics'] = {'demographicsData': {
+            'positionLabels': final_position_labels,
+            'positionCounts': aggregates['position_counts'],
+            'deptTop10Labels': aggregates['dept_labels'],
+            'deptTop10Values': aggregates['dept_values'],
+            'deptTop10Breakdown': aggregates['dept_breakdown'],
+            'yearLabels': YEAR_LABELS,
+            'yearValues': researcher_stats['year_values']
+        }}
+        datasets['performance'] = {
+            'performanceData': aggregates['performance'],
+            'avgStatsData': {'labels': final_position_labels, 'avgPapers': aggregates['avg_papers'],
+                             'avgBudget': aggregates['avg_budget']}
+        }
+        datasets['platforms'] = {'platformData': {
+            'participation': aggregates['participation'],
+            'labels': ui_platform_labels,
+            'budget': aggregates['platform_budget'],
+            'breakdown': aggregates['platform_breakdown'],
+            'simulation': {'current': [], 'increase': []}  # Deprecated
+        }}
+
+    if 'recruitment' in stale:
+        # 4. Calculate Recruitment Data (NTIS)
+        # Target: Researchers who are not on any platform. PIs are resolved through the name
+        # index, so a homonym of a platform researcher is reported instead of silently merged
+        matcher = NameIndex(zip(frame['name_ko'], frame['department']))
+        targets = set(np.flatnonzero(~membership.any(axis=1)).tolist())
         
-    # Avg Stats
-    avg_papers = []
-    avg_budget = []
-    for pos in final_position_labels:
-        pos_researchers = [r for r in researchers if r['position'] == pos]
-        count = len(pos_researchers)
-        if count > 0:
-            avg_papers.append(round(sum(r['publications'] for r in pos_researchers)/count, 1))
-            avg_budget.append(round(sum(r['budget'] for r in pos_researchers)/count, 2))
-        else:
-            avg_papers.append(0)
-            avg_budget.append(0)
+        # Streamed in row chunks: filter, dedupe (title, project, year, pi) and near-duplicate
+        # titles, keyword-match and keep only the top projects, so memory does not grow with the export
+        near_duplicates = NearDuplicateIndex()
+        platforms = platform_classifier(classifier)
+        analyzer = RecruitmentAnalyzer(targets, ui_platform_labels, year=year, classifier=platforms,
+                                       matcher=matcher, near_duplicates=near_duplicates)
+        for chunk in ntis_chunks:
+            analyzer.add_chunk(chunk)
+        matcher.write_report()
+        near_duplicates.write_report()
+        if isinstance(platforms, EmbeddingClassifier):
+            print(f"Platform assignment: {platforms.summary()}")
+        print("Years found in NTIS:", list(analyzer.years))
+        print(f"Found {analyzer.found} projects for {year} matching target researchers "
+              f"(removed {analyzer.duplicates} duplicates, {near_duplicates.duplicates} near-duplicates).")
+        datasets['recruitment'] = {'recruitmentData': analyzer.result()}
 
-    # 6. Generate Output
-    output = []
-    output.append("export const demographicsData = {")
-    output.append(f"    positionLabels: {json.dumps(final_position_labels, ensure_ascii=False)},")
-    output.append(f"    positionCounts: {final_position_counts},")
-    output.append(f"    deptTop10Labels: {json.dumps(dept_labels, ensure_ascii=False)},")
-    output.append(f"    deptTop10Values: {dept_values},")
-    output.append(f"    deptTop10Breakdown: {json.dumps(dept_breakdown, ensure_ascii=False)},")
-    output.append(f"    yearLabels: {json.dumps(year_labels, ensure_ascii=False)},")
-    output.append(f"    yearValues: {year_values}")
-    output.append("};")
-    output.append("")
-    output.append("export const performanceData = [")
-    for p in performance_data:
-        output.append(f"    {{ name: '{p['name']}', budget: {p['budget']}, papers: {p['papers']} }},")
-    output.append("];")
-    output.append("")
-    output.append("export const avgStatsData = {")
-    output.append(f"    labels: {json.dumps(final_position_labels, ensure_ascii=False)},")
-    output.append(f"    avgPapers: {avg_papers},")
-    output.append(f"    avgBudget: {avg_budget}")
-    output.append("};")
-    output.append("")
-    # Calculate Participation Counts
-    participating_count = sum(1 for r in researchers if r['platforms'])
-    non_participating_count = len(researchers) - participating_count
-    participation = [non_participating_count, participating_count]
+    if 'companies' in stale:
+        datasets['companies'] = {'companiesData': COMPANIES_DATA}
 
-    output.append("export const platformData = {")
-    output.append(f"    participation: {participation},")
-    output.append(f"    labels: {json.dumps(ui_platform_labels, ensure_ascii=False)},")
-    output.append(f"    budget: {platform_budget_list},")
-    output.append(f"    breakdown: {json.dumps(export_breakdown, ensure_ascii=False)},")
-    output.append("    simulation: { current: [], increase: [] }") # Deprecated
-    output.append("};")
-    output.append("")
-    output.append("export const recruitmentData = {")
-    output.append(f"    totalPotential: {recruitment_data['totalPotential']},")
-    output.append(f"    platformPotential: {json.dumps(recruitment_data['platformPotential'], ensure_ascii=False)},")
-    output.append(f"    topProjects: {json.dumps(recruitment_data['topProjects'], ensure_ascii=False)}")
-    output.append("};")
-    output.append("")
-    # Static data
-    output.append("export const companiesData = [")
-    output.append('    { id: 1, name: "Lunit (루닛)", type: "internal", platform: "data", desc: "딥러닝 암 진단", icon: "fa-cube", color: "indigo" },')
-    output.append('    { id: 2, name: "Genexine", type: "internal", platform: "drug", desc: "면역 항암제", icon: "fa-dna", color: "emerald" },')
-    output.append('    { id: 3, name: "DeepBio", type: "external", platform: "data", desc: "전립선암 진단 AI", icon: "fa-globe", color: "slate" }')
-    output.append("];")
-    output.append("")
-    output.append("export const researchers = [")
-    for r in researchers:
-        r_out = {k: v for k, v in r.items() if k not in ['est_start_year']} # Keep budget and platforms
-        output.append("    {")
-        output.append(f"        id: \"{r_out['id']}\",")
-        output.append(f"        name_ko: \"{r_out['name_ko']}\",")
-        output.append(f"        name_en: \"{r_out['name_en']}\",")
-        output.append(f"        department: \"{r_out['department']}\",")
-        output.append(f"        position: \"{r_out['position']}\",")
-        output.append(f"        email: \"{r_out['email']}\",")
-        output.append(f"        phone: \"{r_out['phone']}\",")
-        output.append(f"        image_url: \"{r_out['image_url']}\",")
-        output.append(f"        keywords: {json.dumps(r_out['keywords'], ensure_ascii=False)},")
-        output.append(f"        major_research: \"{r_out['major_research']}\",")
-        output.append(f"        lab_info: \"{r_out['lab_info']}\",")
-        output.append(f"        publications: {r_out['publications']},")
-        output.append(f"        projects: {r_out['projects']},")
-        output.append(f"        citations: {r_out['citations']},")
-        output.append(f"        budget: {r_out['budget']},")
-        output.append(f"        platforms: {json.dumps(r_out['platforms'], ensure_ascii=False)}")
-        output.append("    },")
-    output.append("];")
-    
-    with open('lib/mocks.ts', 'w', encoding='utf-8') as f:
-        f.write("\n".join(output))
-    print("Successfully generated lib/mocks.ts")
+    if 'neighbors' in stale:
+        # 5. Similar researchers for the matching page, precomputed so it is a key lookup
+        datasets['neighbors'] = {'researcherNeighbors': researcher_neighbors(total_df, frame, classifier)}
+
+    # 6. Generate Output: one minified module per dataset so pages load only what they render
+    writers = []
+    for module in stale:
+        with ModuleWriter(f"{MOCKS_DIR}/{module}.ts") as writer:
+            if module == 'researchers':
+                # Serialized record by record
+                writer.export_array('researchers', researcher_records(frame))
+            else:
+                for name, value in datasets[module].items():
+                    writer.export(name, value)
+        writers.append(writer)
+        manifest[module] = {'inputs': fingerprints[module], 'output': writer.sha256}
+    writers.append(write_index(MOCKS_DIR, MODULES))
+    save_manifest(manifest)
+    report_sizes(writers)
+    print(f"Successfully generated {MOCKS_DIR}/")
 
 if __name__ == "__main__":
-    generate_mocks()
+    parser = argparse.ArgumentParser(description="Generate the lib/mocks/ modules from total_df.xlsx and ntis_results.xlsx.")
+    parser.add_argument('--year', type=int, help="Snapshot year (default: latest year in total_df.xlsx)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only rebuild modules whose workbooks or generator config changed")
+    parser.add_argument('--classifier', choices=['keyword', 'embedding', 'fake'], default='keyword',
+                        help="NTIS platform assignment and researcher neighbours: keywords only (the default; "
+                             "deterministic, no neighbours), embeddings cached by migrate_data.py (keywords as "
+                             "fallback), or the offline fake embedder")
+    args = parser.parse_args()
+    generate_mocks(args.year, args.incremental, args.classifier)
@@ -0,0 +1,131 @@
+import argparse
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+# Platform Keywords for NTIS recruitment matching, in tie-break order
+PLATFORM_KEYWORDS = {
+    '데이터': ['데이터', 'AI', '인공지능', '빅데이터', '클라우드', '머신러닝', '딥러닝', '스마트'],
+    '의사과학자': ['의사과학자', '혁신형', '양성'],
+    '정밀재생': ['재생', '줄기세포', '오가노이드', '조직공학', '바이오프린팅'],
+    '정밀의료기기': ['의료기기', '디바이스', '로봇', '센서', '영상', '진단기기', '웨어러블'],
+    '면역/마이크로': ['면역', '마이크로바이옴', '백신', '감염', '바이러스', '항체'],
+    '신약': ['신약', '약물', '치료제', '항암제', '표적', '후보물질']
+}
+
+
+SEPARATOR = '\x00'
+
+
+def overlaps(a, b):
+    """True if a suffix of `a` is a proper prefix of `b` (b starts inside a and runs past it)."""
+    return any(b.startswith(a[i:]) and len(a) - i < len(b) for i in range(1, len(a)))
+
+
+class KeywordClassifier:
+    """Scores titles against every platform's keyword list with one compiled regex over all titles.
+
+    A platform's score is the number of its keywords that occur in the title (each keyword
+    counts once), the same as `sum(1 for k in keywords if k in title)`. The best platform is
+    the first one with the highest non-zero score.
+    """
+
+    def __init__(self, platform_keywords=PLATFORM_KEYWORDS):
+        self.platforms = list(platform_keywords)
+        keywords = sorted({k for words in platform_keywords.values() for k in words}, key=lambda k: (-len(k), k))
+        self.keywords = keywords
+        # Per keyword: how many times each platform lists it
+        self.weights = np.zeros((len(keywords), len(self.platforms)), dtype=np.int64)
+        index = {k: i for i, k in enumerate(keywords)}
+        for j, words in enumerate(platform_keywords.values()):
+            for k in words:
+                self.weights[index[k], j] += 1
+        self.index = index
+        # contains[i, j]: keyword j occurs inside keyword i, so a match of i also credits j
+        self.contains = np.array([[s in k for s in keywords] for k in keywords], dtype=np.float32)
+        # One consuming, longest-first alternation over all titles joined by SEPARATOR. Keeping
+        # the separator inside the group lets re prefilter on first characters.
+        self.pattern = re.compile('(' + '|'.join(re.escape(k) for k in [SEPARATOR] + keywords) + ')')
+        # A keyword that can start inside another and run past its end may be consumed by
+        # that match; those few get their own single-keyword pass
+        self.hideable = [k for k in keywords if any(overlaps(a, k) for a in keywords)]
+        self.hideable_patterns = [(index[k], re.compile('(' + re.escape(SEPARATOR) + '|' + re.escape(k) + ')'))
+                                  for k in self.hideable]
+
+    def _matches(self, pattern, buffer):
+        """(title index, keyword index) for every keyword the pattern reports."""
+        codes, tokens = pd.factorize(np.array(pattern.findall(buffer), dtype=object))
+        ids = np.array([self.index.get(t, -1) for t in tokens], dtype=np.int64)[codes]
+        is_separator = ids < 0
+        title_idx = np.cumsum(is_separator)[~is_separator]
+        return title_idx, ids[~is_separator]
+
+    def score(self, titles):
+        """(len(titles), len(platforms)) keyword counts from one regex scan over all titles."""
+        texts = [t.replace(SEPARATOR, ' ') if isinstance(t, str) else '' for t in titles]
+        buffer = SEPARATOR.join(texts)
+        matched = np.zeros((len(texts), len(self.keywords)), dtype=np.float32)
+        rows, found = self._matches(self.pattern, buffer)
+        matched[rows, found] = 1
+        present = (matched @ self.contains) > 0
+        for k, pattern in self.hideable_patterns:
+            rows, _ = self._matches(pattern, buffer)
+            present[rows, k] = True
+        # Every keyword counts once per title
+        return present.astype(np.int64) @ self.weights
+
+    def classify(self, titles, projects=None):
+        """Best platform per title, or None where no keyword matched (`projects` is not used)."""
+        scores = self.score(titles)
+        best = scores.argmax(axis=1)
+        matched = scores.max(axis=1, initial=0) > 0
+        return [self.platforms[b] if m else None for b, m in zip(best.tolist(), matched.tolist())]
+
+
+def classify_naive(title, platform_keywords=PLATFORM_KEYWORDS):
+    best_match = None
+    max_matches = 0
+    for p_name, keywords in platform_keywords.items():
+        matches = sum(1 for k in keywords if k in title)
+        if matches > max_matches:
+            max_matches = matches
+            best_match = p_name
+    return best_match
+
+
+def synthetic_titles(n, seed=0):
+    rng = random.Random(seed)
+    words = [k for words in PLATFORM_KEYWORDS.values() for k in words]
+    filler = ['기반', '개발', '연구', '임상', '환자', '모델', '플랫폼', '고도화', '융합', '차세대', '분석', '치료']
+    titles = []
+    for _ in range(n):
+        parts = rng.sample(filler, rng.randint(2, 5)) + rng.sample(words, rng.randint(0, 3))
+        rng.shuffle(parts)
+        titles.append(' '.join(parts) + f" {rng.randint(1, 20000)}차")
+    return titles
+
+
+def benchmark(n, check=20000):
+    titles = synthetic_titles(n)
+    classifier = KeywordClassifier()
+    started = time.perf_counter()
+    result = classifier.classify(titles)
+    elapsed = time.perf_counter() - started
+    sample = titles[:check]
+    started = time.perf_counter()
+    expected = [classify_naive(t) for t in sample]
+    naive = (time.perf_counter() - started) * n / len(sample)
+    assert result[:check] == expected, "compiled classifier disagrees with the keyword scan"
+    print(f"{n} titles: compiled {elapsed:.2f}s, keyword scan ~{naive:.2f}s (extrapolated), "
+          f"{sum(r is not None for r in result)} matched")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the compiled platform keyword classifier.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[100000, 1000000])
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n)
@@ -0,0 +1,2 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const companiesData = [{"id":"1","name":"Lunit (루닛)","type":"internal","platform":"data","desc":"딥러닝 기반의 암 진단 보조 소프트웨어 개발. 구로병원 영상의학과 데이터 활용 이력 보유.","icon":"fa-cube","color":"indigo","tags":["CXR","Mammography","데이터플랫폼"]},{"id":"2","name":"Genexine (제넥신)","type":"external","platform":"drug","desc":"혁신적인 면역 항암제 및 DNA 백신 기술 보유. 개방형 실험실 입주 기업.","icon":"fa-dna","color":"emerald","tags":["Immunotherapy","DNA_Vaccine"]},{"id":"3","name":"Vuno (뷰노)","type":"internal","platform":"data","desc":"생체신호 기반의 AI 예측 솔루션 개발. 중환자실 모니터링 시스템 공동 연구.","icon":"fa-cube","color":"indigo","tags":["VitalSign","AI_Prediction"]},{"id":"4","name":"Coreline Soft","type":"external","platform":"device","desc":"3D 의료 영상 분석 및 시뮬레이션 소프트웨어. 흉부 CT 분석 기술 협력.","icon":"fa-cube","color":"slate","tags":["3D_Imaging","Simulation"]},{"id":"5","name":"Rokit Healthcare","type":"external","platform":"regen","desc":"4D 바이오 프린팅 기술을 활용한 장기 재생 플랫폼 개발.","icon":"fa-dna","color":"emerald","tags":["BioPrinting","Regenerative"]}];
@@ -0,0 +1,2 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const demographicsData = {"positionLabels":["교수","부교수","조교수","임상조교수","기타","정보없음"],"positionCounts":[113,41,29,34,61,51],"deptTop10Labels":["영상의학과","심혈관센터(순환기)","마취통증의학과","소아청소년과","정형외과","신경외과","신경과","응급의학과","신장내과","종양내과"],"deptTop10Values":[30,20,19,18,13,13,12,12,9,9],"deptTop10Breakdown":{"교수":[9,8,4,2,8,5,4,4,2,3],"부교수":[2,5,3,4,1,2,2,2,1,0],"조교수":[6,0,0,0,0,1,0,0,1,2],"임상조교수":[0,4,1,4,2,2,1,0,1,1],"기타":[5,1,2,3,1,1,5,1,3,2],"정보없음":[8,2,9,5,1,2,0,5,1,1]},"yearLabels":["1980이전","1980-84","1985-89","1990-94","1995-99","2000-04","2005-09","2010-14","2015이후"],"yearValues":[13,21,30,29,31,52,49,45,12]};
@@ -0,0 +1,8 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export * from "./demographics";
+export * from "./performance";
+export * from "./platforms";
+export * from "./recruitment";
+export * from "./companies";
+export * from "./researchers";
+export * from "./neighbors";
@@ -0,0 +1,2 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const researcherNeighbors = {};
@@ -0,0 +1,3 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const performanceData = [{"name":"이비인후·두경부외과","budget":26.4,"papers":1},{"name":"간센터(내과)","budget":18.8,"papers":6},{"name":"심혈관센터(순환기)","budget":16.3,"papers":88},{"name":"응급의학과","budget":9.6,"papers":4},{"name":"산부인과","budget":9.6,"papers":21},{"name":"정형외과","budget":8.7,"papers":20},{"name":"종양내과","budget":6.8,"papers":11}];
+export const avgStatsData = {"labels":["교수","부교수","조교수","임상조교수","기타","정보없음"],"avgPapers":[2.4,3.4,1.9,2.4,0.8,0.0],"avgBudget":[0.88,0.6,0.03,0.05,0.0,0.06]};
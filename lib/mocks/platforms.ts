@@ -0,0 +1,2 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const platformData = {"participation":[234,95],"labels":["데이터","의사과학자","정밀재생","정밀의료기기","면역/마이크로","신약"],"budget":[26.8,3.2,32.5,18.0,16.8,30.0,48.2],"breakdown":{"교수":[12,2,10,8,7,9],"부교수":[10,5,8,8,5,4],"조교수":[8,9,4,2,3,7],"임상조교수":[7,8,1,0,5,0],"기타":[7,6,4,1,2,1],"정보없음":[0,3,0,1,0,0]},"simulation":{"current":[],"increase":[]}};
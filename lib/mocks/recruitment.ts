@@ -0,0 +1,2 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const recruitmentData = {"totalPotential":33.7,"platformPotential":{"데이터":24.6,"의사과학자":0,"정밀재생":0.6,"정밀의료기기":2.8,"면역/마이크로":5.7,"신약":0},"topProjects":[{"title":"심혈관 고위험 병변의 딥러닝 기반 다차원 정밀 진단 및 면역조절 흡수형 중재 기술 통합 개발","pi":"김진원","budget":10.0,"platform":"데이터","project_name":"글로벌연구협력지원사업"},{"title":"청각 이상 증상 개선을 위한 인공지능 개인 맞춤형 융복합 디지털 의료기기 개발 및 상용화","pi":"송재준","budget":8.4,"platform":"데이터","project_name":"바이오산업기술개발(R&D)"},{"title":"신종 감염병 초고속 정밀진단기술 개발 및 사업화","pi":"임채승","budget":5.0,"platform":"면역/마이크로","project_name":"연구중심병원육성(R&D)"},{"title":"인공지능기반 웨어러블 패치를 이용한 심폐소생술 파형 아형 분석 및 품질 피드백을 위한 통합 임상의사결정지원시스템 개발","pi":"김수진","budget":2.9,"platform":"데이터","project_name":"개인기초연구(과기정통부)(R&D)"},{"title":"면역학적 기전 매개 대뇌의 심혈관 동맥경화반 파열 연관성 생체내 세포 추적 영상 및 제어 기술 개발","pi":"김진원","budget":2.8,"platform":"정밀의료기기","project_name":"개인기초연구(과기정통부)(R&D)"},{"title":"청소년기 특발성 척추측만증에서 만곡의 진행을 예측하는 인공지능 모델의 개발","pi":"서승우","budget":2.4,"platform":"데이터","project_name":"개인기초연구(과기정통부)(R&D)"},{"title":"병원중심 RnBD 위한 의료 인공지능 기반 협력 네트워크 구축","pi":"용환석","budget":0.9,"platform":"데이터","project_name":"연구중심병원육성(R&D)"},{"title":"헤지호그 신호전달의 위암 종양미세환경 조절 및 면역항암제 효능 증진 기작 연구","pi":"김보람","budget":0.7,"platform":"면역/마이크로","project_name":"이공학학술연구기반구축(R&D)"},{"title":"월경혈 줄기세포 기반 착상장애 치료모델 구축 연구","pi":"김용진","budget":0.6,"platform":"정밀재생","project_name":"개인기초연구(과기정통부)(R&D)"}]};
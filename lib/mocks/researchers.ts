@@ -0,0 +1,2 @@
+// Generated by generate_mocks_v2.py; do not edit.
+export const researchers = [{"id":"1","name_ko":"강동오","name_en":"","department":"심혈관센터(순환기)","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=1","keywords":["심근경색","협심증","심혈관중재시술","허혈성심질환","관상동맥질환"],"major_research":"심근경색","lab_info":"","publications":16,"projects":0,"citations":0,"budget":0.9,"platforms":["정밀재생"]},{"id":"2","name_ko":"강민우","name_en":"","department":"신장내과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=2","keywords":["만성콩팥병","급성 신손상","사구체신염","유전성 신질환","투석"],"major_research":"만성콩팥병","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"3","name_ko":"강상희","name_en":"","department":"대장항문외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=3","keywords":["대장항문질환","탈장","대장암","직장암","항문암"],"major_research":"대장항문질환","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","신약","데이터"]},{"id":"4","name_ko":"강석","name_en":"","department":"재활의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=4","keywords":["척수손상재활","척추질환","근골격계 통증","스포츠재활","보행","족부클리닉","절단/보조기","전기진단"],"major_research":"척수손상재활","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"5","name_ko":"강성현","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=5","keywords":["정형외과 외상"],"major_research":"정형외과 외상","lab_info":"","publications":4,"projects":0,"citations":0,"budget":1.5,"platforms":[]},{"id":"6","name_ko":"강성훈","name_en":"","department":"신경과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=6","keywords":["기억력저하","경도인지장애","알츠하이머병","인지기능저하","치매 예방","언어기능장애"],"major_research":"기억력저하","lab_info":"","publications":18,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터","의사과학자"]},{"id":"7","name_ko":"강우영","name_en":"","department":"영상의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=7","keywords":["근골격 영상의학","척추 영상의학"],"major_research":"근골격 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"8","name_ko":"강은영","name_en":"","department":"영상의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=8","keywords":["흉부"],"major_research":"흉부","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"9","name_ko":"강은주","name_en":"","department":"종양내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=9","keywords":["폐암","두경부암","흉선종","육종","흑색종","피부암","원발불명암"],"major_research":"폐암","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","데이터"]},{"id":"10","name_ko":"강형주","name_en":"","department":"안과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=10","keywords":["녹내장","백내장"],"major_research":"녹내장","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"11","name_ko":"고강지","name_en":"","department":"신장내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=11","keywords":["만성신부전","급성신부전","복막투석","혈관투석접속로클리닉","희귀질환클리닉","당뇨병성 신증","다낭신"],"major_research":"만성신부전","lab_info":"","publications":8,"projects":0,"citations":0,"budget":1.4,"platforms":["정밀의료기기","데이터"]},{"id":"12","name_ko":"고성범","name_en":"","department":"신경과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=12","keywords":["파킨슨","떨림","이상운동질환"],"major_research":"파킨슨","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["신약"]},{"id":"13","name_ko":"고지울","name_en":"","department":"응급중환자외상외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=13","keywords":["중환자의학","응급외과수술","중증외상"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"14","name_ko":"공명훈","name_en":"","department":"마취통증의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=14","keywords":["중환자관리"],"major_research":"중환자관리","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"15","name_ko":"곽서연","name_en":"","department":"심혈관센터(순환기)","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=15","keywords":["심장질환","심장판막질환","심부전","고지혈증","심장초음파","심근병증"],"major_research":"심장질환","lab_info":"","publications":9,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"16","name_ko":"구병모","name_en":"","department":"심장혈관흉부외과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=16","keywords":["기흉","다한증","하지정맥류","심부정맥혈전증","오목가슴","새가슴"],"major_research":"기흉","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"17","name_ko":"구은혜","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=17","keywords":["뇌신경마취","일반마취"],"major_research":"뇌신경마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"18","name_ko":"구지연","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=18","keywords":["일반마취","부위마취"],"major_research":"일반마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"19","name_ko":"권영주","name_en":"","department":"신장내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=19","keywords":["신장이식","미네랄","구루병","파브리병","다낭포신"],"major_research":"신장이식","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","데이터"]},{"id":"20","name_ko":"권영준","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=20","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"21","name_ko":"권우근","name_en":"","department":"신경외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=21","keywords":["최소침습척추수술(척추내시경)","경추질환","요추질환","척추외상","척추종양"],"major_research":"최소침습척추수술(척추내시경)","lab_info":"","publications":8,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","정밀재생"]},{"id":"22","name_ko":"권정아","name_en":"","department":"진단검사의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=22","keywords":["세포유전","진단혈액학"],"major_research":"세포유전","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"23","name_ko":"권태원","name_en":"","department":"이식혈관외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=23","keywords":["동맥류","경동맥","말초혈관질환"],"major_research":"동맥류","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"24","name_ko":"권택현","name_en":"","department":"신경외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=24","keywords":["뇌종양","뇌혈관 질환"],"major_research":"뇌종양","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"25","name_ko":"김경아","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=25","keywords":["복부 비뇨기계 영상의학"],"major_research":"복부 비뇨기계 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"26","name_ko":"김고은","name_en":"","department":"피부과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=26","keywords":["여드름","주사","화농성 한선염","두드러기","흉터","감염피부질환 (대상포진","진균)","레이저"],"major_research":"여드름","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"27","name_ko":"김남렬","name_en":"","department":"중환자의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=27","keywords":["중환자의학","중증외상","응급수술"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"28","name_ko":"김대식","name_en":"","department":"혈액내과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=28","keywords":["림프종","다발골수종","혈액질환","조혈모세포이식"],"major_research":"림프종","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생"]},{"id":"29","name_ko":"김동현","name_en":"","department":"소아청소년과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=29","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"30","name_ko":"김명준","name_en":"","department":"응급중환자외상외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=30","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"31","name_ko":"김백희","name_en":"","department":"병리과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=31","keywords":["세포병리","소화기 병리","간담도병리","분자병리"],"major_research":"세포병리","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"32","name_ko":"김보람","name_en":"","department":"진단검사의학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=32","keywords":["유세포","분자유전"],"major_research":"유세포","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.7,"platforms":[]},{"id":"33","name_ko":"김상민","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=33","keywords":["고관절(엉덩이관절)질환","인공고관절","골절","골다공증","관절경","스포츠외상"],"major_research":"고관절(엉덩이관절)질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":2.4,"platforms":["정밀재생"]},{"id":"34","name_ko":"김상혁","name_en":"","department":"호흡기·알레르기내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=34","keywords":["천식","만성기침","만성폐쇄성폐질환","기도질환","간질성폐질환"],"major_research":"천식","lab_info":"","publications":18,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"35","name_ko":"김선미","name_en":"","department":"가정의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=35","keywords":["가정의학","비만클리닉","노인병","건강증진","여행자클리닉"],"major_research":"가정의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"36","name_ko":"김세희","name_en":"","department":"병리과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=36","keywords":["심폐병리"],"major_research":"심폐병리","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"37","name_ko":"김소희","name_en":"","department":"소아청소년과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=37","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"38","name_ko":"김수연","name_en":"","department":"영상의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=38","keywords":["유방 영상의학"],"major_research":"유방 영상의학","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"39","name_ko":"김수진","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=39","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":2.9,"platforms":[]},{"id":"40","name_ko":"김승한","name_en":"","department":"소화기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=40","keywords":["위","장관질환"],"major_research":"위","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","면역/마이크로","신약","데이터","의사과학자"]},{"id":"41","name_ko":"김안나","name_en":"","department":"피부과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=41","keywords":["건선","백반증","피부종양","피부암","흉터","피부미용 및 레이저","일반 피부질환"],"major_research":"건선","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"42","name_ko":"김애리","name_en":"","department":"병리과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=42","keywords":["유방병리","피부병리"],"major_research":"유방병리","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"43","name_ko":"김영성","name_en":"","department":"마취통증의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=43","keywords":["뇌신경마취","소아마취","노인마취","산과마취"],"major_research":"뇌신경마취","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":["신약","의사과학자"]},{"id":"44","name_ko":"김영수","name_en":"","department":"심혈관센터(순환기)","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=44","keywords":["대동맥질환","성인심장질환","심장판막질환","심장종양","관상동맥질환"],"major_research":"대동맥질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기"]},{"id":"45","name_ko":"김영훈","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=45","keywords":["부정맥","심박동기","제세동기(격주)"],"major_research":"부정맥","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"46","name_ko":"김예령","name_en":"","department":"유방내분비외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=46","keywords":["유방암","유방질환"],"major_research":"유방암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"47","name_ko":"김예진","name_en":"","department":"치과교정과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=47","keywords":["성인교정","심미교정","악교정수술","소아청소년교정","설측교정"],"major_research":"성인교정","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"48","name_ko":"김완배","name_en":"","department":"간담췌외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=48","keywords":["췌장","담낭질환(로봇수술)"],"major_research":"췌장","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"49","name_ko":"김완준","name_en":"","department":"간담췌외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=49","keywords":["간","담낭질환(로봇수술)"],"major_research":"간","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"50","name_ko":"김용엽","name_en":"","department":"유방내분비외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=50","keywords":["갑상선암","부신질환","유방암","유방질환"],"major_research":"갑상선암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"51","name_ko":"김용진","name_en":"","department":"산부인과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=51","keywords":["불임","반복착상실패","생식내분비질환","폐경","가임기여성종양(자궁근종","자궁내막증","난소낭종)","가임력보존","로봇/복강경수술"],"major_research":"불임","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.6,"platforms":[]},{"id":"52","name_ko":"김우영","name_en":"","department":"유방내분비외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=52","keywords":["유방암","갑상선암"],"major_research":"유방암","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","정밀재생","면역/마이크로","데이터"]},{"id":"53","name_ko":"김우주","name_en":"","department":"감염내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=53","keywords":["감염질환(백신","여행자","신종 감염병","불명열","에이즈","임파선염 클리닉)"],"major_research":"감염질환(백신","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"54","name_ko":"김우진","name_en":"","department":"안과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=54","keywords":["각막","외안부","백내장"],"major_research":"각막","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"55","name_ko":"김원식","name_en":"","department":"소화기내과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=55","keywords":["위장관질환"],"major_research":"위장관질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"56","name_ko":"김은상","name_en":"","department":"신경외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=56","keywords":["척추/척수 종양","요통","좌골신경통","디스크 내시경수술","척추외상","목디스크"],"major_research":"척추/척수 종양","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"57","name_ko":"김응주","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=57","keywords":["고혈압","심부전","허혈성심질환","심장재활"],"major_research":"고혈압","lab_info":"","publications":12,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"58","name_ko":"김재선","name_en":"","department":"소화기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=58","keywords":["담","췌장질환"],"major_research":"담","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"59","name_ko":"김재원","name_en":"","department":"마취통증의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=59","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"60","name_ko":"김정열","name_en":"","department":"병리과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=60","keywords":[],"major_research":"","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"61","name_ko":"김정우","name_en":"","department":"영상의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=61","keywords":["비뇨생식기영상의학","복부영상의학"],"major_research":"비뇨생식기영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"62","name_ko":"김정윤","name_en":"","department":"응급의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=62","keywords":["응급의학","소생학"],"major_research":"응급의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"63","name_ko":"김종욱","name_en":"","department":"비뇨의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=63","keywords":["전립선","비뇨기암","복강경수술","로봇수술"],"major_research":"전립선","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"64","name_ko":"김종한","name_en":"","department":"위장관외과(상부)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=64","keywords":["위암","종양외과","복강경","로봇수술","위식도역류증","탈장","비만대사수술"],"major_research":"위암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"65","name_ko":"김종현","name_en":"","department":"신경외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=65","keywords":["뇌종양.뇌전증","이상운동질환"],"major_research":"뇌종양.뇌전증","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"66","name_ko":"김주한","name_en":"","department":"신경외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=66","keywords":["요추질환","척추외상","척추질환"],"major_research":"요추질환","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"67","name_ko":"김지애","name_en":"","department":"재활의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=67","keywords":["소아재활","뇌신경재활","재활의학과 일반"],"major_research":"소아재활","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"68","name_ko":"김지은","name_en":"","department":"신장내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=68","keywords":["혈뇨","단백뇨","신장이식","신장질환","만성콩팥병","급성신부전","다낭신"],"major_research":"혈뇨","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","의사과학자"]},{"id":"69","name_ko":"김지현","name_en":"","department":"신경과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=69","keywords":["뇌전증","경련","실신","염증성질환"],"major_research":"뇌전증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"70","name_ko":"김지혜","name_en":"","department":"유방내분비외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=70","keywords":["유방암","유방질환"],"major_research":"유방암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"71","name_ko":"김지훈","name_en":"","department":"간센터(내과)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=71","keywords":["간암","간질환","B형간염","C형간염","지방간"],"major_research":"간암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"72","name_ko":"김진원","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=72","keywords":["협심증","심근경색","허혈성심질환","심혈관중재시술"],"major_research":"협심증","lab_info":"","publications":9,"projects":0,"citations":0,"budget":12.8,"platforms":[]},{"id":"73","name_ko":"김치경","name_en":"","department":"신경과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=73","keywords":["중환자의학","신경계중환자","뇌졸중","뇌경색"],"major_research":"중환자의학","lab_info":"","publications":18,"projects":0,"citations":0,"budget":3.0,"platforms":["정밀재생","신약","데이터"]},{"id":"74","name_ko":"김태식","name_en":"","department":"응급중환자외상외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=74","keywords":["에크모(ECMO)","중환자의학","정맥질환(하지정맥류","심부정맥혈전증)","동맥질환(말초동맥)"],"major_research":"에크모(ECMO)","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"75","name_ko":"나소진","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=75","keywords":["일반마취","부위마취"],"major_research":"일반마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"76","name_ko":"나승운","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=76","keywords":["관상동맥질환(협심증","심근경색증)","말초혈관질환(상하지혈관질환","대동맥질환)","정맥질환","대동맥 판막질환","심혈관 고난이도 중재시술"],"major_research":"관상동맥질환(협심증","lab_info":"","publications":19,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"77","name_ko":"나진오","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=77","keywords":["심부전","허혈성심질환","심장판막질환","수면무호흡증"],"major_research":"심부전","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"78","name_ko":"남가은","name_en":"","department":"가정의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=78","keywords":["건강증진","골다공증","노인병","비만(대사증후군)"],"major_research":"건강증진","lab_info":"","publications":11,"projects":0,"citations":0,"budget":0.6,"platforms":["데이터"]},{"id":"79","name_ko":"남궁식","name_en":"","department":"성형외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=79","keywords":["유방 재건 및 유방 성형","하지 재건","미세 수술","로봇 수술","연부조직 종양"],"major_research":"유방 재건 및 유방 성형","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","정밀재생"]},{"id":"80","name_ko":"남궁윤","name_en":"","department":"종양내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=80","keywords":["위암","간담도암","췌장암","식도암","대장암(암병원진료)"],"major_research":"위암","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로"]},{"id":"81","name_ko":"남엘리엘","name_en":"","department":"감염내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=81","keywords":["열성질환","감염질환(백신","여행자","에이즈","신종감염병클리닉)"],"major_research":"열성질환","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로"]},{"id":"82","name_ko":"남윤진","name_en":"","department":"정형외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=82","keywords":["척추질환"],"major_research":"척추질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"83","name_ko":"남효경","name_en":"","department":"소아청소년과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=83","keywords":["갑상선질환","내분비질환","당뇨병","성조숙증","소아비만","성장장애","요붕증"],"major_research":"갑상선질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"84","name_ko":"노승영","name_en":"","department":"심혈관센터(순환기)","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=84","keywords":["부정맥","심방세동","심장성급사","서맥","실신"],"major_research":"부정맥","lab_info":"","publications":11,"projects":0,"citations":0,"budget":2.3,"platforms":["정밀의료기기","신약"]},{"id":"85","name_ko":"노예천","name_en":"","department":"응급의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=85","keywords":["응급의학","임상독성학","소생학"],"major_research":"응급의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"86","name_ko":"노지윤","name_en":"","department":"감염내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=86","keywords":["감염질환(불명열","신종감염병","에이즈","임파선염","예방접종","여행자)"],"major_research":"감염질환(불명열","lab_info":"","publications":9,"projects":0,"citations":0,"budget":2.4,"platforms":["면역/마이크로","데이터"]},{"id":"87","name_ko":"노태욱","name_en":"","department":"중환자의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=87","keywords":["중환자의학","중증외상","응급수술"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"88","name_ko":"노해원","name_en":"","department":"신경외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=88","keywords":["뇌전증","이상운동질환","뇌종양","감마나이프","두부외상","뇌혈관질환"],"major_research":"뇌전증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"89","name_ko":"동은상","name_en":"","department":"성형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=89","keywords":["코성형","유방성형","두개(골)안면성형"],"major_research":"코성형","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"90","name_ko":"류혜진","name_en":"","department":"내분비내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=90","keywords":["당뇨병","고지혈증","비만"],"major_research":"당뇨병","lab_info":"","publications":8,"projects":0,"citations":0,"budget":1.2,"platforms":["신약","데이터"]},{"id":"91","name_ko":"문경철","name_en":"","department":"성형외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=91","keywords":["유방 성형","눈 성형","미세수술","안면성형","수부 및 사지 재건"],"major_research":"유방 성형","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생"]},{"id":"92","name_ko":"문두건","name_en":"","department":"비뇨의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=92","keywords":["남성건강클리닉(성기능장애","불임","남성갱년기)","비뇨기종양","전립선(레이져수술)","결석","소아비뇨기"],"major_research":"남성건강클리닉(성기능장애","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"93","name_ko":"문봉기","name_en":"","department":"마취통증의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=93","keywords":["외상마취","뇌신경마취"],"major_research":"외상마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"94","name_ko":"문준규","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=94","keywords":["스포츠손상","어깨","팔꿈치관절 질환"],"major_research":"스포츠손상","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"95","name_ko":"문지원","name_en":"","department":"이비인후·두경부외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=95","keywords":["부비동염","알레르기비염","후각장애","코성형","코골이 및 수면무호흡증"],"major_research":"부비동염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","정밀재생","면역/마이크로","신약","데이터","의사과학자"]},{"id":"96","name_ko":"민경훈","name_en":"","department":"호흡기·알레르기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=96","keywords":["천식","기관지확장증","만성기침","만성폐쇄성폐질환","기타기도질환"],"major_research":"천식","lab_info":"","publications":19,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"97","name_ko":"민병욱","name_en":"","department":"대장항문외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=97","keywords":["대장암","직장암","항문암"],"major_research":"대장암","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"98","name_ko":"민진홍","name_en":"","department":"구강악안면외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=98","keywords":["구강악안면외과","사랑니","안면골절","임플란트","신경손상","상악동질환","턱관절 장애"],"major_research":"구강악안면외과","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"99","name_ko":"박경선","name_en":"","department":"종양내과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=99","keywords":["입원환자 전담치료"],"major_research":"입원환자 전담치료","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"100","name_ko":"박민정","name_en":"","department":"내분비내과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=100","keywords":["뇌하수체","부신","골다공증","갑상선 질환","당뇨병"],"major_research":"뇌하수체","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","면역/마이크로","데이터","의사과학자"]},{"id":"101","name_ko":"박민정","name_en":"","department":"심혈관센터(순환기)","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=101","keywords":["심장질환","심장판막질환","심부전","고지혈증","심장초음파","심근병증"],"major_research":"심장질환","lab_info":"","publications":7,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"102","name_ko":"박빛나","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=102","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"103","name_ko":"박선영","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=103","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"104","name_ko":"박성준","name_en":"","department":"응급의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=104","keywords":["응급의학","소생학"],"major_research":"응급의학","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"105","name_ko":"박소윤","name_en":"","department":"호흡기·알레르기내과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=105","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"106","name_ko":"박수형","name_en":"","department":"심혈관센터(순환기)","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=106","keywords":["심근경색","협심증","허혈성심질환","순환기질환","말초혈관질환"],"major_research":"심근경색","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"107","name_ko":"박영환","name_en":"","department":"정형외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=107","keywords":["성인족부질환","골절 및 스포츠외상","소아족부질환","소아하지선천성기형","소아고관절질환","소아외상","소아평발 클리닉"],"major_research":"성인족부질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"108","name_ko":"박유진","name_en":"","department":"소아청소년과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=108","keywords":["신장(콩팥)요로질환","요로감염","산염기전해질이상","고혈압"],"major_research":"신장(콩팥)요로질환","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"109","name_ko":"박은진","name_en":"","department":"심혈관센터(순환기)","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=109","keywords":["심근경색","협심증","허혈성심질환","심인성쇼크","성인선천성심질환"],"major_research":"심근경색","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"110","name_ko":"박인혜","name_en":"","department":"종양내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=110","keywords":["유방암","암유전체 클리닉"],"major_research":"유방암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","신약"]},{"id":"111","name_ko":"박일호","name_en":"","department":"이비인후·두경부외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=111","keywords":["코골이","후각장애","부비동염","수면무호흡증","알레르기성 비염"],"major_research":"코골이","lab_info":"","publications":1,"projects":0,"citations":0,"budget":11.3,"platforms":["정밀의료기기","면역/마이크로","신약"]},{"id":"112","name_ko":"박지은","name_en":"","department":"영상의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=112","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"113","name_ko":"박창규","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=113","keywords":["고혈압","고지혈증","협심증","허혈성심질환"],"major_research":"고혈압","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"114","name_ko":"박평재","name_en":"","department":"이식혈관외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=114","keywords":["간암","간이식","후복막종양","복부대동맥류","하지정맥류","말초혈관질환(월 오후/간센터 진료 : 간암","간이식)"],"major_research":"간암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"115","name_ko":"박현진","name_en":"","department":"가정의학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=115","keywords":["건강증진","예방접종","가정의학","금연","만성피로"],"major_research":"건강증진","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"116","name_ko":"박홍석","name_en":"","department":"비뇨의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=116","keywords":["혈뇨","비뇨기종양"],"major_research":"혈뇨","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"117","name_ko":"박효진","name_en":"","department":"가정의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=117","keywords":["가정의학","비만","건강증진","다약제복용크리닉","노인병","만성피로","예방접종","금연"],"major_research":"가정의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"118","name_ko":"박희준","name_en":"","department":"영상의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=118","keywords":["유방영상의학"],"major_research":"유방영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"119","name_ko":"배지훈","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=119","keywords":["슬관절","스포츠외상","관절경수술","인대재건술","무릎인공관절수술"],"major_research":"슬관절","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"120","name_ko":"배현경","name_en":"","department":"응급의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=120","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"121","name_ko":"백대현","name_en":"","department":"응급의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=121","keywords":["응급의학","외상학"],"major_research":"응급의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"122","name_ko":"백만종","name_en":"","department":"심장혈관흉부외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=122","keywords":["심장판막","협심증","심근경색","대동맥질환","심방세동","심장종양"],"major_research":"심장판막","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"123","name_ko":"백세현","name_en":"","department":"안과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=123","keywords":["성형안과","안와골절","의안","갑상샘눈병증종양","눈물질환(소아","성인)"],"major_research":"성형안과","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"124","name_ko":"백세현","name_en":"","department":"내분비내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=124","keywords":["당뇨병","갑상선질환","내분비질환"],"major_research":"당뇨병","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"125","name_ko":"백유상","name_en":"","department":"피부과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=125","keywords":["건선","두드러기","피부암","피부종양"],"major_research":"건선","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생"]},{"id":"126","name_ko":"백지연","name_en":"","department":"종양내과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=126","keywords":["통원항암치료실 전담치료"],"major_research":"통원항암치료실 전담치료","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"127","name_ko":"변준호","name_en":"","department":"신경외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=127","keywords":["뇌종양(뇌수막종","청신경종양","뇌하수체종양","신경교종","뇌전이암","두개저수술","내시경수술)"],"major_research":"뇌종양(뇌수막종","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","면역/마이크로","데이터"]},{"id":"128","name_ko":"봉준우","name_en":"","department":"대장항문외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=128","keywords":["대장항문질환","탈장","복강경","로봇수술","대장내시경"],"major_research":"대장항문질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.9,"platforms":["면역/마이크로","데이터","의사과학자"]},{"id":"129","name_ko":"서상일","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=129","keywords":["뇌","두경부","척추혈관 조영술 및 뇌척추 혈관 인터벤션(색전술/혈전용해술/스텐트삽입술)","뇌초음파"],"major_research":"뇌","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"130","name_ko":"서승우","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=130","keywords":["척추질환","척추측만증"],"major_research":"척추질환","lab_info":"","publications":4,"projects":0,"citations":0,"budget":2.4,"platforms":[]},{"id":"131","name_ko":"서영우","name_en":"","department":"안과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=131","keywords":["사시","소아안과(약시)","근시","난시","신경안과","복시","백내장","시신경질환"],"major_research":"사시","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"132","name_ko":"서원준","name_en":"","department":"위장관외과(상부)","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=132","keywords":["위암","종양외과","로봇수술","탈장"],"major_research":"위암","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"133","name_ko":"서재홍","name_en":"","department":"종양내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=133","keywords":["유방암"],"major_research":"유방암","lab_info":"","publications":2,"projects":0,"citations":0,"budget":6.8,"platforms":["신약"]},{"id":"134","name_ko":"서태석","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=134","keywords":["인터벤션 시술"],"major_research":"인터벤션 시술","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"135","name_ko":"석진후","name_en":"","department":"신경외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=135","keywords":["신경외과 질환"],"major_research":"신경외과 질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"136","name_ko":"설현주","name_en":"","department":"산부인과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=136","keywords":["산과학","고위험산모"],"major_research":"산과학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"137","name_ko":"설혜영","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=137","keywords":["신경두경부 영상의학"],"major_research":"신경두경부 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"138","name_ko":"손민지","name_en":"","department":"소아청소년과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=138","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"139","name_ko":"송관규","name_en":"","department":"류마티스내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=139","keywords":["류마티스 질환","류마티스 관절염","전신홍반루푸스","강직성척추염","혈관염","전신경화증(경피증)","쇼그렌 증후군","베체트병","다발성근염 및 피부근염"],"major_research":"류마티스 질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"140","name_ko":"송대진","name_en":"","department":"소아청소년과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=140","keywords":["천식","알레르기","호흡기질환"],"major_research":"천식","lab_info":"","publications":6,"projects":0,"citations":0,"budget":1.5,"platforms":["의사과학자"]},{"id":"141","name_ko":"송명규","name_en":"","department":"영상의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=141","keywords":["인터벤션 시술"],"major_research":"인터벤션 시술","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"142","name_ko":"송미진","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=142","keywords":["복부 비뇨기계 영상의학","태아영상진단"],"major_research":"복부 비뇨기계 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"143","name_ko":"송민지","name_en":"","department":"신경과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=143","keywords":["실신","경련","의식변화","뇌수막염","두통","어지러움"],"major_research":"실신","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"144","name_ko":"송승민","name_en":"","department":"신장내과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=144","keywords":["급성신손상","사구체신염","혈액투석","중환자의학"],"major_research":"급성신손상","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"145","name_ko":"송의연","name_en":"","department":"내분비내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=145","keywords":["갑상선 질환 (수 오전: 암병원 / 수 오후: 갑상선 결절 원스탑 클리닉)"],"major_research":"갑상선 질환 (수 오전: 암병원 / 수 오후: 갑상선 결절 원스탑 클리닉)","lab_info":"","publications":8,"projects":0,"citations":0,"budget":0.2,"platforms":[]},{"id":"146","name_ko":"송재준","name_en":"","department":"이비인후·두경부외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=146","keywords":["어지럼증","중이질환","이식형보청기"],"major_research":"어지럼증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":15.1,"platforms":[]},{"id":"147","name_ko":"송종석","name_en":"","department":"안과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=147","keywords":["각막 질환","백내장","노안수술"],"major_research":"각막 질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"148","name_ko":"송준영","name_en":"","department":"감염내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=148","keywords":["중환자의학","패혈증","감염관리"],"major_research":"중환자의학","lab_info":"","publications":14,"projects":0,"citations":0,"budget":2.2,"platforms":["면역/마이크로","신약"]},{"id":"149","name_ko":"송지현","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=149","keywords":["척추통증","삼차신경통","대상포진 후 신경통","비수술적 치료","근골격 퇴행성 질환","퇴행성 관절염","당뇨병성 신경통증","다한증"],"major_research":"척추통증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"150","name_ko":"송초록","name_en":"","department":"영상의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=150","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"151","name_ko":"시수경","name_en":"","department":"가정의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=151","keywords":["가정의학 완화의료 노인병 부종클리닉(림프부종) 피로클리닉 암환자건강증진"],"major_research":"가정의학 완화의료 노인병 부종클리닉(림프부종) 피로클리닉 암환자건강증진","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"152","name_ko":"신나리","name_en":"","department":"영상의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=152","keywords":["근골격 영상의학"],"major_research":"근골격 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"153","name_ko":"신승현","name_en":"","department":"소아청소년과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=153","keywords":["미숙아","신생아","고위험신생아","육아상담"],"major_research":"미숙아","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"154","name_ko":"신정호","name_en":"","department":"산부인과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=154","keywords":["로봇-복강경수술","골반장기탈출증","자궁근종","자궁내막증","폐경"],"major_research":"로봇-복강경수술","lab_info":"","publications":8,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"155","name_ko":"신주희","name_en":"","department":"치과보존과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=155","keywords":["신경치료","지각과민증(시린이)","충치치료","치아미백","심미치료"],"major_research":"신경치료","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"156","name_ko":"신지혜","name_en":"","department":"신경과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=156","keywords":["경련","두통","실신"],"major_research":"경련","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"157","name_ko":"신혜선","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=157","keywords":["유방영상진단","유방초음파"],"major_research":"유방영상진단","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"158","name_ko":"심재겸","name_en":"","department":"중환자의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=158","keywords":["중환자의학","호흡기질환","급성호흡부전"],"major_research":"중환자의학","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","데이터","의사과학자"]},{"id":"159","name_ko":"심재정","name_en":"","department":"호흡기·알레르기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=159","keywords":["천식","만성기침","만성폐쇄성폐질환","기도 질환","간질성폐질환"],"major_research":"천식","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"160","name_ko":"심지석","name_en":"","department":"치과보철과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=160","keywords":["심미보철","임플란트","틀니","브릿지","크라운","턱관절 질환","임플란트주위염 치료"],"major_research":"심미보철","lab_info":"","publications":5,"projects":0,"citations":0,"budget":2.7,"platforms":["정밀재생"]},{"id":"161","name_ko":"안소민","name_en":"","department":"안과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=161","keywords":["포도막염","망막질환","백내장"],"major_research":"포도막염","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"162","name_ko":"안순태","name_en":"","department":"비뇨의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=162","keywords":["혈뇨/비뇨기 종양","남성의학","전립선","요로결석","요로감염","로봇수술"],"major_research":"혈뇨/비뇨기 종양","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"163","name_ko":"안신영","name_en":"","department":"신장내과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=163","keywords":["중환자의학","신부전","신대체요법"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.8,"platforms":["정밀재생"]},{"id":"164","name_ko":"양대식","name_en":"","department":"방사선종양학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=164","keywords":["유방암","임파종","부인암"],"major_research":"유방암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"165","name_ko":"양동화","name_en":"","department":"소아청소년과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=165","keywords":["소아신경","뇌전증(간질)","뇌성마비","두통","발달지연","근육병"],"major_research":"소아신경","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"166","name_ko":"양승남","name_en":"","department":"재활의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=166","keywords":["소아재활","전기진단","림프부종","근골격계 통증","뇌신경재활","연하장애"],"major_research":"소아재활","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"167","name_ko":"양승도","name_en":"","department":"소아청소년과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=167","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"168","name_ko":"양우진","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=168","keywords":["인터벤션 시술"],"major_research":"인터벤션 시술","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"169","name_ko":"어재선","name_en":"","department":"핵의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=169","keywords":["종양핵의학","방사성핵종치료","분자영상"],"major_research":"종양핵의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"170","name_ko":"연종은","name_en":"","department":"간센터(내과)","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=170","keywords":["간암","B형간염","C형간염","간질환","지방간","간경화"],"major_research":"간암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"171","name_ko":"오경미","name_en":"","department":"신경과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=171","keywords":["뇌졸중","뇌혈관 질환","두통"],"major_research":"뇌졸중","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"172","name_ko":"오미미","name_en":"","department":"비뇨의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=172","keywords":["배뇨장애","복합성요실금","로봇방광탈출교정술","과민성방광","간질성방광염/방광통증증후군","신경인성방광","급만성재발성방광염","소아음낭수종","잠복고환","전립선","로봇수술"],"major_research":"배뇨장애","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"173","name_ko":"오민정","name_en":"","department":"산부인과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=173","keywords":["산과","고위험산모"],"major_research":"산과","lab_info":"","publications":0,"projects":0,"citations":0,"budget":2.4,"platforms":[]},{"id":"174","name_ko":"오상철","name_en":"","department":"종양내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=174","keywords":["위암","간담도암","췌장암","식도암","대장암"],"major_research":"위암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","신약","데이터"]},{"id":"175","name_ko":"오석경","name_en":"","department":"마취통증의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=175","keywords":["부위마취","일반마취"],"major_research":"부위마취","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기"]},{"id":"176","name_ko":"오수민","name_en":"","department":"산부인과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=176","keywords":["골반장기탈출증","로봇-복강경수술","폐경","일반산부인과","생식내분비질환"],"major_research":"골반장기탈출증","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"177","name_ko":"오종건","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=177","keywords":["외상골절","외상후 골수염","불유합","부정유합(외상관련만 진료)"],"major_research":"외상골절","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"178","name_ko":"오지연","name_en":"","department":"호흡기·알레르기내과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=178","keywords":["결핵","비결핵항산균 폐질환","잠복결핵","폐렴","기타호흡기질환"],"major_research":"결핵","lab_info":"","publications":8,"projects":0,"citations":0,"budget":0.9,"platforms":["정밀재생","데이터"]},{"id":"179","name_ko":"오채연","name_en":"","department":"소아외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=179","keywords":["소아탈장","피부종기","경부종양","소아양성종양","소아악성종양","난소종양","십이지장/소장폐쇄"],"major_research":"소아탈장","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"180","name_ko":"용환석","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=180","keywords":["심장 및 흉부 영상의학"],"major_research":"심장 및 흉부 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.9,"platforms":[]},{"id":"181","name_ko":"우상욱","name_en":"","department":"유방내분비외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=181","keywords":["유방암","내분비암"],"major_research":"유방암","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"182","name_ko":"우옥희","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=182","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"183","name_ko":"우정수","name_en":"","department":"이비인후·두경부외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=183","keywords":["두경부외과"],"major_research":"두경부외과","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"184","name_ko":"위재연","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=184","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"185","name_ko":"유문영","name_en":"","department":"가정의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=185","keywords":["가정의학","건강증진","만성피로","예방접종","금연"],"major_research":"가정의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"186","name_ko":"유양재","name_en":"","department":"간센터(내과)","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=186","keywords":["B형간염","C형간염","간암","간질환","지방간","간경화"],"major_research":"B형간염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"187","name_ko":"유은상","name_en":"","department":"혈액내과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=187","keywords":["백혈병","골수이형성증후군","골수증식종양","혈액질환","조혈모세포이식"],"major_research":"백혈병","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"188","name_ko":"유인선","name_en":"","department":"영상의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=188","keywords":["신경두경부 영상의학","갑상선 영상의학"],"major_research":"신경두경부 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"189","name_ko":"유호준","name_en":"","department":"신장내과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=189","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"190","name_ko":"윤수영","name_en":"","department":"진단검사의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=190","keywords":["진단혈액학","임상화학"],"major_research":"진단혈액학","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"191","name_ko":"윤수정","name_en":"","department":"신장내과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=191","keywords":["신장질환","급성/만성신부전","단백뇨","혈뇨"],"major_research":"신장질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"192","name_ko":"윤영훈","name_en":"","department":"응급의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=192","keywords":["응급의학","외상학"],"major_research":"응급의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"193","name_ko":"윤원기","name_en":"","department":"신경외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=193","keywords":["뇌혈관질환(뇌동맥류","뇌경색","뇌혈관협착","뇌동정맥기형","모야모야병등)","뇌혈관내수술(손목동맥을이용한 뇌혈관조영술 및 치료","스텐트","코일색전 수술등)두통","두부외상"],"major_research":"뇌혈관질환(뇌동맥류","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"194","name_ko":"윤윤선","name_en":"","department":"소아청소년과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=194","keywords":["소아감염성 질환","불명열","결핵","예방접종(특수접종)","여행자의학(유학","이주)"],"major_research":"소아감염성 질환","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","데이터"]},{"id":"195","name_ko":"윤정","name_en":"","department":"진단검사의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=195","keywords":["분자유전","암유전","분자미생물"],"major_research":"분자유전","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.6,"platforms":["정밀의료기기","정밀재생","신약","의사과학자"]},{"id":"196","name_ko":"윤준식","name_en":"","department":"재활의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=196","keywords":["척수손상재활","경막외차단","통증(오십견","관절염","척추)","전기진단(화/경막외차단)"],"major_research":"척수손상재활","lab_info":"","publications":0,"projects":0,"citations":0,"budget":2.3,"platforms":[]},{"id":"197","name_ko":"윤진구","name_en":"","department":"감염내과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=197","keywords":["중환자의학","패혈증","감염관리"],"major_research":"중환자의학","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로"]},{"id":"198","name_ko":"이건주","name_en":"","department":"신경과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=198","keywords":["뇌졸중","뇌경색","뇌혈관질환","희귀뇌혈관질환 (모야모야병","카다실","유전성 뇌혈관질환)","어지럼증","혈관성 치매"],"major_research":"뇌졸중","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생"]},{"id":"199","name_ko":"이경민","name_en":"","department":"종양내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=199","keywords":["뇌종양","전립선암","부인암","비뇨기암","원발불명암","희귀암","가족성암"],"major_research":"뇌종양","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["신약","데이터"]},{"id":"200","name_ko":"이경연","name_en":"","department":"심혈관센터(순환기)","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=200","keywords":["부정맥","심방세동","심장성급사","서맥","실신"],"major_research":"부정맥","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"201","name_ko":"이경재","name_en":"","department":"소아청소년과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=201","keywords":["소아위장관 질환","염증성 질환","만성변비","만성복통","만성 설사","혈변","간질환(간염","담도폐쇄)","소아영양"],"major_research":"소아위장관 질환","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"202","name_ko":"이경화","name_en":"","department":"방사선종양학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=202","keywords":["뇌종양","두경부암","소화기암","림프종","전이종양","켈로이드"],"major_research":"뇌종양","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"203","name_ko":"이규봉","name_en":"","department":"신경과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=203","keywords":["뇌졸중","뇌혈관중재시술","뇌신경중환자의학"],"major_research":"뇌졸중","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"204","name_ko":"이기열","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=204","keywords":["흉부"],"major_research":"흉부","lab_info":"","publications":0,"projects":0,"citations":0,"budget":1.1,"platforms":[]},{"id":"205","name_ko":"이기현","name_en":"","department":"응급의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=205","keywords":["내과응급"],"major_research":"내과응급","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"206","name_ko":"이대인","name_en":"","department":"심혈관센터(순환기)","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=206","keywords":["부정맥","심방세동","심장성급사","서맥","실신"],"major_research":"부정맥","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","데이터"]},{"id":"207","name_ko":"이도희","name_en":"","department":"가정의학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=207","keywords":["가정의학","건강증진","만성피로","예방접종","금연"],"major_research":"가정의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"208","name_ko":"이문수","name_en":"","department":"정신건강의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=208","keywords":["소아청소년 정신건강(자폐.발달장애포함","조울병","우울증","ADHD","강박증","틱장애)"],"major_research":"소아청소년 정신건강(자폐.발달장애포함","lab_info":"","publications":8,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기"]},{"id":"209","name_ko":"이민규","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=209","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"210","name_ko":"이범재","name_en":"","department":"소화기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=210","keywords":["궤양성대장염","크론","염증성장질환","소장출혈","위장관질환"],"major_research":"궤양성대장염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":2.4,"platforms":["정밀의료기기"]},{"id":"211","name_ko":"이상목","name_en":"","department":"응급중환자외상외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=211","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"212","name_ko":"이선기","name_en":"","department":"중환자의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=212","keywords":["중환자의학","급성심부전","심장혈관중재술","심장이식 후 관리"],"major_research":"중환자의학","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"213","name_ko":"이선일","name_en":"","department":"대장항문외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=213","keywords":["대장암 로봇수술","대장내시경"],"major_research":"대장암 로봇수술","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"214","name_ko":"이성훈","name_en":"","department":"외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=214","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"215","name_ko":"이소영","name_en":"","department":"마취통증의학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=215","keywords":["척추통증","디스크","척추관협착증","추관절질환","근골격계 통증","어깨통증","무릎통증","대상포진","두통","삼차신경통","안면통","암성통증","척추수술 후 통증","복합부위통증증후군","뇌신경마취","부위마취","일반마취"],"major_research":"척추통증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"216","name_ko":"이수영","name_en":"","department":"치과교정과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=216","keywords":["약교정수술","심미교정","성인교정","소아청소년교정","투명교정","설측교정"],"major_research":"약교정수술","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"217","name_ko":"이승룡","name_en":"","department":"호흡기·알레르기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=217","keywords":["폐암","조기폐암","만성폐쇄성폐질환","악성중피종","흉선암"],"major_research":"폐암","lab_info":"","publications":11,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로"]},{"id":"218","name_ko":"이승훈","name_en":"","department":"정신건강의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=218","keywords":["우울및기분장애","불안","외상후스트레스(PTSD)","치매및기억력장애","조현병"],"major_research":"우울및기분장애","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터","의사과학자"]},{"id":"219","name_ko":"이승훈","name_en":"","department":"신경외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=219","keywords":["척추외상","척추내시경","척추질환","척추종양"],"major_research":"척추외상","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"220","name_ko":"이영선","name_en":"","department":"간센터(내과)","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=220","keywords":["간암","지방간","간경화","B형간염","C형간염","간질환"],"major_research":"간암","lab_info":"","publications":6,"projects":0,"citations":0,"budget":18.8,"platforms":["정밀재생"]},{"id":"221","name_ko":"이영우","name_en":"","department":"간센터(내과)","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=221","keywords":["B형간염","C형간염","간질환","지방간","간경화"],"major_research":"B형간염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"222","name_ko":"이유정","name_en":"","department":"가정의학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=222","keywords":["가정의학 완화의료 노인병 부종클리닉(림프부종) 피로클리닉 암환자건강증진"],"major_research":"가정의학 완화의료 노인병 부종클리닉(림프부종) 피로클리닉 암환자건강증진","lab_info":"","publications":7,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"223","name_ko":"이은상","name_en":"","department":"소아청소년과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=223","keywords":["혈액질환","종양질환","조혈모세포이식","혈관종"],"major_research":"혈액질환","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터","의사과학자"]},{"id":"224","name_ko":"이은성","name_en":"","department":"핵의학과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=224","keywords":["종양핵의학","분자영상","방사성핵종치료"],"major_research":"종양핵의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"225","name_ko":"이의석","name_en":"","department":"구강악안면외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=225","keywords":["턱교정수술","턱관절","수면무호흡","치아.뼈이식","삼차신경통","외상","구순구개열"],"major_research":"턱교정수술","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"226","name_ko":"이일옥","name_en":"","department":"마취통증의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=226","keywords":["뇌신경마취","소아마취","정맥마취"],"major_research":"뇌신경마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"227","name_ko":"이재관","name_en":"","department":"산부인과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=227","keywords":["골반내시경","부인과종양","로봇-복강경수술"],"major_research":"골반내시경","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"228","name_ko":"이재복","name_en":"","department":"유방내분비외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=228","keywords":["갑상선암","유방암"],"major_research":"갑상선암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"229","name_ko":"이재원","name_en":"","department":"응급중환자외상외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=229","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"230","name_ko":"이정열","name_en":"","department":"치과보철과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=230","keywords":["심미보철","임플란트","틀니","악안면 보철","브릿지","크라운"],"major_research":"심미보철","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"231","name_ko":"이정윤","name_en":"","department":"신경과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=231","keywords":["이상운동질환","진전 (떨림증)","파킨슨병"],"major_research":"이상운동질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터","의사과학자"]},{"id":"232","name_ko":"이정일","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=232","keywords":["수부외과","손목관절 질환 및 외상","말초신경마비","상완신경총 손상","골/연부조직 재건술"],"major_research":"수부외과","lab_info":"","publications":1,"projects":0,"citations":0,"budget":2.4,"platforms":["정밀재생","신약"]},{"id":"233","name_ko":"이정화","name_en":"","department":"소아청소년과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=233","keywords":["선천면역","자가면역","자가염증질환","루프스","관절염","원인불명 열(반복되는 열)","가와사끼병","천식"],"major_research":"선천면역","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"234","name_ko":"이종미","name_en":"","department":"영상의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=234","keywords":["복부 비뇨기계 영상의학"],"major_research":"복부 비뇨기계 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"235","name_ko":"이주희","name_en":"","department":"영상의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=235","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"236","name_ko":"이준희","name_en":"","department":"심장혈관흉부외과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=236","keywords":["폐암","폐전이암","흉선종","종격동질환","기흉"],"major_research":"폐암","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","신약","의사과학자"]},{"id":"237","name_ko":"이지영","name_en":"","department":"응급의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=237","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"238","name_ko":"이지은","name_en":"","department":"치과치주과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=238","keywords":["잇몸질환","치주조직 재생","임플란트 주위염"],"major_research":"잇몸질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"239","name_ko":"이지은","name_en":"","department":"심혈관센터(순환기)","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=239","keywords":["고지혈증","고혈압","심부전","심장초음파","심근병증","심장판막질환"],"major_research":"고지혈증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"240","name_ko":"이진영","name_en":"","department":"응급중환자외상외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=240","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"241","name_ko":"이창희","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=241","keywords":["복부영상의학"],"major_research":"복부영상의학","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"242","name_ko":"이충훈","name_en":"","department":"마취통증의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=242","keywords":["근골격 퇴행성 질환 및 골절","척추협착증","추관절질환","디스크돌출증","척수수술 후 증후군","척추 압박골절","류마티스관절염","오십견","견관절주위염","퇴행성관절염"],"major_research":"근골격 퇴행성 질환 및 골절","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":["신약"]},{"id":"243","name_ko":"이하석","name_en":"","department":"간센터(내과)","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=243","keywords":["B형간염","C형간염","간암","간질환","지방간","간경화"],"major_research":"B형간염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"244","name_ko":"이한나","name_en":"","department":"치과보철과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=244","keywords":["심미보철","임플란트","틀니","악안면보철","브릿지","크라운"],"major_research":"심미보철","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"245","name_ko":"이현정","name_en":"","department":"내분비내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=245","keywords":["당뇨병","갑상선 질환","골다공증"],"major_research":"당뇨병","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"246","name_ko":"이혜림","name_en":"","department":"신경과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=246","keywords":["중증근무력증","말초신경질환"],"major_research":"중증근무력증","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"247","name_ko":"이환희","name_en":"","department":"핵의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=247","keywords":["종양학의학","방사성핵종치료","분자영상"],"major_research":"종양학의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"248","name_ko":"임병건","name_en":"","department":"마취통증의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=248","keywords":["뇌신경마취","소아마취","정맥마취","일반마취","수술전 마취평가 클리닉"],"major_research":"뇌신경마취","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"249","name_ko":"임수연","name_en":"","department":"간담췌외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=249","keywords":["췌장질환","담낭질환"],"major_research":"췌장질환","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"250","name_ko":"임채승","name_en":"","department":"진단검사의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=250","keywords":["수혈의학","임상미생물"],"major_research":"수혈의학","lab_info":"","publications":2,"projects":0,"citations":0,"budget":5.0,"platforms":[]},{"id":"251","name_ko":"임채홍","name_en":"","department":"방사선종양학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=251","keywords":["유방암","임파종","부인암"],"major_research":"유방암","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"252","name_ko":"임호경","name_en":"","department":"구강악안면외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=252","keywords":["구강암","구강악안면 외과","사랑니","안면골절","임플란트","신경손상","상악동질환","양악수술","턱관절 장애"],"major_research":"구강암","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","데이터"]},{"id":"253","name_ko":"장미영","name_en":"","department":"유방내분비외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=253","keywords":["유방암","유방질환"],"major_research":"유방암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"254","name_ko":"장성원","name_en":"","department":"중환자의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=254","keywords":["중환자의학","호흡기질환","급성호흡부전"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"255","name_ko":"장수연","name_en":"","department":"내분비내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=255","keywords":["당뇨병","갑상선 질환","골다공증"],"major_research":"당뇨병","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"256","name_ko":"장수영","name_en":"","department":"종양내과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=256","keywords":["통원항암치료실 전담치료"],"major_research":"통원항암치료실 전담치료","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"257","name_ko":"장아름","name_en":"","department":"내분비내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=257","keywords":["갑상선 질환 (목 오후: 갑상선 결절 원스탑 클리닉)"],"major_research":"갑상선 질환 (목 오후: 갑상선 결절 원스탑 클리닉)","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"258","name_ko":"장안성","name_en":"","department":"정형외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=258","keywords":["어깨","팔꿈치","관절 질환"],"major_research":"어깨","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","데이터","의사과학자"]},{"id":"259","name_ko":"장유진","name_en":"","department":"위장관외과(상부)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=259","keywords":["위암","복강경수술"],"major_research":"위암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"260","name_ko":"장진경","name_en":"","department":"응급의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=260","keywords":["내과응급진료","일차의료"],"major_research":"내과응급진료","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"261","name_ko":"전민지","name_en":"","department":"혈액내과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=261","keywords":["림프종","다발골수종","혈액질환","조혈모세포이식"],"major_research":"림프종","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"262","name_ko":"전보경","name_en":"","department":"마취통증의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=262","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"263","name_ko":"전소연","name_en":"","department":"재활의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=263","keywords":["뇌신경재활","연하장애","노인재활","근골격계 통증"],"major_research":"뇌신경재활","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"264","name_ko":"전이경","name_en":"","department":"병리과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=264","keywords":["여성생식계병리","세포병리"],"major_research":"여성생식계병리","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"265","name_ko":"전인숙","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=265","keywords":["뇌신경마취","정맥마취"],"major_research":"뇌신경마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"266","name_ko":"전지현","name_en":"","department":"피부과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=266","keywords":["아토피 피부염","탈모","두드러기","가려움증","습진","피부 알레르기"],"major_research":"아토피 피부염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"267","name_ko":"전태성","name_en":"","department":"병리과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=267","keywords":["혈액림프계병리","외과병리"],"major_research":"혈액림프계병리","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"268","name_ko":"정석기","name_en":"","department":"치과교정과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=268","keywords":["성인교정","심미교정","악교정수술","소아청소년교정"],"major_research":"성인교정","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"269","name_ko":"정성호","name_en":"","department":"성형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=269","keywords":["손저림증","수부종양","수부외상 및 재건","손톱변형","수부선천기형","미세수술","하지재건"],"major_research":"손저림증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"270","name_ko":"정소현","name_en":"","department":"산부인과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=270","keywords":["일반산부인과학","부인종양학"],"major_research":"일반산부인과학","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"271","name_ko":"정수경","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=271","keywords":["일반마취","부위마취"],"major_research":"일반마취","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"272","name_ko":"정연학","name_en":"","department":"신경과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=272","keywords":["말초신경질환","중증근무력증","척수염","길랑바레증후군"],"major_research":"말초신경질환","lab_info":"","publications":7,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"273","name_ko":"정재현","name_en":"","department":"유방내분비외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=273","keywords":["유방암","유방질환","갑상선암","내분비질환"],"major_research":"유방암","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"274","name_ko":"정진옥","name_en":"","department":"대장항문외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=274","keywords":["대장암","직장암","대장항문질환","복강경수술","로봇수술","탈장"],"major_research":"대장암","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"275","name_ko":"정현강","name_en":"","department":"정신건강의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=275","keywords":["공황장애","치매","기분장애","기억력 장애","수면장애"],"major_research":"공황장애","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","정밀재생"]},{"id":"276","name_ko":"정혜나","name_en":"","department":"영상의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=276","keywords":["뇌두경부영상진단"],"major_research":"뇌두경부영상진단","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"277","name_ko":"정혜원","name_en":"","department":"임상약리학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=277","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.2,"platforms":["신약","데이터","의사과학자"]},{"id":"278","name_ko":"정혜인","name_en":"","department":"마취통증의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=278","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"279","name_ko":"정희라","name_en":"","department":"소아청소년과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=279","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"280","name_ko":"정희진","name_en":"","department":"감염내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=280","keywords":["감염질환(백신","여행자","신종 감염병","불명열","에이즈","임파선염 클리닉)"],"major_research":"감염질환(백신","lab_info":"","publications":7,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"281","name_ko":"조관형","name_en":"","department":"핵의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=281","keywords":["종양핵의학"],"major_research":"종양핵의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"282","name_ko":"조금준","name_en":"","department":"산부인과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=282","keywords":["산과","고위험산모"],"major_research":"산과","lab_info":"","publications":0,"projects":0,"citations":0,"budget":6.6,"platforms":["데이터"]},{"id":"283","name_ko":"조민철","name_en":"","department":"진단검사의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=283","keywords":["임상미생물","분자미생물","진단면역","조직적합성"],"major_research":"임상미생물","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로"]},{"id":"284","name_ko":"조석우","name_en":"","department":"응급의학과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=284","keywords":["응급의학","소생학"],"major_research":"응급의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"285","name_ko":"조소윤","name_en":"","department":"소아청소년과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=285","keywords":["입원전담전문의"],"major_research":"입원전담전문의","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"286","name_ko":"조수진","name_en":"","department":"소아청소년과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=286","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"287","name_ko":"조신제","name_en":"","department":"외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=287","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"288","name_ko":"조영덕","name_en":"","department":"응급의학과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=288","keywords":["응급의학","소생학"],"major_research":"응급의학","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"289","name_ko":"조은정","name_en":"","department":"신장내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=289","keywords":["투석","혈뇨","단백뇨","신장질환","다낭신"],"major_research":"투석","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"290","name_ko":"조재구","name_en":"","department":"이비인후·두경부외과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=290","keywords":["두경부외과"],"major_research":"두경부외과","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"291","name_ko":"조재우","name_en":"","department":"정형외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=291","keywords":["외상(골절)","스포츠골절","골절합병증(부정유합","불유합)","골수염","골다공증"],"major_research":"외상(골절)","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생"]},{"id":"292","name_ko":"조준민","name_en":"","department":"중환자의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=292","keywords":["중환자의학","중증외상","응급수술"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"293","name_ko":"조현준","name_en":"","department":"신경외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=293","keywords":["뇌혈관질환(뇌동맥류","뇌경색","뇌출혈","뇌동정맥 기형","모야모야병","뇌혈관협착 등)","뇌혈관내수술","두부외상","두통"],"major_research":"뇌혈관질환(뇌동맥류","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"294","name_ko":"주문경","name_en":"","department":"소화기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=294","keywords":["위장관질환"],"major_research":"위장관질환","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"295","name_ko":"주연욱","name_en":"","department":"대장항문외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=295","keywords":["대장암","직장암","복막암","대장항문질환","탈장","복강경","로봇수술","대장내시경"],"major_research":"대장암","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","의사과학자"]},{"id":"296","name_ko":"진성기","name_en":"","department":"대장항문외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=296","keywords":["대장항문질환","대장암(직장암","항문암)","탈장"],"major_research":"대장항문질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"297","name_ko":"채성원","name_en":"","department":"이비인후·두경부외과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=297","keywords":["어지럼증","귀질환"],"major_research":"어지럼증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"298","name_ko":"최경묵","name_en":"","department":"내분비내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=298","keywords":["당뇨병","갑상선","내분비질환"],"major_research":"당뇨병","lab_info":"","publications":9,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"299","name_ko":"최광언","name_en":"","department":"안과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=299","keywords":["포도막염","당뇨망막병증","망막질환","백내장"],"major_research":"포도막염","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","면역/마이크로","신약","의사과학자"]},{"id":"300","name_ko":"최낙준","name_en":"","department":"응급중환자외상외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=300","keywords":["외상전문"],"major_research":"외상전문","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"301","name_ko":"최다민","name_en":"","department":"소아청소년과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=301","keywords":["미숙아","고위험신생아","정상신생아","일반소아청소년"],"major_research":"미숙아","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"302","name_ko":"최미현","name_en":"","department":"안과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=302","keywords":["포도막염","당뇨망막병증","망막질환","백내장"],"major_research":"포도막염","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["신약","의사과학자"]},{"id":"303","name_ko":"최민주","name_en":"","department":"감염내과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=303","keywords":["감염질환(백신","여행자","신종감염병","불명열","에이즈","임파선염 클리닉)"],"major_research":"감염질환(백신","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","의사과학자"]},{"id":"304","name_ko":"최새별","name_en":"","department":"간담췌외과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=304","keywords":["간","담낭","췌장질환(로봇수술)"],"major_research":"간","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"305","name_ko":"최성지","name_en":"","department":"소화기내과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=305","keywords":["급","만성췌장염","췌장암","췌장 남성 질환","담낭염","담낭담석","담낭암","담도염","담도 및 간내 담석","담도암과 유두주위암"],"major_research":"급","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"306","name_ko":"최성혁","name_en":"","department":"응급의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=306","keywords":["응급의학","외상학"],"major_research":"응급의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":9.6,"platforms":["데이터"]},{"id":"307","name_ko":"최승진","name_en":"","department":"신경외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=307","keywords":["신경외과 질환"],"major_research":"신경외과 질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["의사과학자"]},{"id":"308","name_ko":"최원석","name_en":"","department":"정형외과","position":"임상조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=308","keywords":["외상(골절)","골절 후 합병증 (불유합","부정유합","골감염 및 골수염)"],"major_research":"외상(골절)","lab_info":"","publications":1,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"309","name_ko":"최유정","name_en":"","department":"감염내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=309","keywords":["감염질환(백신","여행자","신종 감염병 클리닉)"],"major_research":"감염질환(백신","lab_info":"","publications":7,"projects":0,"citations":0,"budget":0.0,"platforms":["면역/마이크로","데이터","의사과학자"]},{"id":"310","name_ko":"최윤선","name_en":"","department":"가정의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=310","keywords":["가정의학 완화의료 노인병 부종클리닉(림프부종) 피로클리닉 암환자건강증진"],"major_research":"가정의학 완화의료 노인병 부종클리닉(림프부종) 피로클리닉 암환자건강증진","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"311","name_ko":"최은호","name_en":"","department":"간센터(내과)","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=311","keywords":["B형간염","C형간염","간암","간질환","지방간","간경화"],"major_research":"B형간염","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"312","name_ko":"최의경","name_en":"","department":"소아청소년과","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=312","keywords":["미숙아","신생아","고위험신생아","육아상담"],"major_research":"미숙아","lab_info":"","publications":2,"projects":0,"citations":0,"budget":0.0,"platforms":["데이터"]},{"id":"313","name_ko":"최인아","name_en":"","department":"류마티스내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=313","keywords":["전신홍반루푸스","전신혈관염","전신경화증","염증근염","류마티스관절염","강직성척추염"],"major_research":"전신홍반루푸스","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"314","name_ko":"최자연","name_en":"","department":"심혈관센터(순환기)","position":"부교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=314","keywords":["심장판막질환","심근병증","심장초음파","심부전","관상동맥질환"],"major_research":"심장판막질환","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.3,"platforms":[]},{"id":"315","name_ko":"최재웅","name_en":"","department":"영상의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=315","keywords":["복부 비뇨기계 영상의학"],"major_research":"복부 비뇨기계 영상의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"316","name_ko":"최주환","name_en":"","department":"호흡기·알레르기내과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=316","keywords":["폐결절","폐암","조기폐암","호흡기계 중재시술","악성중피종","흉선암"],"major_research":"폐결절","lab_info":"","publications":6,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"317","name_ko":"최철웅","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=317","keywords":["협심증","심근경색","허혈성심질환","심혈관중재시술"],"major_research":"협심증","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"318","name_ko":"최철원","name_en":"","department":"혈액내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=318","keywords":["백혈병","골수이형성증후군","골수증식종양","혈액질환","조혈모세포이식","임상환자진료"],"major_research":"백혈병","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"319","name_ko":"추원상","name_en":"","department":"심혈관센터(순환기)","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=319","keywords":["심근경색","협심증","심혈관중재시술","허혈성심질환","관상동맥질환"],"major_research":"심근경색","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"320","name_ko":"추지영","name_en":"","department":"영상의학과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=320","keywords":[],"major_research":"","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"321","name_ko":"하기수","name_en":"","department":"심혈관센터(순환기)","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=321","keywords":["심장질환","혈관질환"],"major_research":"심장질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀의료기기","정밀재생","데이터"]},{"id":"322","name_ko":"한승규","name_en":"","department":"성형외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=322","keywords":["피부암 및 피부병변","당뇨발","미용성형 ( 피부노화","레이저","눈코 성형 등)"],"major_research":"피부암 및 피부병변","lab_info":"","publications":7,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"323","name_ko":"한승욱","name_en":"","department":"간담췌외과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=323","keywords":["간","담낭질환"],"major_research":"간","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"324","name_ko":"한창수","name_en":"","department":"정신건강의학과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=324","keywords":["치매","우울증","기억력 장애","스트레스장애"],"major_research":"치매","lab_info":"","publications":4,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"325","name_ko":"함창화","name_en":"","department":"신경외과","position":"조교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=325","keywords":["척추변형","척추복잡재수술","척추외상","경추질환","요추질환"],"major_research":"척추변형","lab_info":"","publications":5,"projects":0,"citations":0,"budget":0.0,"platforms":["정밀재생","의사과학자"]},{"id":"326","name_ko":"허규영","name_en":"","department":"호흡기·알레르기내과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=326","keywords":["천식","알레르기","두드러기","약물/음식알레르기","만성기침","호산구증가증","혈관부종"],"major_research":"천식","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"327","name_ko":"현충수","name_en":"","department":"정형외과","position":"정보없음","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=327","keywords":["고관절(엉덩이관절)질환","고관절골절","인공고관절","고관절스포츠외상"],"major_research":"고관절(엉덩이관절)질환","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"328","name_ko":"홍정인","name_en":"","department":"중환자의학과","position":"기타","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=328","keywords":["중환자의학","심혈관 수술 후 관리"],"major_research":"중환자의학","lab_info":"","publications":0,"projects":0,"citations":0,"budget":0.0,"platforms":[]},{"id":"329","name_ko":"홍진화","name_en":"","department":"산부인과","position":"교수","email":"","phone":"","image_url":"https://api.dicebear.com/7.x/avataaars/svg?seed=329","keywords":["부인암 (자궁내막암","자궁경부암","난소암)","양성 부인종양","로봇-복강경수술"],"major_research":"부인암 (자궁내막암","lab_info":"","publications":3,"projects":0,"citations":0,"budget":0.0,"platforms":[]}];
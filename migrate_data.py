@@ -1,124 +1,209 @@
+import argparse
 import os
-import pandas as pd
-from openai import OpenAI
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import time
+from concurrent.futures import ThreadPoolExecutor
+import clients
+from clients import OPENAI_ENV, SUPABASE_ENV, supabase
+from embedding_batcher import BatchEmbedder
+from embedding_cache import DEFAULT_CACHE_PATH, EmbeddingCache
+from rate_limiter import RateLimiter, latency_summary
+from spreadsheet_cache import read_workbook
+from supabase_writer import ChunkedWriter, DEFAULT_CHUNK_SIZE
+from table_sync import content_hash, fetch_existing, plan_sync, delete_rows
+from near_duplicates import find_near_duplicates, project_groups
+from quantization import Quantizer
+from embedding_classifier import normalized_matrix
+from researcher_neighbors import DEFAULT_K, neighbor_lists, top_k_neighbors, upload_neighbors
+from record_builder import PLATFORM_COLUMNS, project_records, researcher_records
 
-# Load environment variables
-load_dotenv('.env.local')
+# Shared pooled clients (clients.py), created on first use
+client = clients.openai
+# Embeddings keyed by (model, normalized text); unchanged rows are never re-embedded
+# Opened on first use, like the clients, so importing this module creates nothing
+embedding_cache = clients.Lazy(lambda: EmbeddingCache(os.environ.get("EMBEDDING_CACHE_PATH", DEFAULT_CACHE_PATH)))
+embedder = BatchEmbedder(client, cache=embedding_cache)
+insert_latencies = []
+# Only the workbook columns the loaders read
+RESEARCHER_COLUMNS = ['name', 'department', 'title', 'specialty', 'major_research', 'image_url',
+                      'recent_papers_3yr', 'total_pi_count', 'href', *PLATFORM_COLUMNS]
+PROJECT_COLUMNS = ['title', 'project', 'researcher_name', 'pi', 'year', 'budget']
+chunk_size = DEFAULT_CHUNK_SIZE
+sync_mode = False
+dry_run = False
+neighbor_count = DEFAULT_K
+# How vectors are stored: float32 by default, float16 for halfvec columns, optionally truncated
+quantizer = Quantizer()
 
-url: str = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-key: str = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-openai_api_key: str = os.environ.get("OPENAI_API_KEY")
+def get_embeddings(texts):
+    # Batched: one request per embedder batch, results aligned with `texts`
+    return embedder.embed(texts)
 
-if not url or not key or not openai_api_key:
-    print("Error: Missing environment variables. Please check .env.local")
-    exit(1)
+def write_embedded(table, label, pending, texts, upsert=False):
+    # Rows are flushed in chunks as their embeddings arrive instead of one insert at the end
+    writer = ChunkedWriter(supabase, table, chunk_size=chunk_size, latencies=insert_latencies, upsert=upsert,
+                           quantizer=quantizer)
+    for i, embedding in embedder.iter_embed(texts):
+        record = pending[i]
+        if embedding is None:
+            print(f"Error processing {label} {record.get('name') or record.get('title')}: embedding failed")
+            continue
+        record["embedding"] = embedding
+        writer.add(record)
+    written = writer.close()
+    if writer.failed:
+        print(f"Failed to insert {writer.failed} {table}.")
+    return written
 
-supabase: Client = create_client(url, key)
-client = OpenAI(api_key=openai_api_key)
+def load_researchers():
+    df = read_workbook('total_df.xlsx', RESEARCHER_COLUMNS)
+    # Cleaned column by column (keywords, platform flags, counts, embedding text)
+    return researcher_records(df)
 
-def get_embedding(text, model="text-embedding-3-small"):
-    text = text.replace("\n", " ")
-    return client.embeddings.create(input=[text], model=model).data[0].embedding
+def load_projects():
+    df = read_workbook('ntis_results.xlsx', PROJECT_COLUMNS)
+    df = df.fillna('')
+
+    # Exact and near-duplicate titles (same year, PI and program) are one project; first row wins
+    duplicate_of, near_duplicates = find_near_duplicates(df['title'].tolist(), project_groups(df))
+    near_duplicates.write_report()
+    df = df[[d is None for d in duplicate_of]]
+    return project_records(df)
+
+def sync_hashes(pending, texts):
+    # A different storage format rewrites every row
+    vector_format = embedder.model if quantizer.name == 'float32' else f"{embedder.model}:{quantizer.name}"
+    return [content_hash(record, text, vector_format) for record, text in zip(pending, texts)]
+
+def stamp_sync_columns(pending, keys, hashes):
+    # Written by full reloads too, so the first --sync afterwards only touches real changes
+    for record, key, digest in zip(pending, keys, hashes):
+        record["sync_key"] = key
+        record["content_hash"] = digest
+
+def sync_table(table, label, pending, texts, keys):
+    # Diff against what is already in the table; only new/changed rows are embedded and written
+    hashes = sync_hashes(pending, texts)
+    existing = fetch_existing(supabase, table)
+    plan = plan_sync(keys, hashes, existing)
+    print(plan.summary(table))
+    if dry_run:
+        return 0
+
+    stamp_sync_columns(pending, keys, hashes)
+
+    written = 0
+    if plan.new:
+        written += write_embedded(table, label, [pending[i] for i in plan.new], [texts[i] for i in plan.new])
+    if plan.changed:
+        changed = []
+        for i, row_id in plan.changed:
+            pending[i]["id"] = row_id
+            changed.append(pending[i])
+        written += write_embedded(table, label, changed, [texts[i] for i, _ in plan.changed], upsert=True)
+    deleted = delete_rows(supabase, table, plan.delete_ids)
+    print(f"Synced {table}: {written} written, {deleted} deleted.")
+    return written
+
+def migrate_table(table, label, pending, texts, keys):
+    if sync_mode:
+        return sync_table(table, label, pending, texts, keys)
+
+    # Clear existing data first
+    print(f"Clearing existing {table}...")
+    supabase.table(table).delete().neq('id', 0).execute()
+
+    print(f"Embedding {len(texts)} {table}...")
+    if not pending:
+        print(f"No {label} data to insert.")
+        return 0
+    stamp_sync_columns(pending, keys, sync_hashes(pending, texts))
+    written = write_embedded(table, label, pending, texts)
+    print(f"Inserted {written} {table}.")
+    return written
+
+def build_neighbors(texts, keys):
+    # Vectors come back from the embedding cache the migration just filled
+    started = time.perf_counter()
+    matrix, present = normalized_matrix(get_embeddings(texts))
+    indices, scores = top_k_neighbors(matrix, neighbor_count, present)
+    written = upload_neighbors(supabase, neighbor_lists(keys, indices, scores))
+    print(f"Stored top-{neighbor_count} neighbours for {written} researchers ({time.perf_counter() - started:.1f}s).")
 
 def migrate_researchers():
     print("Migrating researchers...")
+    started = time.perf_counter()
+    written = 0
     try:
-        # Clear existing data first
-        print("Clearing existing researchers...")
-        supabase.table('researchers').delete().neq('id', 0).execute()
-
-        df = pd.read_excel('total_df.xlsx')
-        # Ensure required columns exist, fill NaNs
-        df = df.fillna('')
-        
-        researchers_data = []
-        for index, row in df.iterrows():
-            # Construct text for embedding
-            # Use new mapping: title -> position, specialty -> keywords
-            position = row.get('title', '')
-            keywords_raw = row.get('specialty', '')
-            keywords = [k.strip() for k in str(keywords_raw).split(',')] if keywords_raw else []
-            
-            embedding_text = f"{row.get('name', '')} {row.get('department', '')} {position} {keywords_raw} {row.get('major_research', '')}"
-            
-            try:
-                embedding = get_embedding(embedding_text)
-                
-                # Platform columns
-                platform_cols = ["정밀의료기기", "정밀재생", "면역-마이크로바이옴", "신약", "데이터", "혁신형의사과학자"]
-                platforms = []
-                for col in platform_cols:
-                    if row.get(col) == 1:
-                        platforms.append(col)
-
-                researcher = {
-                    "name": row.get('name', ''),
-                    "department": row.get('department', ''),
-                    "position": position, # Mapped from 'title'
-                    "keywords": keywords, # Mapped from 'specialty'
-                    "image_url": row.get('image_url', ''),
-                    "major_research": row.get('major_research', ''),
-                    "recent_papers_3yr": int(row.get('recent_papers_3yr', 0)) if pd.notna(row.get('recent_papers_3yr')) else 0,
-                    "total_pi_count": int(row.get('total_pi_count', 0)) if pd.notna(row.get('total_pi_count')) else 0,
-                    "platforms": platforms,
-                    "ku_url": row.get('href', ''), # Mapped from 'href'
-                    "embedding": embedding
-                }
-                researchers_data.append(researcher)
-                print(f"Processed researcher: {row.get('name')}")
-            except Exception as e:
-                print(f"Error processing researcher {row.get('name')}: {e}")
-
-        if researchers_data:
-            response = supabase.table('researchers').insert(researchers_data).execute()
-            print(f"Inserted {len(researchers_data)} researchers.")
-        else:
-            print("No researcher data to insert.")
-
+        pending, texts, keys = load_researchers()
+        written = migrate_table('researchers', 'researcher', pending, texts, keys)
+        if neighbor_count and not dry_run:
+            build_neighbors(texts, keys)
     except Exception as e:
         print(f"Error migrating researchers: {e}")
 
+    return 'researchers', written, time.perf_counter() - started
+
 def migrate_projects():
     print("Migrating projects...")
+    started = time.perf_counter()
+    written = 0
     try:
-        # Clear existing projects first
-        print("Clearing existing projects...")
-        supabase.table('projects').delete().neq('id', 0).execute()
-
-        df = pd.read_excel('ntis_results.xlsx')
-        df = df.fillna('')
-        
-        projects_data = []
-        for index, row in df.iterrows():
-            embedding_text = f"{row.get('title', '')} {row.get('project', '')}"
-            
-            try:
-                embedding = get_embedding(embedding_text)
-                
-                project = {
-                    "title": row.get('title', ''),
-                    "researcher_name": row.get('researcher_name', ''), # Use researcher_name if available
-                    "pi": row.get('pi', ''), # Map 'pi' column correctly
-                    "year": str(row.get('year', '')),
-                    "budget": str(row.get('budget', '')),
-                    "embedding": embedding
-                }
-                projects_data.append(project)
-                print(f"Processed project: {row.get('title')}")
-            except Exception as e:
-                print(f"Error processing project {row.get('title')}: {e}")
-
-        if projects_data:
-            response = supabase.table('projects').insert(projects_data).execute()
-            print(f"Inserted {len(projects_data)} projects.")
-        else:
-            print("No project data to insert.")
-
+        pending, texts, keys = load_projects()
+        written = migrate_table('projects', 'project', pending, texts, keys)
     except Exception as e:
         print(f"Error migrating projects: {e}")
 
+    return 'projects', written, time.perf_counter() - started
+
+def print_throughput_report(results):
+    print("Throughput report:")
+    for table, rows, seconds in results:
+        rate = rows / seconds if seconds > 0 else 0
+        print(f"  {table}: {rows} rows in {seconds:.1f}s ({rate:.1f} rows/s)")
+    print("  " + latency_summary("embeddings", embedder.latencies))
+    print("  " + latency_summary("inserts", insert_latencies))
+    if embedder.limiter is not None and embedder.limiter.throttle_count:
+        print(f"  rate limited (429) {embedder.limiter.throttle_count} times")
+    report = clients.latencies.report()
+    if report:
+        print("Requests by endpoint:\n  " + report.replace("\n", "\n  "))
+
 if __name__ == "__main__":
-    migrate_researchers()
-    migrate_projects()
+    parser = argparse.ArgumentParser(description="Migrate researchers and NTIS projects into Supabase.")
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help="Parallel embedding requests; >1 also migrates both tables in parallel")
+    parser.add_argument('--requests-per-minute', type=int, default=3000)
+    parser.add_argument('--tokens-per-minute', type=int, default=1000000)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Rows per insert request")
+    parser.add_argument('--sync', action='store_true',
+                        help="Upsert only new/changed rows and delete vanished ones instead of a full reload")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="With --sync, print the diff summary without writing anything")
+    parser.add_argument('--neighbors', type=int, default=DEFAULT_K,
+                        help="Similar researchers precomputed per researcher (0 to skip)")
+    parser.add_argument('--quantize', choices=['float32', 'float16'], default='float32',
+                        help="Stored vector precision; float16 for halfvec embedding columns")
+    parser.add_argument('--dimensions', type=int,
+                        help="Truncate embeddings to this many dimensions (the embedding columns must match)")
+    args = parser.parse_args()
+    clients.require_env(*SUPABASE_ENV, *OPENAI_ENV)
+
+    chunk_size = args.chunk_size
+    sync_mode = args.sync
+    dry_run = args.dry_run
+    neighbor_count = args.neighbors
+    quantizer = Quantizer(args.quantize, args.dimensions)
+
+    embedder.concurrency = args.concurrency
+    embedder.limiter = RateLimiter(args.requests_per_minute, args.tokens_per_minute)
+
+    if args.concurrency > 1:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(migrate_researchers), pool.submit(migrate_projects)]
+            results = [f.result() for f in futures]
+    else:
+        results = [migrate_researchers(), migrate_projects()]
+
+    print_throughput_report(results)
+    print(embedding_cache.stats())
@@ -0,0 +1,166 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+POSITION_LABELS = ['교수', '부교수', '조교수', '임상조교수', '기타', '정보없음']
+RANKED_POSITIONS = ['교수', '부교수', '조교수', '임상조교수']
+SOURCE_PLATFORMS = ['정밀의료기기', '정밀재생', '면역-마이크로바이옴', '신약', '데이터', '혁신형의사과학자']
+UI_PLATFORM_LABELS = ['데이터', '의사과학자', '정밀재생', '정밀의료기기', '면역/마이크로', '신약']
+PLATFORM_MAP = {
+    '정밀의료기기': '정밀의료기기',
+    '정밀재생': '정밀재생',
+    '면역-마이크로바이옴': '면역/마이크로',
+    '신약': '신약',
+    '데이터': '데이터',
+    '혁신형의사과학자': '의사과학자'
+}
+YEAR_BINS = [0, 1980, 1985, 1990, 1995, 2000, 2005, 2010, 2015, 9999]
+YEAR_LABELS = ['1980이전', '1980-84', '1985-89', '1990-94', '1995-99', '2000-04', '2005-09', '2010-14', '2015이후']
+
+
+def clean_str(x):
+    if pd.isna(x): return ""
+    return str(x).strip()
+
+
+def clean_float(x):
+    if pd.isna(x): return 0
+    return float(x)
+
+
+def clean_list(x):
+    if pd.isna(x): return []
+    return [s.strip() for s in str(x).split(',') if s.strip()]
+
+
+def clean_name(name):
+    # Names compare without spaces: "홍 길동" is "홍길동"
+    if pd.isna(name): return ""
+    return str(name).strip().replace(" ", "")
+
+
+def researcher_columns(year=2025):
+    # The total_df.xlsx columns build_researcher_frame reads
+    return ['name', 'department', 'title', 'specialty', f'paper_{year}',
+            f'budget_pi_{year % 100:02d}', 'EST_STRT_YR', *SOURCE_PLATFORMS]
+
+
+def factorized_text(df, col):
+    """Column-wise clean_str as (codes, cleaned uniques); NaN/missing map to "" (the last unique)."""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=np.int64), np.array([""], dtype=object)
+    codes, uniques = pd.factorize(df[col])
+    # Clean each distinct value once; code -1 (NaN) indexes the trailing ""
+    cleaned = np.array([str(u).strip() for u in uniques] + [""], dtype=object)
+    return codes, cleaned
+
+
+def text_column(df, col):
+    codes, cleaned = factorized_text(df, col)
+    return cleaned[codes]
+
+
+def number_column(df, col):
+    # Column-wise clean_float: NaN/missing -> 0
+    if col not in df.columns:
+        return np.zeros(len(df))
+    return pd.to_numeric(df[col], errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+def split_keywords(value):
+    return [s.strip() for s in value.split(',') if s.strip()] if value else []
+
+
+def position_label(raw_position):
+    if not raw_position:
+        return "정보없음"
+    if raw_position in RANKED_POSITIONS:
+        return raw_position
+    return "기타"
+
+
+def build_researcher_frame(total_df, year=2025):
+    """One columnar pass over total_df producing every per-researcher field the generator needs."""
+    n = len(total_df)
+    frame = pd.DataFrame(index=range(n))
+    frame['id'] = [str(i + 1) for i in range(n)]
+    names = text_column(total_df, 'name')
+    frame['name_ko'] = names
+    frame['department'] = text_column(total_df, 'department')
+
+    # Position Mapping, decided once per distinct title
+    codes, titles = factorized_text(total_df, 'title')
+    positions = [position_label(t) for t in titles]
+    frame['position'] = np.array(positions, dtype=object)[codes]
+
+    # Budget (Won -> Eok), rounded per researcher exactly like round(budget, 1)
+    budget = number_column(total_df, f'budget_pi_{year % 100:02d}') / 100000000
+    frame['budget'] = [round(b, 1) for b in budget.tolist()]
+    frame['publications'] = np.trunc(number_column(total_df, f'paper_{year}')).astype(np.int64)
+    frame['est_start_year'] = number_column(total_df, 'EST_STRT_YR')
+
+    codes, specialties = factorized_text(total_df, 'specialty')
+    keywords = [split_keywords(v) for v in specialties]
+    frame['keywords'] = [keywords[c] for c in codes.tolist()]
+
+    # Platform membership matrix in SOURCE_PLATFORMS order; each row's label list is
+    # looked up by its membership bitmask instead of being built per row
+    membership = np.zeros((n, len(SOURCE_PLATFORMS)), dtype=bool)
+    for j, p in enumerate(SOURCE_PLATFORMS):
+        membership[:, j] = number_column(total_df, p) == 1
+    labels = [PLATFORM_MAP[p] for p in SOURCE_PLATFORMS]
+    masks = membership.astype(np.int64) @ (1 << np.arange(len(SOURCE_PLATFORMS)))
+    by_mask = [[labels[j] for j in range(len(labels)) if m >> j & 1] for m in range(1 << len(labels))]
+    frame['platforms'] = [by_mask[m] for m in masks.tolist()]
+    return frame, membership
+
+
+def researcher_aggregates(frame):
+    """The year-independent parts: the career start distribution."""
+    years = frame['est_start_year'].to_numpy()
+    year_hist, _ = np.histogram(years[years > 1900], bins=YEAR_BINS)
+    return {'year_values': year_hist.tolist()}
+
+
+def synthetic_total_df(n, seed=0):
+    rng = np.random.default_rng(seed)
+    titles = np.array(['교수', '부교수', '조교수', '임상조교수', '연구교수', None], dtype=object)
+    departments = np.array([f"진료과{i}" for i in range(60)] + [None], dtype=object)
+    df = pd.DataFrame({
+        'name': [f"연구자{i}" for i in range(n)],
+        'department': departments[rng.integers(0, len(departments), n)],
+        'title': titles[rng.integers(0, len(titles), n)],
+        'specialty': ['AI, 영상, 심장'] * n,
+        'paper_2025': rng.integers(0, 30, n),
+        'budget_pi_25': rng.integers(0, 2000000000, n) * (rng.random(n) < 0.4),
+        'EST_STRT_YR': rng.choice([np.nan, 1975.0, 1988.0, 2001.0, 2016.0], n),
+    })
+    for p in SOURCE_PLATFORMS:
+        df[p] = np.where(rng.random(n) < 0.1, 1.0, np.nan)
+    return df
+
+
+def benchmark(n, year=2025):
+    # The production path: researcher frame, then the year's stats cube partition and its dashboard slice
+    from stats_cube import build_partitions, year_slice  # stats_cube imports this module
+    df = synthetic_total_df(n)
+    started = time.perf_counter()
+    frame, membership = build_researcher_frame(df, year)
+    researcher_aggregates(frame)
+    built = time.perf_counter()
+    cube = build_partitions(df, [year])[year]
+    cubed = time.perf_counter()
+    year_slice(cube, year)
+    done = time.perf_counter()
+    print(f"{n} researchers: frame {(built - started) * 1000:.0f} ms, cube {(cubed - built) * 1000:.0f} ms "
+          f"({len(cube)} cells), slice {(done - cubed) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the mock-data aggregation on synthetic researchers.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[1000, 100000])
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n)
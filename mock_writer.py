@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import zlib
+
+MOCKS_DIR = 'lib/mocks'
+MANIFEST_PATH = '.cache/mocks_manifest.json'
+GENERATED_HEADER = "// Generated by generate_mocks_v2.py; do not edit.\n"
+
+
+def to_json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def file_sha256(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def fingerprint(*parts):
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def stale_modules(manifest, fingerprints, directory=MOCKS_DIR):
+    """Modules whose inputs changed since the last run, or whose file is missing or was edited."""
+    stale = []
+    for module, digest in fingerprints.items():
+        entry = manifest.get(module) or {}
+        if entry.get('inputs') != digest or entry.get('output') != file_sha256(f"{directory}/{module}.ts"):
+            stale.append(module)
+    return stale
+
+
+class ModuleWriter:
+    """Streams one minified TS module to disk, tracking its raw and gzipped size.
+
+    Written to a temp file and moved into place on close, so a failed run never
+    leaves a half-written module behind. A module whose bytes did not change is
+    left untouched (`changed` is False), keeping its mtime and not triggering a rebuild.
+    """
+
+    def __init__(self, path, header=GENERATED_HEADER):
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(self.tmp_path, 'w', encoding='utf-8', newline='\n')
+        self._gzip = zlib.compressobj(9, zlib.DEFLATED, 31)
+        self._sha = hashlib.sha256()
+        self.changed = False
+        self.size = 0
+        self.gzip_size = 0
+        self.write(header)
+
+    def write(self, text):
+        self._file.write(text)
+        data = text.encode('utf-8')
+        self.size += len(data)
+        self.gzip_size += len(self._gzip.compress(data))
+        self._sha.update(data)
+
+    def export(self, name, value):
+        self.write(f"export const {name} = {to_json(value)};\n")
+
+    def export_array(self, name, items):
+        """Export an iterable as an array, serializing one item at a time."""
+        self.write(f"export const {name} = [")
+        for i, item in enumerate(items):
+            self.write((',' if i else '') + to_json(item))
+        self.write("];\n")
+
+    @property
+    def sha256(self):
+        return self._sha.hexdigest()
+
+    def close(self):
+        self.gzip_size += len(self._gzip.flush())
+        self._file.close()
+        if file_sha256(self.path) == self.sha256:
+            os.remove(self.tmp_path)
+        else:
+            os.replace(self.tmp_path, self.path)
+            self.changed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            os.remove(self.tmp_path)
+
+
+def write_index(directory, modules):
+    """index.ts re-exporting every module, for callers that still want everything."""
+    with ModuleWriter(os.path.join(directory, 'index.ts')) as writer:
+        for module in modules:
+            writer.write(f'export * from "./{module}";\n')
+    return writer
+
+
+def report_sizes(writers):
+    print("Artifacts:")
+    for writer in writers:
+        status = "" if writer.changed else ", unchanged"
+        print(f"  {writer.path}: {writer.size / 1024:.1f} KB ({writer.gzip_size / 1024:.1f} KB gzipped{status})")
+    print(f"  total: {sum(w.size for w in writers) / 1024:.1f} KB")
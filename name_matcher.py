@@ -0,0 +1,233 @@
+import argparse
+import json
+import os
+import random
+import time
+import unicodedata
+
+MATCHED = 'matched'
+AMBIGUOUS = 'ambiguous'
+UNMATCHED = 'unmatched'
+REPORT_PATH = '.cache/name_match_report.json'
+
+
+def normalize_name(name):
+    # Spacing, Unicode form and Latin case never tell two people apart
+    if name is None or name != name:
+        return ''
+    return ''.join(unicodedata.normalize('NFC', str(name)).split()).casefold()
+
+
+def jamo(key):
+    # Hangul syllables split into their letters: one mistyped vowel or final consonant is one edit
+    return unicodedata.normalize('NFD', key)
+
+
+def deletions(text):
+    """`text` and every string one character shorter than it."""
+    return {text} | {text[:i] + text[i + 1:] for i in range(len(text))}
+
+
+def edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def similarity(a, b):
+    """1 - jamo edit distance / longer length: 1.0 for equal names, 0.875 for one slip in a three-syllable name."""
+    a, b = jamo(a), jamo(b)
+    return 1 - edit_distance(a, b) / max(len(a), len(b), 1)
+
+
+class NameIndex:
+    """Resolves free-text researcher names (optionally with a department) to records.
+
+    Records with the same normalized name and department are one entity. With a department,
+    an exact name and department match resolves at once, and a query never resolves across
+    departments: exact names fall back to entities with no department on record, and names
+    one jamo edit away count only in the queried department. Without a department only
+    exact names resolve, because distinct people are often one jamo apart (한상욱 / 한승욱).
+    The best candidate must reach `threshold` with no other candidate within `margin` of
+    it; homonyms the department cannot separate come back AMBIGUOUS with every tied record.
+    Ambiguous results and near misses are collected in `report`.
+    """
+
+    # One jamo edit scores 1 - 1/jamo length: 0.75 for the shortest two-syllable names
+    # (4 jamo) up to 0.889 for three syllables with final consonants (9 jamo). The threshold
+    # admits one edit in any name of two or more syllables; the margin covers the whole
+    # one-edit range, so two different names one edit away are never told apart by length.
+    def __init__(self, records, threshold=0.75, margin=0.15):
+        self.threshold = threshold
+        self.margin = margin
+        self.entities = []    # (name, department, record ids) as first seen
+        self.by_name = {}     # normalized name -> entity indices
+        self._entity_keys = []
+        seen = {}
+        for i, (name, department) in enumerate(records):
+            key = (normalize_name(name), normalize_name(department))
+            if not key[0]:
+                continue
+            e = seen.get(key)
+            if e is None:
+                e = seen[key] = len(self.entities)
+                self.entities.append((str(name).strip(), '' if department is None or department != department
+                                      else str(department).strip(), []))
+                self._entity_keys.append(key)
+                self.by_name.setdefault(key[0], []).append(e)
+            self.entities[e][2].append(i)
+
+        # Deletion neighbourhood: two names within one jamo edit share a one-deletion variant
+        self.variants = {}
+        for name in self.by_name:
+            for variant in deletions(jamo(name)):
+                self.variants.setdefault(variant, []).append(name)
+        self.report = []
+
+    def similar_names(self, key):
+        """[(normalized name, similarity)] for every indexed name within one jamo edit of `key`."""
+        text = jamo(key)
+        candidates = set()
+        for variant in deletions(text):
+            candidates.update(self.variants.get(variant, ()))
+        scored = []
+        for name in candidates:
+            other = jamo(name)
+            distance = edit_distance(text, other)
+            if distance <= 1:
+                scored.append((name, 1 - distance / max(len(text), len(other))))
+        return scored
+
+    def resolve(self, name, department=None):
+        """(status, confidence, record ids) for one name; ids are empty when UNMATCHED."""
+        key = normalize_name(name)
+        if not key:
+            return UNMATCHED, 0.0, []
+        department_key = normalize_name(department)
+        exact = [(1.0, e) for e in self.by_name.get(key, ())]
+        fuzzy = []
+        candidates = exact
+        if department_key:
+            same = [c for c in exact if self._entity_keys[c[1]][1] == department_key]
+            if same:
+                return MATCHED, 1.0, list(self.entities[same[0][1]][2])
+            candidates = [c for c in exact if not self._entity_keys[c[1]][1]]
+            if not candidates:
+                fuzzy = [(score, e) for other, score in self.similar_names(key) if other != key
+                         for e in self.by_name[other]]
+                candidates = [c for c in fuzzy if self._entity_keys[c[1]][1] == department_key]
+        elif not exact:
+            fuzzy = [(score, e) for other, score in self.similar_names(key) for e in self.by_name[other]]
+        if not candidates:
+            # Homonyms in other departments or similar names without a department: reported, never resolved
+            if exact or fuzzy:
+                self._note(name, department, UNMATCHED, sorted(exact + fuzzy, key=lambda c: -c[0]))
+            return UNMATCHED, 0.0, []
+        candidates.sort(key=lambda c: -c[0])
+        best = candidates[0][0]
+        close = [c for c in candidates if c[0] >= best - self.margin]
+        if best < self.threshold:
+            self._note(name, department, UNMATCHED, candidates)
+            return UNMATCHED, best, []
+        ids = [i for _, e in close for i in self.entities[e][2]]
+        if len(close) > 1:
+            self._note(name, department, AMBIGUOUS, close)
+            return AMBIGUOUS, best, ids
+        return MATCHED, best, ids
+
+    def _note(self, name, department, status, candidates):
+        self.report.append({
+            'name': name,
+            'department': department,
+            'status': status,
+            'candidates': [{'name': self.entities[e][0], 'department': self.entities[e][1],
+                            'score': round(score, 3), 'records': self.entities[e][2]}
+                           for score, e in candidates[:5]],
+        })
+
+    def summary(self):
+        ambiguous = sum(1 for r in self.report if r['status'] == AMBIGUOUS)
+        return (f"{ambiguous} ambiguous names, {len(self.report) - ambiguous} near misses "
+                "(similar names or homonyms that did not resolve)")
+
+    def write_report(self, path=REPORT_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report, f, ensure_ascii=False, indent=1)
+        print(f"Name match report: {self.summary()} -> {path}")
+
+
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권', '황', '안', '송', '류', '홍']
+GIVEN_SYLLABLES = list('민서준현지우수영은정하윤재성훈호진경아예도혜상태동석원주연희나승용규환철기미선유인빈혁찬형종범채소다율나라')
+DEPARTMENTS = ['내과', '외과', '소아청소년과', '신경과', '안과', '영상의학과', '병리과', '마취통증의학과',
+               '정신건강의학과', '피부과', '비뇨의학과', '재활의학과', '응급의학과', '산부인과']
+
+
+def mistype(name, rng):
+    """Change one vowel of one Hangul syllable."""
+    i = rng.randrange(len(name))
+    code = ord(name[i]) - 0xAC00
+    if not 0 <= code < 11172:
+        return name
+    lead, vowel, tail = code // 588, code % 588 // 28, code % 28
+    return name[:i] + chr(0xAC00 + lead * 588 + (vowel + 1) % 21 * 28 + tail) + name[i + 1:]
+
+
+def synthetic_records(n, seed=0):
+    rng = random.Random(seed)
+    return [(rng.choice(SURNAMES) + ''.join(rng.choices(GIVEN_SYLLABLES, k=rng.choice([1, 2, 2, 2, 2, 2, 2, 2, 2, 3]))),
+             rng.choice(DEPARTMENTS)) for _ in range(n)]
+
+
+def synthetic_queries(records, n, seed=1):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n):
+        name, department = rng.choice(records)
+        kind = rng.random()
+        if kind < 0.2:
+            name = name[0] + ' ' + name[1:]
+        elif kind < 0.4:
+            name = mistype(name, rng)
+        elif kind < 0.5:
+            name, department = synthetic_records(1, rng.random())[0]
+        queries.append((name, department if rng.random() < 0.7 else None))
+    return queries
+
+
+def benchmark(n, queries=20000, check=10):
+    records = synthetic_records(n)
+    started = time.perf_counter()
+    index = NameIndex(records)
+    built = time.perf_counter() - started
+    sample = synthetic_queries(records, queries)
+    started = time.perf_counter()
+    results = [index.resolve(name, department) for name, department in sample]
+    elapsed = time.perf_counter() - started
+    # Candidate generation must not lose names a full scan would find
+    for name, _ in sample[:check]:
+        key = normalize_name(name)
+        text = jamo(key)
+        expected = set()
+        for other in index.by_name:
+            if abs(len(jamo(other)) - len(text)) <= 1 and edit_distance(text, jamo(other)) <= 1:
+                expected.add((other, similarity(key, other)))
+        assert set(index.similar_names(key)) == expected, f"index missed candidates for {name}"
+    counts = {}
+    for status, _, _ in results:
+        counts[status] = counts.get(status, 0) + 1
+    print(f"{n} records ({len(index.entities)} entities, {len(index.by_name)} names): built in {built:.2f}s, "
+          f"{elapsed / len(sample) * 1e6:.0f} us/lookup over {len(sample)} queries, {counts}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the researcher name index on synthetic names.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[100000])
+    parser.add_argument('--queries', type=int, default=20000)
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n, args.queries)
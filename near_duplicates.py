@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import random
+import time
+import unicodedata
+
+import numpy as np
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16
+THRESHOLD = 0.8
+REPORT_PATH = '.cache/near_duplicates.json'
+_PRIME = (1 << 31) - 1
+
+
+def normalize_title(title):
+    # Whitespace and case differences between sub-task exports are not distinct projects
+    if title is None or title != title:
+        return ''
+    return ''.join(unicodedata.normalize('NFC', str(title)).split()).casefold()
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    if len(text) <= k:
+        return frozenset([text])
+    return frozenset(text[i:i + k] for i in range(len(text) - k + 1))
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class MinHasher:
+    """MinHash signatures of character k-shingles, from `num_perm` multiply-shift hash functions.
+
+    Shingles are hashed with a rolling polynomial over code points for a whole block of
+    titles at once, so no per-shingle Python objects are created.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, k=SHINGLE_SIZE, seed=1):
+        rng = np.random.default_rng(seed)
+        self.k = k
+        self.base = int(rng.integers(1 << 20, _PRIME))
+        self.a = rng.integers(1, 1 << 63, num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 1 << 63, num_perm, dtype=np.int64).astype(np.uint64)
+        # Odd multipliers folding each band's rows into one 64-bit bucket hash
+        self.mix = rng.integers(1, 1 << 62, num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+
+    def signatures(self, texts, block=2000):
+        """(len(texts), num_perm) signatures of normalized titles."""
+        k = self.k
+        out = np.empty((len(texts), len(self.a)), dtype=np.uint64)
+        for start in range(0, len(texts), block):
+            # Titles shorter than k are one (padded) shingle, as in shingles()
+            part = [t.ljust(k, '\x00') for t in texts[start:start + block]]
+            codes = np.frombuffer(''.join(part).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+            rolling = codes[:len(codes) - k + 1].copy()
+            for j in range(1, k):
+                rolling = (rolling * self.base + codes[j:len(codes) - k + 1 + j]) % _PRIME
+            # Keep only shingles that start and end inside one title
+            counts = np.array([len(t) - k + 1 for t in part])
+            firsts = np.cumsum(counts) - counts
+            title_starts = np.cumsum([0] + [len(t) for t in part[:-1]])
+            positions = np.arange(counts.sum()) + np.repeat(title_starts - firsts, counts)
+            # (a * x + b) mod 2**64, top 32 bits
+            # (num_perm, shingles) so the per-title minimum runs along contiguous rows
+            values = (np.outer(self.a, rolling[positions].astype(np.uint64)) + self.b[:, None]) >> np.uint64(32)
+            out[start:start + len(part)] = np.minimum.reduceat(values, firsts, axis=1).T
+        return out
+
+    def band_hashes(self, signatures, bands):
+        """(n, bands) bucket hashes; equal band rows give equal hashes (wrapping uint64 arithmetic)."""
+        mixed = signatures * self.mix
+        return mixed.reshape(len(signatures), bands, -1).sum(axis=2, dtype=np.uint64)
+
+
+class NearDuplicateIndex:
+    """Incremental near-duplicate detection with MinHash LSH banding.
+
+    Items are added in order; an item whose title shingles have Jaccard similarity of at
+    least `threshold` with an earlier kept item of the same `group` is a duplicate of it
+    (first occurrence wins, like drop_duplicates). Only items sharing an LSH band bucket
+    are compared, so the work grows with the number of near matches, not pairs.
+    """
+
+    def __init__(self, threshold=THRESHOLD, num_perm=NUM_PERM, bands=BANDS):
+        self.threshold = threshold
+        self.bands = bands
+        self.hasher = MinHasher(num_perm)
+        self.buckets = {}    # group -> {band hash: [kept item ids]}
+        self.kept = {}       # item id -> [normalized title, shingles (built on first comparison), label]
+        self.clusters = {}   # kept item id -> [(item id, label, similarity)]
+        self.count = 0
+        self.comparisons = 0
+        self.elapsed = 0.0
+
+    def band_hashes(self, texts):
+        return self.hasher.band_hashes(self.hasher.signatures(texts), self.bands)
+
+    def _shingles(self, item):
+        entry = self.kept[item]
+        if entry[1] is None:
+            entry[1] = shingles(entry[0])
+        return entry[1]
+
+    def add(self, title, group=None, label=None, band_hashes=None):
+        """Id of the earlier item `title` duplicates, or None if it is kept."""
+        started = time.perf_counter()
+        item = self.count
+        self.count += 1
+        text = normalize_title(title)
+        if band_hashes is None:
+            band_hashes = self.band_hashes([text])[0]
+        label = title if label is None else label
+        hashes = band_hashes.tolist()
+        buckets = self.buckets.get(group)
+        if buckets is None:
+            buckets = self.buckets[group] = {}
+        candidates = set()
+        for h in hashes:
+            if h in buckets:
+                candidates.update(buckets[h])
+        if candidates:
+            shingle_set = shingles(text)
+            # Earliest kept item first
+            for other in sorted(candidates):
+                self.comparisons += 1
+                similarity = jaccard(shingle_set, self._shingles(other))
+                if similarity >= self.threshold:
+                    self.clusters.setdefault(other, []).append((item, label, similarity))
+                    self.elapsed += time.perf_counter() - started
+                    return other
+        self.kept[item] = [text, None, label]
+        for h in hashes:
+            if h in buckets:
+                buckets[h].append(item)
+            else:
+                buckets[h] = [item]
+        self.elapsed += time.perf_counter() - started
+        return None
+
+    @property
+    def duplicates(self):
+        return sum(len(members) for members in self.clusters.values())
+
+    def summary(self):
+        return (f"{self.duplicates} near-duplicates in {len(self.clusters)} clusters out of {self.count} rows "
+                f"({self.comparisons} comparisons, {self.elapsed * 1000:.0f} ms)")
+
+    def write_report(self, path=REPORT_PATH):
+        report = [{'kept': self.kept[rep][2], 'row': rep,
+                   'duplicates': [{'title': label, 'row': item, 'similarity': round(similarity, 3)}
+                                  for item, label, similarity in members]}
+                  for rep, members in self.clusters.items()]
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"Near-duplicate report: {self.summary()} -> {path}")
+
+
+def find_near_duplicates(titles, groups, threshold=THRESHOLD):
+    """Batch form: (duplicate_of per row, None for kept rows; the index with clusters and timings)."""
+    index = NearDuplicateIndex(threshold)
+    started = time.perf_counter()
+    band_hashes = index.band_hashes([normalize_title(t) for t in titles])
+    index.elapsed += time.perf_counter() - started
+    duplicate_of = [index.add(title, group, band_hashes=hashes)
+                    for title, group, hashes in zip(titles, groups, band_hashes)]
+    return duplicate_of, index
+
+
+def project_groups(df):
+    # Sub-task exports of one project share year, PI and program (an NTIS frame after fillna(''))
+    return list(zip(df['year'].astype(str), df['pi'].astype(str).str.replace(" ", ""),
+                    df['project'].astype(str).str.strip()))
+
+
+def synthetic_projects(n, seed=0):
+    rng = random.Random(seed)
+    words = ['인공지능', '기반', '진단', '플랫폼', '개발', '임상', '바이오마커', '오가노이드', '재생', '치료제',
+             '면역', '백신', '영상', '로봇', '데이터', '정밀의료', '융합', '고도화', '실증', '표준화']
+    titles, groups = [], []
+    while len(titles) < n:
+        title = ' '.join(rng.sample(words, rng.randint(4, 8))) + f" 연구 {rng.randint(1, 10 ** 6)}"
+        group = (rng.choice([2023, 2024, 2025]), f"연구자{rng.randint(0, 5000)}")
+        titles.append(title)
+        groups.append(group)
+        # Sub-task variants: spacing, a suffix, one changed character
+        for _ in range(rng.choice([0, 0, 0, 1, 2])):
+            variant = rng.choice([title.replace(' ', '  ', 1), title + '(1세부)', title[:-1] + '9'])
+            titles.append(variant)
+            groups.append(group)
+    return titles[:n], groups[:n]
+
+
+def benchmark(n, check=3000):
+    titles, groups = synthetic_projects(n)
+    started = time.perf_counter()
+    duplicate_of, index = find_near_duplicates(titles, groups)
+    elapsed = time.perf_counter() - started
+    # Recall on a prefix against the all-pairs comparison
+    sets = [shingles(normalize_title(t)) for t in titles[:check]]
+    expected = []
+    for i in range(len(sets)):
+        kept = [j for j in range(i) if expected[j] is None and groups[j] == groups[i]
+                and jaccard(sets[i], sets[j]) >= THRESHOLD]
+        expected.append(kept[0] if kept else None)
+    missed = sum(1 for got, want in zip(duplicate_of, expected) if want is not None and got is None)
+    print(f"{n} titles: {elapsed:.2f}s, {index.summary()}; "
+          f"missed {missed} of {sum(e is not None for e in expected)} duplicates in the first {check}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MinHash/LSH near-duplicate detection on synthetic NTIS titles.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[100000, 1000000])
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n)
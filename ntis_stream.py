@@ -0,0 +1,207 @@
+import argparse
+import heapq
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from openpyxl import load_workbook
+from keyword_classifier import KeywordClassifier, PLATFORM_KEYWORDS
+from mock_aggregates import clean_float, clean_name, clean_str
+from name_matcher import MATCHED
+from near_duplicates import normalize_title
+
+NTIS_COLUMNS = ['title', 'project', 'year', 'budget', 'pi']
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def dedup_value(x):
+    # NaN != NaN, but drop_duplicates treats missing values as equal
+    return None if pd.isna(x) else x
+
+
+def iter_ntis_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, columns=NTIS_COLUMNS):
+    """Open the NTIS export (xlsx or csv) and return an iterator of row-chunk DataFrames.
+
+    The file is opened here, so a missing file fails at the call, not on first iteration.
+    """
+    if path.lower().endswith('.csv'):
+        reader = pd.read_csv(path, chunksize=chunk_size, usecols=lambda c: c in columns)
+        return iter(reader)
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    return _xlsx_chunks(workbook, chunk_size, columns)
+
+
+def _xlsx_chunks(workbook, chunk_size, columns):
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        wanted = [i for i, name in enumerate(header) if name in columns]
+        names = [header[i] for i in wanted]
+        chunk = []
+        for row in rows:
+            values = [row[i] if i < len(row) else None for i in wanted]
+            if all(v is None for v in values):
+                continue
+            chunk.append(values)
+            if len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=names)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=names)
+    finally:
+        workbook.close()
+
+
+class RecruitmentAnalyzer:
+    """Builds recruitmentData from NTIS row chunks with flat memory.
+
+    Only the dedup set (keys of matching projects) grows; totals are accumulated as
+    chunks arrive and the top projects are kept in a bounded heap.
+
+    `targets` are clean researcher names matched exactly against `pi`, or, with a
+    `matcher` (name_matcher.NameIndex), the record ids of the target researchers:
+    a PI counts only if it resolves unambiguously to one of them. With
+    `near_duplicates` (a near_duplicates.NearDuplicateIndex), projects whose title
+    nearly repeats an earlier one of the same year, PI and program are dropped too.
+    """
+
+    def __init__(self, targets, platforms, year=2025, top_k=20, classifier=None, matcher=None,
+                 near_duplicates=None):
+        self.targets = targets
+        self.matcher = matcher
+        self.near_duplicates = near_duplicates
+        self._resolved = {}
+        self.year = year
+        self.top_k = top_k
+        self.classifier = classifier or KeywordClassifier(PLATFORM_KEYWORDS)
+        self.potential = {p: 0 for p in platforms}
+        self.total = 0
+        self.years = {}
+        self.seen = set()
+        self.rows = 0
+        self.found = 0
+        self.duplicates = 0
+        self._top = []
+        self._seq = 0
+
+    def add_chunk(self, chunk):
+        self.rows += len(chunk)
+        # Ensure year is numeric
+        years = pd.to_numeric(chunk['year'], errors='coerce')
+        for y in years.unique().tolist():
+            self.years.setdefault(dedup_value(y), None)
+        in_year = chunk[years == self.year]
+        if self.matcher is None:
+            target = in_year[in_year['pi'].apply(clean_name).isin(self.targets)]
+        else:
+            target = in_year[in_year['pi'].map(self.is_target).astype(bool)]
+        target_years = years[target.index]
+
+        # Remove duplicates (title, project, year, pi), first occurrence wins
+        rows = []
+        for title, project, y, pi, budget in zip(target['title'], target['project'], target_years,
+                                                 target['pi'], target['budget']):
+            key = (dedup_value(title), dedup_value(project), dedup_value(y), dedup_value(pi))
+            if key in self.seen:
+                self.duplicates += 1
+                continue
+            self.seen.add(key)
+            rows.append((title, project, y, pi, budget))
+        if self.near_duplicates is not None and rows:
+            # Sub-task rows whose titles differ only slightly (spacing, suffixes) are one project
+            hashes = self.near_duplicates.band_hashes([normalize_title(r[0]) for r in rows])
+            rows = [r for r, h in zip(rows, hashes)
+                    if self.near_duplicates.add(r[0], (dedup_value(r[2]), clean_name(r[3]), clean_str(r[1])),
+                                                band_hashes=h) is None]
+        kept = [(clean_str(title), pi, budget, project) for title, project, _, pi, budget in rows]
+        self.found += len(kept)
+
+        best_matches = self.classifier.classify([title for title, _, _, _ in kept],
+                                                [clean_str(project) for _, _, _, project in kept])
+        for (title, pi, raw_budget, raw_project), best_match in zip(kept, best_matches):
+            if not best_match:
+                continue
+            budget = clean_float(raw_budget) / 100000000
+            self.potential[best_match] += budget
+            project = {
+                'title': title,
+                'pi': clean_str(pi),
+                'budget': round(budget, 1),
+                'platform': best_match,
+                'project_name': clean_str(raw_project)
+            }
+            # Sums of one-decimal values: arrival order vs. sorted order cannot change the rounding
+            self.total += project['budget']
+            # Min-heap of the best top_k; on equal budgets the earlier project ranks higher
+            entry = (project['budget'], -self._seq, project)
+            self._seq += 1
+            if len(self._top) < self.top_k:
+                heapq.heappush(self._top, entry)
+            elif entry[:2] > self._top[0][:2]:
+                heapq.heapreplace(self._top, entry)
+
+    def is_target(self, pi):
+        pi = dedup_value(pi)
+        if pi not in self._resolved:
+            status, _, ids = self.matcher.resolve(pi)
+            self._resolved[pi] = status == MATCHED and all(i in self.targets for i in ids)
+        return self._resolved[pi]
+
+    def top_projects(self):
+        return [project for _, _, project in sorted(self._top, key=lambda e: e[:2], reverse=True)]
+
+    def result(self):
+        return {
+            'totalPotential': round(self.total, 1),
+            'platformPotential': {k: round(v, 1) for k, v in self.potential.items()},
+            'topProjects': self.top_projects()
+        }
+
+
+def analyze_ntis(path, targets, platforms, chunk_size=DEFAULT_CHUNK_SIZE, year=2025, matcher=None):
+    analyzer = RecruitmentAnalyzer(targets, platforms, year=year, matcher=matcher)
+    for chunk in iter_ntis_chunks(path, chunk_size):
+        analyzer.add_chunk(chunk)
+    return analyzer
+
+
+def write_synthetic_csv(path, n, seed=0):
+    rng = random.Random(seed)
+    words = [k for words in PLATFORM_KEYWORDS.values() for k in words] + ['연구', '개발', '임상', '기반']
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("name,href_no,title,year,budget,project,pi\n")
+        for i in range(n):
+            title = ' '.join(rng.sample(words, 3))
+            f.write(f"연구자{i % 5000},{i},{title},{rng.choice([2023, 2024, 2025])},"
+                    f"{rng.randint(0, 3000000000)},사업{i % 40},연구자{i % 5000}\n")
+
+
+def benchmark(n, chunk_size):
+    targets = {f"연구자{i}" for i in range(0, 5000, 2)}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ntis.csv')
+        write_synthetic_csv(path, n)
+        started = time.perf_counter()
+        analyzer = analyze_ntis(path, targets, list(PLATFORM_KEYWORDS), chunk_size)
+        elapsed = time.perf_counter() - started
+        # Second pass only for the allocation peak; tracing slows the run down
+        tracemalloc.start()
+        analyze_ntis(path, targets, list(PLATFORM_KEYWORDS), chunk_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"{n} rows: {elapsed:.2f}s, peak {peak / 1e6:.1f} MB, {analyzer.found} target projects, "
+          f"{analyzer.duplicates} duplicates")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the streaming NTIS recruitment analyzer.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n, args.chunk_size)
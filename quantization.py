@@ -0,0 +1,158 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from embedding_batcher import DEFAULT_MODEL
+from embedding_cache import DEFAULT_CACHE_PATH, EmbeddingCache
+from embedding_classifier import normalized_matrix, project_text, unit_rows
+from record_builder import RESEARCHER_TEXT_COLUMNS, researcher_texts
+from spreadsheet_cache import read_workbook
+from supabase_writer import encode_vector
+
+KINDS = ['float32', 'float16', 'int8']
+# Symmetric int8 range (-128 unused), so zero is exact and the scale is one number per dimension
+INT8_MAX = 127
+
+
+def truncate(matrix, dims=None):
+    """First `dims` components, renormalized: what text-embedding-3 returns for `dimensions=dims`."""
+    if dims is None or dims >= matrix.shape[1]:
+        return matrix
+    return unit_rows(matrix[:, :dims])
+
+
+class Quantizer:
+    """Storage format for unit embeddings: float32, float16 or int8, optionally truncated to `dims`.
+
+    int8 is symmetric scalar quantization with one scale per dimension, fitted to the
+    largest magnitude of that dimension (`fit`). Scores against stored vectors are
+    computed from the stored values directly (`scores`), without decoding them.
+    """
+
+    def __init__(self, kind='float32', dims=None, scale=None):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown quantization {kind!r}; expected one of {KINDS}")
+        self.kind = kind
+        self.dims = dims
+        self.scale = scale
+
+    @property
+    def name(self):
+        return self.kind if self.dims is None else f"{self.kind}/{self.dims}"
+
+    @property
+    def dtype(self):
+        return np.dtype(self.kind)
+
+    def fit(self, matrix):
+        if self.kind == 'int8':
+            largest = np.abs(truncate(np.asarray(matrix, dtype=np.float32), self.dims)).max(axis=0)
+            self.scale = np.where(largest > 0, largest / INT8_MAX, 1).astype(np.float32)
+        return self
+
+    def encode(self, matrix):
+        matrix = truncate(np.asarray(matrix, dtype=np.float32), self.dims)
+        if self.kind == 'int8':
+            return np.clip(np.rint(matrix / self.scale), -INT8_MAX, INT8_MAX).astype(np.int8)
+        return matrix.astype(self.dtype)
+
+    def decode(self, stored):
+        stored = np.asarray(stored, dtype=np.float32)
+        return stored * self.scale if self.kind == 'int8' else stored
+
+    def query(self, vectors):
+        """Full-precision query vector(s) in the stored space: truncated and unit length."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        queries = unit_rows(truncate(np.atleast_2d(vectors), self.dims))
+        return queries[0] if vectors.ndim == 1 else queries
+
+    def scores(self, stored, queries):
+        """stored @ queries.T for `query()` vectors; int8 folds the scales into the queries."""
+        weights = queries * self.scale if self.kind == 'int8' else queries
+        return stored.astype(np.float32, copy=False) @ weights.T
+
+    def bytes_per_vector(self, dims):
+        return (self.dims or dims) * self.dtype.itemsize
+
+
+def payload_bytes(stored):
+    # Mean size of the vector text ChunkedWriter sends per row
+    return sum(len(encode_vector(v)) for v in stored) / max(1, len(stored))
+
+
+def top_k(scores, k):
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def overlap(matrix, quantizer, k=10, queries=1000, seed=0):
+    """Mean top-k overlap with full precision for `queries` rows searched against all rows."""
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(len(matrix), min(queries, len(matrix)), replace=False)
+    expected = matrix[sample] @ matrix.T
+    stored = quantizer.encode(matrix)
+    got = quantizer.scores(stored, quantizer.query(matrix[sample])).T
+    # Each query is its own best match under every format; leave it out
+    expected[np.arange(len(sample)), sample] = -np.inf
+    got[np.arange(len(sample)), sample] = -np.inf
+    k = min(k, len(matrix) - 1)
+    same = [len(set(a) & set(b)) for a, b in zip(top_k(expected, k).tolist(), top_k(got, k).tolist())]
+    return sum(same) / (k * len(sample)), stored
+
+
+def evaluate(name, matrix, configs, k=10):
+    full = matrix.shape[1]
+    print(f"{name}: {len(matrix)} vectors x {full} dims, top-{k} overlap with float32/{full}")
+    for kind, dims in configs:
+        quantizer = Quantizer(kind, dims).fit(matrix)
+        started = time.perf_counter()
+        score, stored = overlap(matrix, quantizer, k)
+        elapsed = time.perf_counter() - started
+        size = quantizer.bytes_per_vector(full)
+        print(f"  {quantizer.name:>13}: {size:6d} B/vector ({full * 4 / size:4.1f}x smaller), "
+              f"upload {payload_bytes(stored[:200]):7.0f} B/vector, overlap {score:.3f} ({elapsed:.2f}s)")
+
+
+def cached_matrices(cache_path, model=DEFAULT_MODEL):
+    """Researcher and project vectors migrate_data.py left in the embedding cache."""
+    cache = EmbeddingCache(cache_path)
+    total = read_workbook('total_df.xlsx', RESEARCHER_TEXT_COLUMNS)
+    ntis = read_workbook('ntis_results.xlsx', ['title', 'project'])
+    texts = {
+        'researchers': researcher_texts(total),
+        'projects': [project_text(t, p) for t, p in zip(ntis['title'], ntis['project'])],
+    }
+    matrices = {}
+    for name, items in texts.items():
+        matrix, present = normalized_matrix(cache.get_many(model, items))
+        if present.sum() > 1:
+            matrices[name] = matrix[present]
+    return matrices
+
+
+def synthetic_matrix(n, dims=1536, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // 50), dims)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), n)] + 1.5 * rng.standard_normal((n, dims)).astype(np.float32)
+    return unit_rows(vectors)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare quantized / truncated embedding storage with full precision.")
+    parser.add_argument('--synthetic', type=int, nargs='*',
+                        help="Evaluate on synthetic 1536-dim vectors of these sizes instead of the embedding cache")
+    parser.add_argument('--dimensions', type=int, nargs='+', default=[1536, 512, 256],
+                        help="Truncation sizes to compare")
+    parser.add_argument('-k', type=int, default=10)
+    args = parser.parse_args()
+    if args.synthetic is not None:
+        matrices = {f"synthetic {n}": synthetic_matrix(n) for n in args.synthetic or [10000]}
+    else:
+        matrices = cached_matrices(os.environ.get("EMBEDDING_CACHE_PATH", DEFAULT_CACHE_PATH))
+        if not matrices:
+            print("No cached embeddings; run migrate_data.py first or pass --synthetic")
+    for name, matrix in matrices.items():
+        configs = [(kind, dims if dims < matrix.shape[1] else None)
+                   for dims in args.dimensions for kind in KINDS]
+        evaluate(name, matrix, list(dict.fromkeys(configs)), args.k)
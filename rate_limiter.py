@@ -0,0 +1,83 @@
+import threading
+import time
+
+# OpenAI tier-1 limits for text-embedding-3-small
+DEFAULT_REQUESTS_PER_MINUTE = 3000
+DEFAULT_TOKENS_PER_MINUTE = 1000000
+
+
+class TokenBucket:
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.rate = per_minute / 60.0  # refill per second
+        self.updated = time.monotonic()
+
+    def refill(self, now, scale=1.0):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate * scale)
+        self.updated = now
+
+    def wait_time(self, amount, scale=1.0):
+        missing = amount - self.tokens
+        return 0.0 if missing <= 0 else missing / (self.rate * scale)
+
+
+class RateLimiter:
+    """Request + token buckets shared by all workers, with adaptive slow-down on 429s.
+
+    `throttle()` halves the effective rate and pauses everyone for `cooldown` seconds;
+    each successful call creeps the rate back up via `recover()`.
+    """
+
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE,
+                 tokens_per_minute=DEFAULT_TOKENS_PER_MINUTE, cooldown=2.0, min_scale=0.05):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.cooldown = cooldown
+        self.min_scale = min_scale
+        self.scale = 1.0
+        self.paused_until = 0.0
+        self.throttle_count = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        # A single request larger than the whole minute budget would wait forever
+        tokens = min(tokens, self.tokens.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.requests.refill(now, self.scale)
+                self.tokens.refill(now, self.scale)
+                wait = max(
+                    self.paused_until - now,
+                    self.requests.wait_time(1, self.scale),
+                    self.tokens.wait_time(tokens, self.scale),
+                )
+                if wait <= 0:
+                    self.requests.tokens -= 1
+                    self.tokens.tokens -= tokens
+                    return
+            time.sleep(min(wait, 1.0))
+
+    def throttle(self):
+        with self._lock:
+            self.throttle_count += 1
+            self.scale = max(self.min_scale, self.scale * 0.5)
+            self.paused_until = max(self.paused_until, time.monotonic() + self.cooldown)
+
+    def recover(self):
+        with self._lock:
+            self.scale = min(1.0, self.scale + 0.02)
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def latency_summary(label, latencies):
+    return (f"{label}: {len(latencies)} calls, "
+            f"p50 {percentile(latencies, 50) * 1000:.0f} ms, p95 {percentile(latencies, 95) * 1000:.0f} ms")
@@ -0,0 +1,221 @@
+import argparse
+import ast
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from table_sync import natural_key
+
+PLATFORM_COLUMNS = ["정밀의료기기", "정밀재생", "면역-마이크로바이옴", "신약", "데이터", "혁신형의사과학자"]
+# The total_df.xlsx columns migrate_data.py embeds for a researcher, in researcher_text order
+RESEARCHER_TEXT_COLUMNS = ['name', 'department', 'title', 'specialty', 'major_research']
+
+_QUOTED = r"'[^'\\\r\n]*'|\"[^\"\\\r\n]*\""
+# A list of quoted strings without escapes or raw line breaks: what pandas wrote for the crawled
+# paper titles. Anything else goes to literal_eval, which handles or rejects it.
+_STRING_LIST = re.compile(rf"\[\s*(?:(?:{_QUOTED})\s*,\s*)*(?:(?:{_QUOTED})\s*,?\s*)?\]")
+_ITEM = re.compile(_QUOTED)
+
+
+def values(df, col, default=''):
+    """Column as a list; a column the workbook does not have is all `default`, as row.get(col, default)."""
+    return df[col].tolist() if col in df.columns else [default] * len(df)
+
+
+def keyword_lists(raw):
+    # "a, b" -> ['a', 'b']; empty cells -> []
+    return [[k.strip() for k in str(v).split(',')] if v else [] for v in raw]
+
+
+def flag_lists(df, columns):
+    """Per row, the `columns` (in order) whose cell is 1."""
+    present = [c for c in columns if c in df.columns]
+    lists = [[] for _ in range(len(df))]
+    if present:
+        rows, cols = np.nonzero(np.column_stack([df[c].to_numpy() == 1 for c in present]))
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            lists[r].append(present[c])
+    return lists
+
+
+def int_values(df, col):
+    """int(cell) per row, None where a cell is empty or not a number; 0 throughout when the column is missing."""
+    if col not in df.columns:
+        return [0] * len(df)
+    numeric = pd.to_numeric(df[col], errors='coerce')
+    result = np.trunc(numeric.fillna(0).to_numpy(dtype=np.float64)).astype(np.int64).tolist()
+    for i in np.flatnonzero(numeric.isna().to_numpy()).tolist():
+        result[i] = None
+    return result
+
+
+def parse_list(text):
+    """A stringified Python list such as "['Title 1', \"Title's 2\"]"; plain string lists skip ast."""
+    if _STRING_LIST.fullmatch(text):
+        return [item[1:-1] for item in _ITEM.findall(text)]
+    return ast.literal_eval(text)
+
+
+def paper_topic_lists(raw, names):
+    """Cleaned paper titles per row: stringified lists are parsed, any other value is one title."""
+    topics = []
+    for paper, name in zip(raw, names):
+        items = []
+        if paper:
+            text = str(paper)
+            if text.startswith('['):
+                try:
+                    items = parse_list(text)
+                except Exception as e:
+                    print(f"Error parsing paper for {name}: {e}")
+            else:
+                items = [text]
+        topics.append([str(t).strip() for t in items if t])
+    return topics
+
+
+def researcher_text(name, department, position, keywords, major_research):
+    # The text migrate_data.py embeds for a researcher
+    return f"{name} {department} {position} {keywords} {major_research}"
+
+
+def researcher_texts(df):
+    """researcher_text for every total_df.xlsx row; missing columns are empty."""
+    columns = [df[c].fillna('').astype(str).tolist() if c in df else [''] * len(df) for c in RESEARCHER_TEXT_COLUMNS]
+    return [researcher_text(*row) for row in zip(*columns)]
+
+
+def researcher_records(df, platform_columns=PLATFORM_COLUMNS):
+    """(records, embedding texts, sync keys) for total_df.xlsx rows, built column by column."""
+    text = df.fillna('')
+    names, departments, positions, specialties, image_urls, major_research, hrefs = (
+        values(text, c) for c in ['name', 'department', 'title', 'specialty', 'image_url', 'major_research', 'href'])
+    keywords = keyword_lists(specialties)
+    platforms = flag_lists(df, platform_columns)
+    papers = int_values(df, 'recent_papers_3yr')
+    pi_counts = int_values(df, 'total_pi_count')
+
+    records, texts, keys = [], [], []
+    for i, (name, department, position, specialty, major) in enumerate(
+            zip(names, departments, positions, specialties, major_research)):
+        if papers[i] is None or pi_counts[i] is None:
+            # As int() did row by row: an empty or non-numeric count skips the researcher
+            print(f"Error processing researcher {name}: recent_papers_3yr / total_pi_count is empty or not a number")
+            continue
+        records.append({
+            "name": name,
+            "department": department,
+            "position": position,  # Mapped from 'title'
+            "keywords": keywords[i],  # Mapped from 'specialty'
+            "image_url": image_urls[i],
+            "major_research": major,
+            "recent_papers_3yr": papers[i],
+            "total_pi_count": pi_counts[i],
+            "platforms": platforms[i],
+            "ku_url": hrefs[i],  # Mapped from 'href'
+        })
+        texts.append(researcher_text(name, department, position, specialty, major))
+        keys.append(natural_key(name, department))
+    return records, texts, keys
+
+
+def project_records(df):
+    """(records, embedding texts, sync keys) for ntis_results.xlsx rows, built column by column."""
+    text = df.fillna('')
+    titles, projects, researcher_names, pis, years, budgets = (
+        values(text, c) for c in ['title', 'project', 'researcher_name', 'pi', 'year', 'budget'])
+    records = [{"title": title, "researcher_name": researcher_name, "pi": pi, "year": str(year), "budget": str(budget)}
+               for title, researcher_name, pi, year, budget in zip(titles, researcher_names, pis, years, budgets)]
+    texts = [f"{title} {project}" for title, project in zip(titles, projects)]
+    keys = [natural_key(title, project, year, pi) for title, project, year, pi in zip(titles, projects, years, pis)]
+    return records, texts, keys
+
+
+def synthetic_researchers(n, seed=0):
+    rng = random.Random(seed)
+    words = ['폐암', '대장암', '로봇수술', '내시경', '심부전', '뇌졸중', '영상진단', '유전체', '면역치료', '재활']
+    frame = {
+        'name': [f"연구자{i}" for i in range(n)],
+        'department': [rng.choice(['내과', '외과', '신경과', '영상의학과']) for _ in range(n)],
+        'title': [rng.choice(['교수', '부교수', '조교수', '임상교수']) for _ in range(n)],
+        'specialty': [', '.join(rng.sample(words, rng.randint(0, 4))) for _ in range(n)],
+        'href': [f"https://example.org/dr/{i}" for i in range(n)],
+        'recent_papers_3yr': [rng.randint(0, 40) for _ in range(n)],
+        'total_pi_count': [rng.randint(0, 10) for _ in range(n)],
+        'paper': [repr([f"Study of {rng.choice(words)} {j}" for j in range(rng.randint(0, 8))]) for _ in range(n)],
+    }
+    for col in PLATFORM_COLUMNS:
+        frame[col] = [1.0 if rng.random() < 0.1 else float('nan') for _ in range(n)]
+    return pd.DataFrame(frame)
+
+
+def rowwise_researchers(df):
+    # The iterrows loop researcher_records replaced, kept as the benchmark baseline
+    df = df.fillna('')
+    records, texts, keys = [], [], []
+    for _, row in df.iterrows():
+        position = row.get('title', '')
+        keywords_raw = row.get('specialty', '')
+        keywords = [k.strip() for k in str(keywords_raw).split(',')] if keywords_raw else []
+        platforms = [col for col in PLATFORM_COLUMNS if row.get(col) == 1]
+        try:
+            # After fillna('') an empty count is '', so int() raises and the row is skipped
+            papers = int(row.get('recent_papers_3yr', 0)) if pd.notna(row.get('recent_papers_3yr')) else 0
+            pi_count = int(row.get('total_pi_count', 0)) if pd.notna(row.get('total_pi_count')) else 0
+        except ValueError:
+            continue
+        records.append({
+            "name": row.get('name', ''), "department": row.get('department', ''), "position": position,
+            "keywords": keywords, "image_url": row.get('image_url', ''), "major_research": row.get('major_research', ''),
+            "recent_papers_3yr": papers, "total_pi_count": pi_count,
+            "platforms": platforms, "ku_url": row.get('href', ''),
+        })
+        texts.append(researcher_text(row.get('name', ''), row.get('department', ''), position, keywords_raw,
+                                     row.get('major_research', '')))
+        keys.append(natural_key(row.get('name', ''), row.get('department', '')))
+    return records, texts, keys
+
+
+def benchmark(n):
+    df = synthetic_researchers(n)
+    started = time.perf_counter()
+    expected = rowwise_researchers(df)
+    rowwise = time.perf_counter() - started
+    started = time.perf_counter()
+    got = researcher_records(df)
+    columnar = time.perf_counter() - started
+    assert got == expected, "columnar records differ from the iterrows loop"
+    # An empty count cell skips the researcher, as int('') did in the loop
+    gaps = synthetic_researchers(3)
+    gaps.loc[1, 'total_pi_count'] = float('nan')
+    records = researcher_records(gaps)[0]
+    assert records == rowwise_researchers(gaps)[0] and len(records) == 2, records
+    papers = df['paper'].tolist()
+    started = time.perf_counter()
+    expected = [ast.literal_eval(p) for p in papers]
+    literal = time.perf_counter() - started
+    started = time.perf_counter()
+    got = [parse_list(p) for p in papers]
+    parsed = time.perf_counter() - started
+    assert got == expected, "parse_list differs from ast.literal_eval"
+    # A line break between items is fine; inside quotes literal_eval rejects it, so parse_list must too
+    assert parse_list("['a',\n 'b']") == ['a', 'b']
+    try:
+        parse_list("['a\nb']")
+    except SyntaxError:
+        pass
+    else:
+        raise AssertionError("parse_list accepted a raw line break inside quotes")
+    print(f"{n} researchers: iterrows {rowwise:.2f}s, columnar {columnar:.2f}s ({rowwise / columnar:.0f}x); "
+          f"paper lists: literal_eval {literal:.2f}s, parse_list {parsed:.2f}s ({literal / parsed:.0f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark columnar record building against the iterrows loop.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[100000])
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n)
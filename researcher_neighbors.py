@@ -0,0 +1,113 @@
+import argparse
+import time
+
+import numpy as np
+
+from embedding_classifier import normalized_matrix
+from supabase_writer import ChunkedWriter
+
+NEIGHBORS_TABLE = 'researcher_neighbors'
+DEFAULT_K = 10
+# Similarity tile budget: tiles are at most this many bytes of float32 scores
+TILE_BYTES = 64 << 20
+
+
+def top_k_neighbors(matrix, k=DEFAULT_K, present=None, tile_bytes=TILE_BYTES):
+    """Cosine top-k of every row of a unit-row matrix against all other rows.
+
+    Similarities are computed tile by tile (row block x column block), keeping a running
+    top-k per row, so memory stays at one tile however many rows there are. Returns
+    (indices, scores), both (n, k), best first; missing slots are -1 / -inf.
+    """
+    n = len(matrix)
+    present = np.ones(n, dtype=bool) if present is None else present
+    k = max(0, min(k, int(present.sum()) - 1))
+    indices = np.full((n, k), -1, dtype=np.int64)
+    scores = np.full((n, k), -np.inf, dtype=np.float32)
+    if k == 0:
+        return indices, scores
+    tile = max(k + 1, int((tile_bytes / 4) ** 0.5))
+    for start in range(0, n, tile):
+        rows = slice(start, min(n, start + tile))
+        best_scores = scores[rows]
+        best_indices = indices[rows]
+        for col_start in range(0, n, tile):
+            cols = np.arange(col_start, min(n, col_start + tile))
+            block = matrix[rows] @ matrix[cols].T
+            block[:, ~present[cols]] = -np.inf
+            # A researcher is not their own neighbour
+            own = np.arange(rows.start, rows.stop)
+            inside = (own >= col_start) & (own < col_start + len(cols))
+            block[np.flatnonzero(inside), own[inside] - col_start] = -np.inf
+            # Only entries reaching both the tile's and the running k-th best can enter the top-k;
+            # that leaves about k per row (ties beyond k keep the lowest columns)
+            threshold = best_scores.min(axis=1)
+            if block.shape[1] > k:
+                threshold = np.maximum(threshold, np.partition(block, -k, axis=1)[:, -k])
+            r, c = np.nonzero(block >= threshold[:, None])
+            counts = np.bincount(r, minlength=len(block))
+            rank = np.arange(len(r)) - (np.cumsum(counts) - counts)[r]
+            r, c, rank = r[rank < k], c[rank < k], rank[rank < k]
+            new_scores = np.full_like(best_scores, -np.inf)
+            new_indices = np.full_like(best_indices, -1)
+            new_scores[r, rank] = block[r, c]
+            new_indices[r, rank] = cols[c]
+            candidates = np.concatenate([best_scores, new_scores], axis=1)
+            candidate_indices = np.concatenate([best_indices, new_indices], axis=1)
+            top = np.argpartition(-candidates, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(candidates, top, axis=1)
+            best_indices = np.take_along_axis(candidate_indices, top, axis=1)
+        # Best first; equal scores in index order
+        order = np.lexsort((best_indices, -best_scores), axis=1)
+        scores[rows] = np.take_along_axis(best_scores, order, axis=1)
+        indices[rows] = np.take_along_axis(best_indices, order, axis=1)
+    scores[~present] = -np.inf
+    indices[~present] = -1
+    return indices, scores
+
+
+def neighbor_lists(keys, indices, scores):
+    """{key: [[neighbour key, similarity], ...]} for rows that have neighbours."""
+    lists = {}
+    for key, row_indices, row_scores in zip(keys, indices.tolist(), scores.tolist()):
+        neighbors = [[keys[j], round(s, 4)] for j, s in zip(row_indices, row_scores) if j >= 0]
+        if neighbors:
+            lists[key] = neighbors
+    return lists
+
+
+def upload_neighbors(supabase, lists, chunk_size=500):
+    """Replace the researcher_neighbors table with `lists` (researcher sync_key -> neighbours)."""
+    supabase.table(NEIGHBORS_TABLE).delete().neq('researcher_key', '').execute()
+    writer = ChunkedWriter(supabase, NEIGHBORS_TABLE, chunk_size=chunk_size, vector_columns=())
+    for key, neighbors in lists.items():
+        writer.add({'researcher_key': key,
+                    'neighbors': [{'key': other, 'similarity': similarity} for other, similarity in neighbors]})
+    return writer.close()
+
+
+def benchmark(n, dims, k=DEFAULT_K, check=200):
+    rng = np.random.default_rng(0)
+    # Clustered vectors, like researchers sharing fields
+    centers = rng.standard_normal((max(1, n // 50), dims)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), n)] + 0.5 * rng.standard_normal((n, dims)).astype(np.float32)
+    matrix, present = normalized_matrix(list(vectors))
+    started = time.perf_counter()
+    indices, scores = top_k_neighbors(matrix, k, present)
+    elapsed = time.perf_counter() - started
+    sample = matrix[:check] @ matrix.T
+    sample[np.arange(min(check, n)), np.arange(min(check, n))] = -np.inf
+    expected = np.sort(sample, axis=1)[:, ::-1][:, :k]
+    assert np.allclose(scores[:check], expected, atol=1e-5), "tiled top-k disagrees with the full product"
+    print(f"{n} researchers x {dims} dims: top-{k} in {elapsed:.2f}s "
+          f"({n * n / elapsed / 1e6:.0f}M pairs/s, tile {int((TILE_BYTES / 4) ** 0.5)} rows)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the tiled all-pairs researcher neighbour search.")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--dims', type=int, default=256, help="1536 for text-embedding-3-small")
+    parser.add_argument('-k', type=int, default=DEFAULT_K)
+    args = parser.parse_args()
+    for n in args.benchmark:
+        benchmark(n, args.dims, args.k)
@@ -1,22 +1,226 @@
-
+import argparse
+import asyncio
+import codecs
+import hashlib
 import os
-import pandas as pd
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import async_playwright
+from crawl_state import CrawlState, DEFAULT_STATE_PATH
+from spreadsheet_cache import read_workbook
 
-# Load data
-df = pd.read_excel('total_df.xlsx')
-
-# Create directory
+input_path = 'total_df.xlsx'
 save_dir = 'public/images/researchers'
-os.makedirs(save_dir, exist_ok=True)
+refresh_days = 7
+use_static = True
+force = False
+
+user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+download_headers = {
+    "User-Agent": user_agent,
+    "Referer": "https://guro.kumc.or.kr/"
+}
+
+def resolve_image_url(page_url, img_url):
+    # Relative src/background URLs are resolved against the profile page
+    if img_url.startswith('http'):
+        return img_url
+    return urljoin(page_url, img_url)
+
+def image_url_from_style(style):
+    if style and 'background-image' in style:
+        # Extract URL from style string
+        match = re.search(r'url\((.*?)\)', style)
+        if match:
+            return match.group(1).strip("'\"")
+    return None
+
+def image_extension(content_type):
+    # Determine extension from content-type
+    content_type = (content_type or '').lower()
+    if 'jpeg' in content_type or 'jpg' in content_type:
+        return '.jpg'
+    if 'gif' in content_type:
+        return '.gif'
+    return '.png' # Default to png
+
+def save_image(name, response):
+    # Force save as is (binary)
+    filepath = os.path.join(save_dir, f"{name}{image_extension(response.headers.get('Content-Type'))}")
+    with open(filepath, 'wb') as f:
+        f.write(response.content)
+    return filepath
+
+class ProfileImageParser(HTMLParser):
+    """Streaming match of the scraper's selectors: `.doctor_img img` (src) then `.doctor_image span` (style)."""
+
+    void_tags = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.img_src = None
+        self.span_url = None
+        self.img_seen = False
+        self.span_seen = False
+
+    def inside(self, class_name):
+        return any(class_name in classes for _, classes in self.stack)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        # Like query_selector, only the first matching element counts
+        if tag == 'img' and not self.img_seen and self.inside('doctor_img'):
+            self.img_seen = True
+            self.img_src = attrs.get('src')
+        elif tag == 'span' and not self.span_seen and self.inside('doctor_image'):
+            self.span_seen = True
+            self.span_url = image_url_from_style(attrs.get('style'))
+        if tag not in self.void_tags:
+            self.stack.append((tag, (attrs.get('class') or '').split()))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in self.void_tags:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        # Tolerate unclosed tags: pop back to the nearest matching open tag
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                del self.stack[i:]
+                return
+
+    @property
+    def image_url(self):
+        return self.img_src or self.span_url
+
+def fetch_static_image_url(session, url):
+    """Look for the profile image in the raw HTML, stopping as soon as `.doctor_img img` is seen."""
+    parser = ProfileImageParser()
+    try:
+        with session.get(url, stream=True, timeout=10) as response:
+            if response.status_code != 200:
+                return None
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(decoder.decode(chunk))
+                if parser.img_src:
+                    break
+    except requests.RequestException:
+        # Any trouble here just means the browser path gets a try
+        return None
+    return parser.image_url
+
+class PathStats:
+    """How many profiles were resolved from static HTML vs. a full browser render."""
+
+    def __init__(self):
+        self.static_times = []
+        self.missed_times = []
+        self.browser_times = []
+
+    def static(self, seconds, found):
+        # A miss still cost its request before the browser took over
+        (self.static_times if found else self.missed_times).append(seconds)
+
+    def saved(self):
+        """Estimated seconds saved: browser renders avoided, minus the static attempts that found nothing."""
+        if not self.browser_times:
+            return None
+        browser_avg = sum(self.browser_times) / len(self.browser_times)
+        return len(self.static_times) * browser_avg - sum(self.static_times) - sum(self.missed_times)
+
+    def report(self):
+        static_avg = sum(self.static_times) / len(self.static_times) if self.static_times else 0.0
+        browser_avg = sum(self.browser_times) / len(self.browser_times) if self.browser_times else 0.0
+        line = (f"Static HTML path: {len(self.static_times)} profiles (avg {static_avg * 1000:.0f} ms), "
+                f"{len(self.missed_times)} misses ({sum(self.missed_times):.1f}s), "
+                f"browser path: {len(self.browser_times)} profiles (avg {browser_avg * 1000:.0f} ms)")
+        saved = self.saved()
+        if self.static_times and saved is not None:
+            line += f", ~{saved:.1f}s saved"
+        print(line)
+
+def skip_reason(state, name, url):
+    """Why this profile needs no visit this run, or None."""
+    if state is None:
+        return None
+    if state.done_in_current_run(name):
+        return 'checkpoint'
+    if force:
+        return None
+    previous = state.get(name)
+    if (previous and previous['profile_url'] == url
+            and previous['status'] in ('downloaded', 'not_modified', 'unchanged')
+            and previous['file_path'] and os.path.exists(previous['file_path'])
+            and time.time() - previous['checked_at'] < refresh_days * 86400):
+        return 'fresh'
+    return None
+
+def download_image(session, name, url, img_url, state=None):
+    """Fetch img_url (conditionally if we have validators for it) and record the outcome."""
+    previous = state.get(name) if state else None
+    headers = {}
+    have_file = bool(previous and previous['file_path'] and os.path.exists(previous['file_path']))
+    if have_file and previous['image_url'] == img_url and not force:
+        if previous['etag']:
+            headers['If-None-Match'] = previous['etag']
+        if previous['last_modified']:
+            headers['If-Modified-Since'] = previous['last_modified']
+
+    response = session.get(img_url, headers=headers, timeout=10)
+
+    if response.status_code == 304:
+        outcome = 'not_modified'
+        fields = {}
+    elif response.status_code in [200, 201]:
+        digest = hashlib.sha256(response.content).hexdigest()
+        expected_path = os.path.join(save_dir, f"{name}{image_extension(response.headers.get('Content-Type'))}")
+        if have_file and previous['content_hash'] == digest and previous['file_path'] == expected_path:
+            outcome = 'unchanged'
+            filepath = expected_path
+        else:
+            outcome = 'downloaded'
+            filepath = save_image(name, response)
+            print(f"  Downloaded: {filepath}")
+        fields = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_hash': digest,
+            'file_path': filepath,
+        }
+        if outcome == 'downloaded':
+            fields['changed_at'] = time.time()
+    else:
+        print(f"  Failed download for {name}: {response.status_code}")
+        outcome = 'failed'
+        fields = {}
+
+    if state is not None:
+        state.record(name, profile_url=url, image_url=img_url, status=outcome, **fields)
+    return outcome
+
+def scrape_images(state=None):
+    # Load data
+    df = read_workbook(input_path, ['name', 'href'])
+
+    # Create directory
+    os.makedirs(save_dir, exist_ok=True)
+    session = make_session(1)
+    paths = PathStats()
 
-def scrape_images():
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            user_agent=user_agent,
             viewport={"width": 1920, "height": 1080}
         )
         page = context.new_page()
@@ -24,86 +228,337 @@ def scrape_images():
         for index, row in df.iterrows():
             name = row['name']
             url = row['href']
-            
-            # Check if image already exists (skip if we want to be fast, but here we want to overwrite)
-            # filepath = os.path.join(save_dir, f"{name}.png")
-            # if os.path.exists(filepath):
-            #     print(f"Skipping {name}, already exists.")
-            #     continue
+
+            # Skip profiles already handled in this run or fetched recently (see CrawlState)
+            reason = skip_reason(state, name, url)
+            if reason:
+                print(f"Skipping {name} ({reason}).")
+                continue
 
             print(f"[{index+1}/{len(df)}] Processing {name}...")
-            
+
             try:
-                page.goto(url, wait_until='domcontentloaded', timeout=60000)
-                page.wait_for_load_state('networkidle', timeout=10000)
-                
-                # Try multiple selectors
                 img_url = None
-                
-                # Selector 1: .doctor_img img
-                try:
-                    element = page.query_selector('.doctor_img img')
-                    if element:
-                        img_url = element.get_attribute('src')
-                except:
-                    pass
-                
-                # Selector 2: .doctor_image span (background-image)
+                static_hit = False
+
+                # Fast path: the selectors usually match in the server-rendered HTML
+                if use_static:
+                    started = time.perf_counter()
+                    img_url = fetch_static_image_url(session, url)
+                    static_hit = bool(img_url)
+                    paths.static(time.perf_counter() - started, static_hit)
+
                 if not img_url:
+                    started = time.perf_counter()
+                    page.goto(url, wait_until='domcontentloaded', timeout=60000)
+                    page.wait_for_load_state('networkidle', timeout=10000)
+
+                    # Try multiple selectors
+
+                    # Selector 1: .doctor_img img
                     try:
-                        element = page.query_selector('.doctor_image span')
+                        element = page.query_selector('.doctor_img img')
                         if element:
-                            style = element.get_attribute('style')
-                            if style and 'background-image' in style:
-                                # Extract URL from style string
-                                import re
-                                match = re.search(r'url\((.*?)\)', style)
-                                if match:
-                                    img_url = match.group(1).strip("'\"")
+                            img_url = element.get_attribute('src')
                     except:
                         pass
 
+                    # Selector 2: .doctor_image span (background-image)
+                    if not img_url:
+                        try:
+                            element = page.query_selector('.doctor_image span')
+                            if element:
+                                img_url = image_url_from_style(element.get_attribute('style'))
+                        except:
+                            pass
+                    paths.browser_times.append(time.perf_counter() - started)
+
                 if img_url:
-                    if not img_url.startswith('http'):
-                        base_url = "https://guro.kumc.or.kr"
-                        img_url = base_url + img_url
-                        
-                    # Download image
-                    headers = {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                        "Referer": "https://guro.kumc.or.kr/"
-                    }
-                    
-                    response = requests.get(img_url, headers=headers, verify=False, timeout=10)
-                    
-                    if response.status_code in [200, 201]:
-                        # Determine extension from content-type or url
-                        ext = '.png' # Default to png
-                        content_type = response.headers.get('Content-Type', '').lower()
-                        if 'jpeg' in content_type or 'jpg' in content_type:
-                            ext = '.jpg'
-                        elif 'png' in content_type:
-                            ext = '.png'
-                        elif 'gif' in content_type:
-                            ext = '.gif'
-                            
-                        # Force save as is (binary)
-                        filepath = os.path.join(save_dir, f"{name}{ext}")
-                        
-                        with open(filepath, 'wb') as f:
-                            f.write(response.content)
-                        print(f"  Downloaded: {filepath}")
-                    else:
-                        print(f"  Failed download: {response.status_code}")
+                    img_url = resolve_image_url(url, img_url)
+
+                    # Download image (conditional request when we have validators)
+                    download_image(session, name, url, img_url, state)
                 else:
                     print(f"  No image found for {name}")
-                    
+                    if state is not None:
+                        state.record(name, profile_url=url, status='missing')
+
             except Exception as e:
                 print(f"  Error scraping {name}: {e}")
-                
-            time.sleep(0.5) # Polite delay
+                if state is not None:
+                    state.record(name, profile_url=url, status='error')
+
+            # Polite delay after a browser render (a page plus all its assets); a static hit was one request
+            if not static_hit:
+                time.sleep(0.5)
 
         browser.close()
+    session.close()
+    paths.report()
+
+
+class HostRateLimiter:
+    """Minimum spacing between requests to the same host, shared by all workers."""
+
+    def __init__(self, min_interval=0.5):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url):
+        host = urlparse(url).netloc
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def make_session(pool_size):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(download_headers)
+    session.verify = False
+    return session
+
+
+class ScrapeProgress:
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self.outcomes = {}
+        self.started = time.perf_counter()
+
+    def record(self, outcome):
+        self.done += 1
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        if self.done % 20 == 0 or self.done == self.total:
+            print(f"  progress {self.done}/{self.total} ({self.rate():.2f} profiles/s)")
+
+    def rate(self):
+        elapsed = time.perf_counter() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        counts = ", ".join(f"{n} {outcome}" for outcome, n in sorted(self.outcomes.items()))
+        print(f"Scraped {self.done} profiles in {elapsed:.1f}s ({self.rate():.2f} profiles/s): {counts}")
+
+
+async def find_image_url_async(page):
+    # Same selectors, in the same order, as the sync scraper
+    element = await page.query_selector('.doctor_img img')
+    if element:
+        img_url = await element.get_attribute('src')
+        if img_url:
+            return img_url
+    element = await page.query_selector('.doctor_image span')
+    if element:
+        return image_url_from_style(await element.get_attribute('style'))
+    return None
+
+
+async def scrape_profile_async(get_page, session, limiter, state, paths, name, url):
+    reason = skip_reason(state, name, url)
+    if reason:
+        return 'skipped'
+
+    img_url = None
+    if use_static:
+        await limiter.wait(url)
+        started = time.perf_counter()
+        img_url = await asyncio.to_thread(fetch_static_image_url, session, url)
+        paths.static(time.perf_counter() - started, bool(img_url))
+
+    if not img_url:
+        # Static HTML had no match: render it
+        await limiter.wait(url)
+        started = time.perf_counter()
+        page = await get_page()
+        await page.goto(url, wait_until='domcontentloaded', timeout=60000)
+        await page.wait_for_load_state('networkidle', timeout=10000)
+        img_url = await find_image_url_async(page)
+        paths.browser_times.append(time.perf_counter() - started)
+
+    if not img_url:
+        print(f"  No image found for {name}")
+        if state is not None:
+            state.record(name, profile_url=url, status='missing')
+        return 'missing'
+
+    img_url = resolve_image_url(url, img_url)
+    await limiter.wait(img_url)
+    # requests is blocking; the pooled session is shared across worker threads
+    return await asyncio.to_thread(download_image, session, name, url, img_url, state)
+
+
+async def scrape_images_async(workers=4, delay=0.5, state=None):
+    df = read_workbook(input_path, ['name', 'href'])
+    os.makedirs(save_dir, exist_ok=True)
+    rows = [(row['name'], row['href']) for _, row in df.iterrows()]
+
+    queue = asyncio.Queue()
+    for item in rows:
+        queue.put_nowait(item)
+
+    limiter = HostRateLimiter(delay)
+    progress = ScrapeProgress(len(rows))
+    paths = PathStats()
+    session = make_session(workers)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(
+            user_agent=user_agent,
+            viewport={"width": 1920, "height": 1080}
+        )
+
+        async def worker():
+            page = None
+
+            async def get_page():
+                # Pages are only opened by workers that actually need to render
+                nonlocal page
+                if page is None:
+                    page = await context.new_page()
+                return page
+
+            while True:
+                try:
+                    name, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                try:
+                    outcome = await scrape_profile_async(get_page, session, limiter, state, paths, name, url)
+                except Exception as e:
+                    print(f"  Error scraping {name}: {e}")
+                    if state is not None:
+                        state.record(name, profile_url=url, status='error')
+                    outcome = 'failed'
+                progress.record(outcome)
+            if page is not None:
+                await page.close()
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        await browser.close()
+
+    session.close()
+    progress.report()
+    paths.report()
+
+
+CHECK_PAGES = {
+    '/img': '<div class="doctor_img"><p>Dr.<img src="/photos/a.jpg" alt=""></div>',
+    '/span': '<div class="doctor_image"><span style="background-image: url(\'/photos/b.jpg\')"></span></div>',
+    # Unclosed <p> inside the matching div, and an image outside it that must not count
+    '/unclosed': '<img src="/logo.png"><div class="doctor_img"><p><b>Dr.</p><img src="c.jpg"></div>',
+    '/none': '<div class="doctor_info"><img src="/logo.png"></div>',
+}
+
+
+class CheckHandler(BaseHTTPRequestHandler):
+    """Profile pages for check_static_path; /slow sends its image first and stalls before the rest."""
+
+    def do_GET(self):
+        body = CHECK_PAGES.get(self.path)
+        if body is None and self.path != '/slow':
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.end_headers()
+        if self.path == '/slow':
+            self.wfile.write(CHECK_PAGES['/img'].encode() + b' ' * 16384)
+            self.wfile.flush()
+            time.sleep(3)
+            body = '<p>rest of the page</p>'
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+def check_static_path():
+    """Run fetch_static_image_url against a local server and check the time-saved arithmetic."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CheckHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    session = make_session(1)
+    try:
+        expected = {'/img': '/photos/a.jpg', '/span': '/photos/b.jpg', '/unclosed': 'c.jpg',
+                    '/none': None, '/missing': None}
+        for path, image in expected.items():
+            found = fetch_static_image_url(session, base + path)
+            assert found == image, f"{path}: expected {image}, got {found}"
+        assert resolve_image_url(base + '/unclosed', 'c.jpg') == base + '/c.jpg'
+
+        started = time.perf_counter()
+        assert fetch_static_image_url(session, base + '/slow') == '/photos/a.jpg'
+        elapsed = time.perf_counter() - started
+        assert elapsed < 2, f"static fetch read the whole page ({elapsed:.1f}s) instead of stopping at the image"
+
+        # Nothing listens on a closed port: the browser path gets the profile
+        probe = ThreadingHTTPServer(('127.0.0.1', 0), CheckHandler)
+        closed = f"http://127.0.0.1:{probe.server_port}/img"
+        probe.server_close()
+        assert fetch_static_image_url(session, closed) is None
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+    paths = PathStats()
+    paths.static_times = [0.1, 0.1]
+    paths.missed_times = [0.5]
+    paths.browser_times = [1.0, 2.0]
+    # Two renders avoided at 1.5s each, less 0.2s of static hits and the 0.5s miss
+    assert abs(paths.saved() - 2.3) < 1e-9, paths.saved()
+    print(f"Static HTML path checks passed ({len(expected)} pages, early stop, refused connection, time saved)")
+
 
 if __name__ == "__main__":
-    scrape_images()
+    parser = argparse.ArgumentParser(description="Download researcher profile photos into public/images/researchers.")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Parallel browser pages; >1 uses the async page pool")
+    parser.add_argument('--delay', type=float, default=0.5,
+                        help="Minimum seconds between requests to the same host")
+    parser.add_argument('--input', default=input_path)
+    parser.add_argument('--save-dir', default=save_dir)
+    parser.add_argument('--state', default=DEFAULT_STATE_PATH, help="SQLite crawl-state file")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue the last unfinished run, skipping profiles it already checked")
+    parser.add_argument('--refresh-days', type=float, default=refresh_days,
+                        help="Revisit a successfully fetched profile only after this many days")
+    parser.add_argument('--force', action='store_true',
+                        help="Refetch everything regardless of crawl state; the run is still recorded")
+    parser.add_argument('--browser-only', action='store_true',
+                        help="Always render with Playwright instead of trying the static HTML first")
+    parser.add_argument('--check', action='store_true',
+                        help="Check the static HTML path against a local server and exit")
+    args = parser.parse_args()
+    if args.check:
+        check_static_path()
+        raise SystemExit(0)
+
+    input_path = args.input
+    save_dir = args.save_dir
+    refresh_days = args.refresh_days
+    use_static = not args.browser_only
+    force = args.force
+
+    # --force only changes what is fetched; results are still recorded for the next run
+    state = CrawlState(args.state)
+    run_id, resumed = state.start_run(resume=args.resume)
+    print(f"{'Resuming' if resumed else 'Starting'} {'forced ' if force else ''}crawl run {run_id}")
+
+    if args.workers > 1:
+        asyncio.run(scrape_images_async(args.workers, args.delay, state))
+    else:
+        scrape_images(state)
+
+    state.finish_run()
+    print(f"Run {state.run_id} statuses: {state.status_counts()}")
+    state.close()
@@ -0,0 +1,139 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = '.cache/spreadsheets'
+# Plain NumPy dtypes are stored as .npy and memory-mapped on load; anything else
+# (object columns, pandas string/extension dtypes) is pickled per column.
+MMAP_KINDS = 'biufcmM'
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_dir_for(path, cache_dir=CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    where = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:8]
+    return os.path.join(cache_dir, f"{stem}-{where}")
+
+
+def load_meta(directory):
+    try:
+        with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_meta(directory, meta):
+    tmp_path = os.path.join(directory, 'meta.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, os.path.join(directory, 'meta.json'))
+
+
+def convert_workbook(path, directory, stat, digest):
+    """Parse the workbook once and store every column as its own file."""
+    started = time.perf_counter()
+    df = pd.read_excel(path)
+    os.makedirs(directory, exist_ok=True)
+    prefix = digest[:16]
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in MMAP_KINDS:
+            filename = f"{prefix}-{i}.npy"
+            np.save(os.path.join(directory, filename), series.to_numpy(), allow_pickle=False)
+        else:
+            filename = f"{prefix}-{i}.pkl"
+            series.to_pickle(os.path.join(directory, filename))
+        columns.append({'name': col, 'file': filename, 'dtype': str(series.dtype)})
+
+    meta = {
+        'source': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': digest,
+        'rows': len(df),
+        'columns': columns,
+    }
+    # meta.json is written last, so a half-written conversion is never picked up
+    save_meta(directory, meta)
+    for filename in os.listdir(directory):
+        if filename != 'meta.json' and not filename.startswith(prefix):
+            os.remove(os.path.join(directory, filename))
+    print(f"Cached {path} ({len(df)} rows, {len(columns)} columns) in {time.perf_counter() - started:.2f}s")
+    return meta
+
+
+def cached_meta(path, cache_dir=CACHE_DIR):
+    """Return the cache metadata for `path`, converting the workbook if it changed."""
+    stat = os.stat(path)
+    directory = cache_dir_for(path, cache_dir)
+    meta = load_meta(directory)
+    if meta and meta['size'] == stat.st_size and meta['mtime_ns'] == stat.st_mtime_ns:
+        return directory, meta
+    digest = file_hash(path)
+    if meta and meta['sha256'] == digest:
+        # Touched but not edited: keep the converted columns
+        meta['size'], meta['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+        save_meta(directory, meta)
+        return directory, meta
+    return directory, convert_workbook(path, directory, stat, digest)
+
+
+def workbook_columns(path, cache_dir=CACHE_DIR):
+    _, meta = cached_meta(path, cache_dir)
+    return [entry['name'] for entry in meta['columns']]
+
+
+def read_workbook(path, columns=None, cache_dir=CACHE_DIR):
+    """Drop-in for pd.read_excel(path) served from the columnar cache.
+
+    `columns` limits what is loaded; names the workbook does not have are skipped,
+    so callers keep their `col in df.columns` / `row.get(col, default)` fallbacks.
+    """
+    directory, meta = cached_meta(path, cache_dir)
+    wanted = None if columns is None else set(columns)
+    data = {}
+    for entry in meta['columns']:
+        if wanted is not None and entry['name'] not in wanted:
+            continue
+        file_path = os.path.join(directory, entry['file'])
+        if entry['file'].endswith('.npy'):
+            # Copy-on-write map: callers may still assign into the frame
+            data[entry['name']] = np.load(file_path, mmap_mode='c')
+        else:
+            data[entry['name']] = pd.read_pickle(file_path)
+    frame = pd.DataFrame(data, index=pd.RangeIndex(meta['rows']))
+    return frame
+
+
+def benchmark(paths):
+    for path in paths:
+        started = time.perf_counter()
+        expected = pd.read_excel(path)
+        parsed = time.perf_counter() - started
+        read_workbook(path)
+        started = time.perf_counter()
+        df = read_workbook(path)
+        warm = time.perf_counter() - started
+        pd.testing.assert_frame_equal(df, expected)
+        print(f"{path}: read_excel {parsed * 1000:.0f} ms, cached {warm * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert workbooks to the columnar cache and compare load times.")
+    parser.add_argument('paths', nargs='*', default=['total_df.xlsx', 'ntis_results.xlsx'])
+    args = parser.parse_args()
+    benchmark(args.paths)
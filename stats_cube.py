@@ -0,0 +1,298 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+from mock_aggregates import (POSITION_LABELS, SOURCE_PLATFORMS, PLATFORM_MAP, UI_PLATFORM_LABELS,
+                             number_column, text_column, position_label, researcher_columns)
+from spreadsheet_cache import read_workbook, workbook_columns
+
+DEFAULT_CUBE_PATH = '.cache/stats_cube.npz'
+CUBE_TABLE = 'stats_cube'
+# Platform dimension: every UI platform, plus ALL (each researcher once) and NONE (in no platform)
+ALL_PLATFORMS = '*'
+NO_PLATFORM = ''
+CUBE_PLATFORMS = UI_PLATFORM_LABELS + [ALL_PLATFORMS, NO_PLATFORM]
+MEASURES = {'researchers': np.int64, 'budget': np.float64, 'papers': np.int64}
+
+
+def available_years(columns):
+    """Years with a budget_pi_YY or paper_YYYY column, ascending."""
+    years = set()
+    for col in columns:
+        m = re.fullmatch(r'budget_pi_(\d{2})', str(col))
+        if m:
+            years.add(2000 + int(m.group(1)))
+        m = re.fullmatch(r'paper_(\d{4})', str(col))
+        if m:
+            years.add(int(m.group(1)))
+    return sorted(years)
+
+
+def year_columns(year):
+    return [f'budget_pi_{year % 100:02d}', f'paper_{year}']
+
+
+def cube_columns(years):
+    columns = set()
+    for year in years:
+        columns.update(researcher_columns(year))
+    return sorted(columns)
+
+
+def frame_hash(df, columns):
+    present = [c for c in columns if c in df.columns]
+    digest = hashlib.sha256(json.dumps(present, ensure_ascii=False).encode('utf-8'))
+    if present:
+        digest.update(pd.util.hash_pandas_object(df[present], index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def partition_hashes(total_df, years):
+    """Per-year input hash: the year's own columns plus the shared dimension columns."""
+    dims = frame_hash(total_df, ['name', 'department', 'title', *SOURCE_PLATFORMS])
+    return {year: hashlib.sha256((dims + frame_hash(total_df, year_columns(year))).encode()).hexdigest()
+            for year in years}
+
+
+def cube_dimensions(total_df):
+    """Department labels (first-appearance order), per-row department code, position index and
+    the (rows, platform) pairs of the platform dimension."""
+    departments = text_column(total_df, 'department')
+    dept_codes, dept_labels = pd.factorize(departments)
+    positions = [position_label(t) for t in text_column(total_df, 'title').tolist()]
+    pos_idx = np.array([POSITION_LABELS.index(p) for p in positions], dtype=np.int64)
+
+    n = len(total_df)
+    membership = np.zeros((n, len(SOURCE_PLATFORMS)), dtype=bool)
+    for j, p in enumerate(SOURCE_PLATFORMS):
+        membership[:, j] = number_column(total_df, p) == 1
+    source_labels = [PLATFORM_MAP[p] for p in SOURCE_PLATFORMS]
+    rows, platforms = [], []
+    for k, label in enumerate(UI_PLATFORM_LABELS):
+        members = np.flatnonzero(membership[:, source_labels.index(label)])
+        rows.append(members)
+        platforms.append(np.full(len(members), k))
+    everyone = np.arange(n)
+    outside = np.flatnonzero(~membership.any(axis=1))
+    rows += [everyone, outside]
+    platforms += [np.full(n, CUBE_PLATFORMS.index(ALL_PLATFORMS)), np.full(len(outside), CUBE_PLATFORMS.index(NO_PLATFORM))]
+    return list(dept_labels), dept_codes, pos_idx, np.concatenate(rows), np.concatenate(platforms)
+
+
+def build_partitions(total_df, years):
+    """{year: DataFrame of cube cells} for `years`, all from one set of dimension codes."""
+    dept_labels, dept_codes, pos_idx, rows, platforms = cube_dimensions(total_df)
+    n_pos, n_platforms = len(POSITION_LABELS), len(CUBE_PLATFORMS)
+    n_cells = len(dept_labels) * n_pos * n_platforms
+    # Rows are in source order within each cell, so sums add up in the generator's order
+    order = np.lexsort((rows, platforms, pos_idx[rows], dept_codes[rows]))
+    rows, platforms = rows[order], platforms[order]
+    cells = (dept_codes[rows] * n_pos + pos_idx[rows]) * n_platforms + platforms
+    counts = np.bincount(cells, minlength=n_cells)
+    occupied = np.flatnonzero(counts)
+    dept_of, rest = np.divmod(occupied, n_pos * n_platforms)
+    pos_of, platform_of = np.divmod(rest, n_platforms)
+
+    partitions = {}
+    for year in years:
+        budget_col, paper_col = year_columns(year)
+        # Budget (Won -> Eok), rounded per researcher like the generator
+        budget = np.array([round(b, 1) for b in (number_column(total_df, budget_col) / 100000000).tolist()])
+        papers = np.trunc(number_column(total_df, paper_col)).astype(np.int64)
+        partitions[year] = pd.DataFrame({
+            'year': year,
+            'department': np.array(dept_labels, dtype=object)[dept_of],
+            'position': np.array(POSITION_LABELS, dtype=object)[pos_of],
+            'platform': np.array(CUBE_PLATFORMS, dtype=object)[platform_of],
+            'researchers': counts[occupied],
+            'budget': np.bincount(cells, weights=budget[rows], minlength=n_cells)[occupied],
+            'papers': np.bincount(cells, weights=papers[rows], minlength=n_cells)[occupied].astype(np.int64),
+        })
+    return partitions
+
+
+def save_cube(path, cube, hashes):
+    """Columnar npz: dictionary-encoded dimensions plus one array per measure."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    arrays = {'year': cube['year'].to_numpy(dtype=np.int64)}
+    for dim in ['department', 'position', 'platform']:
+        codes, labels = pd.factorize(cube[dim])
+        arrays[dim] = codes.astype(np.int32)
+        arrays[f'{dim}_labels'] = np.array(labels, dtype=str)
+    for measure, dtype in MEASURES.items():
+        arrays[measure] = cube[measure].to_numpy(dtype=dtype)
+    arrays['hashes'] = np.array(json.dumps({str(y): h for y, h in hashes.items()}))
+    tmp_path = path + '.tmp.npz'
+    np.savez_compressed(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_cube(path=DEFAULT_CUBE_PATH):
+    """Return (cube DataFrame, {year: input hash}), or (None, {}) if there is no cube yet."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            columns = {'year': data['year']}
+            for dim in ['department', 'position', 'platform']:
+                columns[dim] = data[f'{dim}_labels'].astype(object)[data[dim]]
+            for measure in MEASURES:
+                columns[measure] = data[measure]
+            hashes = {int(y): h for y, h in json.loads(str(data['hashes'])).items()}
+    except (FileNotFoundError, KeyError, ValueError):
+        return None, {}
+    return pd.DataFrame(columns), hashes
+
+
+def refresh_cube(total_df, path=DEFAULT_CUBE_PATH, years=None, available=None):
+    """Bring the stored cube up to date; only years whose inputs changed are recomputed.
+
+    `available` is every year the workbook has (default: those in total_df). A stored year
+    is dropped only once it is gone from the workbook; years outside `years` are kept as they are.
+    Returns (cube, changed years, removed years).
+    """
+    available = available or available_years(total_df.columns)
+    years = years or available
+    hashes = partition_hashes(total_df, years)
+    cube, stored = load_cube(path)
+    changed = [y for y in years if stored.get(y) != hashes[y]]
+    removed = [y for y in stored if y not in available and y not in hashes]
+    if changed or removed:
+        parts = [] if cube is None else [cube[~cube['year'].isin(changed + removed)]]
+        parts += build_partitions(total_df, changed).values()
+        cube = pd.concat(parts, ignore_index=True)
+        cube = cube.sort_values('year', kind='stable', ignore_index=True)
+        kept = {y: h for y, h in stored.items() if y not in removed}
+        save_cube(path, cube, {**kept, **hashes})
+    return cube, changed, removed
+
+
+def upload_state_path(path):
+    return os.path.splitext(path)[0] + '.uploaded.json'
+
+
+def load_upload_state(path=DEFAULT_CUBE_PATH):
+    """{year: cube input hash} the stats_cube table last received, kept next to the cube."""
+    try:
+        with open(upload_state_path(path), encoding='utf-8') as f:
+            return {int(y): h for y, h in json.load(f).items()}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_upload_state(path, uploaded):
+    tmp_path = upload_state_path(path) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({str(y): h for y, h in sorted(uploaded.items())}, f, indent=1)
+    os.replace(tmp_path, upload_state_path(path))
+
+
+def upload_cube(supabase, cube, years, removed=(), chunk_size=500):
+    """Replace the given years in the stats_cube table. Returns (rows written, rows failed)."""
+    from supabase_writer import ChunkedWriter
+    for year in list(years) + list(removed):
+        supabase.table(CUBE_TABLE).delete().eq('year', year).execute()
+    writer = ChunkedWriter(supabase, CUBE_TABLE, chunk_size=chunk_size, vector_columns=())
+    for record in cube[cube['year'].isin(list(years))].to_dict('records'):
+        writer.add({k: (v.item() if hasattr(v, 'item') else v) for k, v in record.items()})
+    return writer.close(), writer.failed
+
+
+def upload_pending(supabase, cube, path=DEFAULT_CUBE_PATH, years=None):
+    """Upload the requested years the table does not have in their current state, whichever run
+    refreshed the cube, and delete years the cube no longer has. Returns (years, removed, written)."""
+    _, hashes = load_cube(path)
+    uploaded = load_upload_state(path)
+    years = [y for y in (years or sorted(hashes)) if y in hashes and uploaded.get(y) != hashes[y]]
+    removed = [y for y in uploaded if y not in hashes]
+    if not years and not removed:
+        return years, removed, 0
+    written, failed = upload_cube(supabase, cube, years, removed)
+    uploaded = {y: h for y, h in uploaded.items() if y not in removed}
+    # Years are recorded only once all of their cells made it; a failed chunk re-sends them next time
+    if not failed:
+        uploaded.update({y: hashes[y] for y in years})
+    save_upload_state(path, uploaded)
+    return years, removed, written
+
+
+def year_slice(cube, year):
+    """Dashboard aggregates for one year, read off the cube."""
+    cells = cube[cube['year'] == year]
+    everyone = cells[cells['platform'] == ALL_PLATFORMS]
+    n_pos = len(POSITION_LABELS)
+    pos_idx = everyone['position'].map(POSITION_LABELS.index).to_numpy()
+    aggregates = {}
+
+    position_counts = np.bincount(pos_idx, weights=everyone['researchers'], minlength=n_pos).astype(np.int64)
+    aggregates['position_counts'] = position_counts.tolist()
+
+    budget_list = []
+    breakdown = {pos: [] for pos in POSITION_LABELS}
+    for label in UI_PLATFORM_LABELS + [NO_PLATFORM]:
+        platform_cells = cells[cells['platform'] == label]
+        budget_list.append(round(float(platform_cells['budget'].sum()), 1) if len(platform_cells) else 0)
+        if label != NO_PLATFORM:
+            counts = platform_cells.groupby('position')['researchers'].sum()
+            for pos in POSITION_LABELS:
+                breakdown[pos].append(int(counts.get(pos, 0)))
+    aggregates['platform_budget'] = budget_list
+    aggregates['platform_breakdown'] = breakdown
+
+    # Dept Top 10 (departments are stored in first-appearance order, as value_counts sees them)
+    named = everyone[everyone['department'] != ""]
+    dept_counts = named.groupby('department', sort=False)['researchers'].sum()
+    dept_counts = dept_counts.sort_values(ascending=False, kind='stable').head(10)
+    dept_labels = dept_counts.index.tolist()
+    aggregates['dept_labels'] = dept_labels
+    aggregates['dept_values'] = dept_counts.values.tolist()
+    matrix = named.pivot_table(index='department', columns='position', values='researchers', aggfunc='sum', fill_value=0)
+    aggregates['dept_breakdown'] = {
+        pos: [int(matrix.at[d, pos]) if pos in matrix.columns else 0 for d in dept_labels] for pos in POSITION_LABELS
+    }
+
+    # Performance
+    perf_agg = everyone.groupby('department')[['budget', 'papers']].sum().reset_index()
+    perf_agg = perf_agg.sort_values('budget', ascending=False).head(7)
+    aggregates['performance'] = [
+        {'name': row['department'], 'budget': round(row['budget'], 1), 'papers': int(row['papers'])}
+        for _, row in perf_agg.iterrows()
+    ]
+
+    # Avg Stats
+    paper_sums = np.bincount(pos_idx, weights=everyone['papers'], minlength=n_pos)
+    budget_sums = np.bincount(pos_idx, weights=everyone['budget'], minlength=n_pos)
+    aggregates['avg_papers'] = [round(int(paper_sums[k]) / c, 1) if c else 0 for k, c in enumerate(position_counts.tolist())]
+    aggregates['avg_budget'] = [round(float(budget_sums[k]) / c, 2) if c else 0 for k, c in enumerate(position_counts.tolist())]
+
+    outside = int(cells.loc[cells['platform'] == NO_PLATFORM, 'researchers'].sum())
+    aggregates['participation'] = [outside, int(position_counts.sum()) - outside]
+    return aggregates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the department x position x platform x year statistics cube.")
+    parser.add_argument('--input', default='total_df.xlsx')
+    parser.add_argument('--cube', default=DEFAULT_CUBE_PATH)
+    parser.add_argument('--years', type=int, nargs='+', help="Default: every year with budget/paper columns")
+    parser.add_argument('--upload', action='store_true',
+                        help=f"Replace the years the {CUBE_TABLE} table does not have up to date")
+    parser.add_argument('--show', type=int, help="Print the dashboard aggregates for this year")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    available = available_years(workbook_columns(args.input))
+    years = args.years or available
+    total_df = read_workbook(args.input, cube_columns(years))
+    cube, changed, removed = refresh_cube(total_df, args.cube, years, available)
+    print(f"Cube: {len(cube)} cells, years {sorted(cube['year'].unique().tolist())}; "
+          f"recomputed {changed or 'none'} in {time.perf_counter() - started:.2f}s")
+    if args.upload:
+        from clients import supabase_admin as supabase
+        uploaded, deleted, written = upload_pending(supabase, cube, args.cube, years)
+        print(f"Uploaded {written} cells to {CUBE_TABLE} (years {uploaded or 'none'}, deleted {deleted or 'none'})")
+    if args.show:
+        print(json.dumps(year_slice(cube, args.show), ensure_ascii=False, indent=1))
@@ -22,11 +22,14 @@ create table if not exists projects (
   embedding vector(1536)
 );
 
--- Create a function to search researchers by embedding similarity
+-- Create a function to search researchers by embedding similarity.
+-- filter_department (null = all) keeps only that department; vector_index.py mirrors it locally.
+drop function if exists match_researchers(vector, float, int);
 create or replace function match_researchers (
   query_embedding vector(1536),
   match_threshold float,
-  match_count int
+  match_count int,
+  filter_department text default null
 )
 returns table (
   id uuid,
@@ -49,16 +52,24 @@ begin
     1 - (researchers.embedding <=> query_embedding) as similarity
   from researchers
   where 1 - (researchers.embedding <=> query_embedding) > match_threshold
+    and (filter_department is null or researchers.department = filter_department)
   order by researchers.embedding <=> query_embedding
   limit match_count;
 end;
 $$;
 
--- Create a function to search projects by embedding similarity
+-- The project's PI as migrate_data.py writes it
+alter table projects add column if not exists pi text;
+
+-- Create a function to search projects by embedding similarity.
+-- A project's department is its PI's: the one department of the researchers with that name
+-- (spaces ignored); PIs that are homonyms in several departments, or not researchers, have none.
+drop function if exists match_projects(vector, float, int);
 create or replace function match_projects (
   query_embedding vector(1536),
   match_threshold float,
-  match_count int
+  match_count int,
+  filter_department text default null
 )
 returns table (
   id uuid,
@@ -81,7 +92,53 @@ begin
     1 - (projects.embedding <=> query_embedding) as similarity
   from projects
   where 1 - (projects.embedding <=> query_embedding) > match_threshold
+    and (filter_department is null or filter_department = (
+      select case when count(distinct r.department) = 1 then min(r.department) end
+      from researchers r
+      where regexp_replace(r.name, '\s', '', 'g') = regexp_replace(projects.pi, '\s', '', 'g')
+    ))
   order by projects.embedding <=> query_embedding
   limit match_count;
 end;
 $$;
+
+-- Bookkeeping for incremental sync (`python migrate_data.py --sync`):
+-- sync_key is the row's natural key, content_hash a hash of the migrated fields + embedding text
+alter table researchers add column if not exists sync_key text;
+alter table researchers add column if not exists content_hash text;
+create index if not exists researchers_sync_key_idx on researchers (sync_key);
+
+alter table projects add column if not exists sync_key text;
+alter table projects add column if not exists content_hash text;
+create index if not exists projects_sync_key_idx on projects (sync_key);
+
+-- Precomputed dashboard statistics (`python stats_cube.py --upload`): one row per
+-- year x department x position x platform cell. platform '*' counts every researcher
+-- once, '' those in no platform. A year's rows are replaced when its inputs change.
+create table if not exists stats_cube (
+  id bigint generated always as identity primary key,
+  year int not null,
+  department text not null,
+  position text not null,
+  platform text not null,
+  researchers int not null,
+  budget double precision not null, -- 억원, sum of per-researcher values rounded to 0.1
+  papers int not null
+);
+create index if not exists stats_cube_year_idx on stats_cube (year);
+
+-- Precomputed similar researchers (`python migrate_data.py`, after the researchers are
+-- embedded): top-k cosine neighbours per researcher sync_key, best first, as
+-- [{"key": <sync_key>, "similarity": <cosine>}]. Replaced on every migration.
+create table if not exists researcher_neighbors (
+  researcher_key text primary key,
+  neighbors jsonb not null
+);
+
+-- Optional compact embeddings (`python migrate_data.py --quantize float16 --dimensions N`):
+-- halfvec stores 2 bytes per dimension instead of 4, and text-embedding-3-small vectors
+-- can be truncated to N dimensions. Run `python quantization.py` first to check the
+-- top-k overlap on our data. Switch both tables and the match_* query_embedding
+-- parameters to the same type, and set EMBEDDING_DIMENSIONS for the search API:
+-- alter table researchers alter column embedding type halfvec(1536);
+-- alter table projects alter column embedding type halfvec(1536);
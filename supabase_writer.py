@@ -0,0 +1,84 @@
+import time
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+# Significant digits that round-trip each stored dtype
+VECTOR_FORMATS = {np.dtype(np.float32): '%.7g', np.dtype(np.float16): '%.5g', np.dtype(np.int8): '%d'}
+
+
+def encode_vector(vector):
+    # pgvector text format (halfvec for float16); 7 significant digits is full float32
+    # precision and about half the size of json-dumping Python floats.
+    return "[" + ",".join(np.char.mod(VECTOR_FORMATS.get(vector.dtype, '%.7g'), vector)) + "]"
+
+
+class ChunkedWriter:
+    """Buffers rows and inserts them into a Supabase table in fixed-size chunks.
+
+    Embeddings are held as float32 arrays until a chunk is encoded, so only one
+    chunk of JSON-ready rows exists at a time. A failed chunk is reported and
+    counted; the remaining chunks are still written. With `upsert=True` rows
+    carrying an existing primary key are updated in place. With a `quantizer`
+    (see quantization.Quantizer) vectors are truncated / rounded before upload.
+    """
+
+    def __init__(self, supabase, table, chunk_size=DEFAULT_CHUNK_SIZE, vector_columns=('embedding',),
+                 latencies=None, upsert=False, quantizer=None):
+        self.supabase = supabase
+        self.quantizer = quantizer
+        self.upsert = upsert
+        self.table = table
+        self.chunk_size = chunk_size
+        self.vector_columns = vector_columns
+        self.latencies = latencies if latencies is not None else []
+        self.buffer = []
+        self.written = 0
+        self.failed = 0
+        self.chunks = 0
+
+    def add(self, record):
+        for col in self.vector_columns:
+            if record.get(col) is not None:
+                record[col] = np.asarray(record[col], dtype=np.float32)
+                if self.quantizer is not None:
+                    record[col] = self.quantizer.encode(record[col][None, :])[0]
+        self.buffer.append(record)
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def _encode(self, record):
+        encoded = dict(record)
+        for col in self.vector_columns:
+            if isinstance(encoded.get(col), np.ndarray):
+                encoded[col] = encode_vector(encoded[col])
+        return encoded
+
+    def _send(self, rows):
+        if self.upsert:
+            return self.supabase.table(self.table).upsert(rows).execute()
+        return self.supabase.table(self.table).insert(rows).execute()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        rows = [self._encode(r) for r in self.buffer]
+        self.buffer = []
+        self.chunks += 1
+        started = time.perf_counter()
+        try:
+            self._send(rows)
+            elapsed = time.perf_counter() - started
+            self.latencies.append(elapsed)
+            self.written += len(rows)
+            print(f"  [{self.table}] chunk {self.chunks}: {len(rows)} rows in {elapsed * 1000:.0f} ms "
+                  f"({self.written} written)")
+        except Exception as e:
+            self.failed += len(rows)
+            print(f"  [{self.table}] chunk {self.chunks} failed ({len(rows)} rows): {e}")
+
+    def close(self):
+        self.flush()
+        return self.written
@@ -0,0 +1,85 @@
+import hashlib
+import json
+
+PAGE_SIZE = 1000
+DELETE_CHUNK_SIZE = 200
+
+
+def natural_key(*parts):
+    # Stable across runs: whitespace-trimmed parts joined with a separator that never occurs in data
+    return "\x1f".join(str(p).strip() for p in parts)
+
+
+def content_hash(record, embedding_text, model):
+    payload = {k: v for k, v in record.items() if k != 'embedding'}
+    raw = json.dumps([payload, embedding_text, model], ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def fetch_all(supabase, table, columns):
+    """Read every row of `table` (only `columns`), paging past PostgREST's row limit."""
+    rows = []
+    start = 0
+    while True:
+        response = supabase.table(table).select(columns).range(start, start + PAGE_SIZE - 1).execute()
+        page = response.data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        start += PAGE_SIZE
+
+
+def fetch_existing(supabase, table):
+    """Return {sync_key: [(id, content_hash), ...]} for every row currently in `table`."""
+    existing = {}
+    for row in fetch_all(supabase, table, 'id,sync_key,content_hash'):
+        existing.setdefault(row.get('sync_key'), []).append((row['id'], row.get('content_hash')))
+    return existing
+
+
+class SyncPlan:
+    def __init__(self):
+        self.new = []          # source indices to insert
+        self.changed = []      # (source index, existing id) to upsert in place
+        self.unchanged = 0
+        self.delete_ids = []   # rows that vanished from the source (or duplicate keys in the table)
+        self.duplicate_keys = 0
+
+    def summary(self, table):
+        return (f"[{table}] sync plan: {len(self.new)} new, {len(self.changed)} changed, "
+                f"{self.unchanged} unchanged, {len(self.delete_ids)} to delete"
+                + (f", {self.duplicate_keys} duplicate source rows skipped" if self.duplicate_keys else ""))
+
+
+def plan_sync(keys, hashes, existing):
+    plan = SyncPlan()
+    seen = set()
+    for i, (key, digest) in enumerate(zip(keys, hashes)):
+        if key in seen:
+            plan.duplicate_keys += 1
+            continue
+        seen.add(key)
+        matches = existing.get(key)
+        if not matches:
+            plan.new.append(i)
+            continue
+        row_id, old_digest = matches[0]
+        if old_digest == digest:
+            plan.unchanged += 1
+        else:
+            plan.changed.append((i, row_id))
+        # Earlier full reloads may have left several rows per key; keep only one
+        plan.delete_ids.extend(row_id for row_id, _ in matches[1:])
+    for key, matches in existing.items():
+        if key not in seen:
+            plan.delete_ids.extend(row_id for row_id, _ in matches)
+    return plan
+
+
+def delete_rows(supabase, table, ids):
+    deleted = 0
+    for start in range(0, len(ids), DELETE_CHUNK_SIZE):
+        chunk = ids[start:start + DELETE_CHUNK_SIZE]
+        supabase.table(table).delete().in_('id', chunk).execute()
+        deleted += len(chunk)
+    return deleted
@@ -1,56 +1,132 @@
-
+import argparse
+import hashlib
+import json
 import os
-from dotenv import load_dotenv
-from supabase import create_client
-import urllib.parse
+import time
+import clients
+from clients import SUPABASE_ENV
+from supabase_writer import ChunkedWriter
+from table_sync import fetch_all
+from name_matcher import AMBIGUOUS, MATCHED, NameIndex
 
-# Load environment variables
-load_dotenv('.env.local')
+# Service role key if available for bypassing RLS, otherwise anon key + policy (clients.py)
+supabase = clients.supabase_admin
 
-supabase_url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-supabase_key = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-# Use service role key if available for bypassing RLS, otherwise rely on anon key + policy
-service_role_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+image_dir = 'public/images/researchers'
+manifest_path = '.cache/image_manifest.json'
+image_extensions = ('.jpg', '.png', '.gif')
 
-if service_role_key:
-    supabase = create_client(supabase_url, service_role_key)
-else:
-    supabase = create_client(supabase_url, supabase_key)
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
-image_dir = 'public/images/researchers'
-files = os.listdir(image_dir)
-
-print(f"Found {len(files)} images in {image_dir}")
-
-for filename in files:
-    if not (filename.lower().endswith('.jpg') or filename.lower().endswith('.png') or filename.lower().endswith('.gif')):
-        continue
-        
-    name = os.path.splitext(filename)[0]
-    # URL encode the filename for the path
-    # But for local file serving, we usually just use the path string. 
-    # Browser handles encoding.
-    # However, if filename has spaces or special chars, might need care.
-    # Here we assume simple names or just use the filename.
-    
-    # Path relative to public
-    image_path = f"/images/researchers/{filename}"
-    
-    print(f"Updating {name} -> {image_path}")
-    
+def load_manifest(path):
     try:
-        # Update DB
-        # We match by name. 
-        # Note: Name in DB might match filename exactly.
-        
-        data_response = supabase.table('researchers').update({'image_url': image_path}).eq('name', name).execute()
-        
-        if data_response.data and len(data_response.data) > 0:
-             print(f"  Success: Updated {name}")
-        else:
-             print(f"  Failed/Not Found: {name}")
-             
-    except Exception as e:
-        print(f"  Error updating {name}: {e}")
-        
-print("Update completed.")
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_manifest(path, manifest):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def scan_images(directory, previous):
+    """Return {filename: {size, mtime, hash}}; files whose size+mtime are unchanged keep their old hash."""
+    manifest = {}
+    hashed = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.lower().endswith(image_extensions):
+                continue
+            stat = entry.stat()
+            old = previous.get(entry.name)
+            if old and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime:
+                manifest[entry.name] = old
+            else:
+                manifest[entry.name] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'hash': file_hash(entry.path)}
+                hashed += 1
+    return manifest, hashed
+
+def update_local_images(batch_size=200, force=False):
+    started = time.perf_counter()
+    previous = load_manifest(manifest_path)
+    manifest, hashed = scan_images(image_dir, previous)
+    added = [f for f in manifest if f not in previous]
+    modified = [f for f in manifest if f in previous and previous[f]['hash'] != manifest[f]['hash']]
+    removed = [f for f in previous if f not in manifest]
+    print(f"Found {len(manifest)} images in {image_dir} "
+          f"({len(added)} new, {len(modified)} modified, {len(removed)} removed, {hashed} hashed)")
+
+    # The manifest is only saved once the database reflects it, so an unchanged scan has nothing to write
+    if previous and not (added or modified or removed) and not force:
+        if hashed:
+            # Touched but identical files: remember the new mtimes so they are not hashed again
+            save_manifest(manifest_path, manifest)
+        print(f"No image changes since the last update; nothing to do ({time.perf_counter() - started:.1f}s). "
+              "Use --force to re-check the database.")
+        return
+
+    # Path relative to public; browser handles encoding of the filename.
+    # Sorted so that, as before, the last file wins when a name has several extensions.
+    wanted = {}
+    for filename in sorted(manifest):
+        name = os.path.splitext(filename)[0]
+        wanted[name] = f"/images/researchers/{filename}"
+
+    # One read of the current values; only rows that differ are written
+    researchers = fetch_all(supabase, 'researchers', 'id,name,department,image_url')
+    matcher = NameIndex((r.get('name'), r.get('department')) for r in researchers)
+
+    writer = ChunkedWriter(supabase, 'researchers', chunk_size=batch_size, vector_columns=(), upsert=True)
+    unchanged = 0
+    not_found = []
+    ambiguous = []
+    for name, image_path in wanted.items():
+        status, _, ids = matcher.resolve(name)
+        if status == AMBIGUOUS:
+            # Files are named after the researcher only; a photo cannot be told apart between homonyms
+            ambiguous.append(name)
+            continue
+        if status != MATCHED:
+            not_found.append(name)
+            continue
+        for r in (researchers[i] for i in ids):
+            if r.get('image_url') == image_path:
+                unchanged += 1
+                continue
+            print(f"Updating {name} -> {image_path}")
+            # name/department ride along for the NOT NULL check on the insert half of the upsert
+            writer.add({'id': r['id'], 'name': r['name'], 'department': r['department'], 'image_url': image_path})
+    updated = writer.close()
+
+    # Only remember the scan once the database reflects it
+    if not writer.failed:
+        save_manifest(manifest_path, manifest)
+
+    print(f"Update completed in {time.perf_counter() - started:.1f}s. Updated: {updated}, "
+          f"Already correct: {unchanged}, Failed: {writer.failed}, Not Found: {len(not_found)}, "
+          f"Ambiguous: {len(ambiguous)}")
+    if not_found:
+        print("  Not found: " + ", ".join(not_found))
+    if ambiguous:
+        print("  Ambiguous (homonyms, left unchanged): " + ", ".join(ambiguous))
+    matcher.write_report()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Point researchers.image_url at the local images in public/.")
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--force', action='store_true',
+                        help="Compare every image with the database even if the directory is unchanged "
+                             "(e.g. after a full re-migration)")
+    args = parser.parse_args()
+    clients.require_env(*SUPABASE_ENV)
+    update_local_images(args.batch_size, args.force)
+    if clients.latencies.samples:
+        print(clients.latencies.report())
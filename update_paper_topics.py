@@ -1,79 +1,59 @@
 
-import os
-import pandas as pd
-import ast
-from dotenv import load_dotenv
-from supabase import create_client
+import argparse
+import time
+import clients
+from clients import DEFAULT_PIPELINE_DEPTH, SUPABASE_ENV, pipelined
+from spreadsheet_cache import read_workbook
+from supabase_writer import ChunkedWriter
+from table_sync import fetch_all
+from name_matcher import AMBIGUOUS, MATCHED, NameIndex
+from record_builder import paper_topic_lists, values
 
-# Load environment variables
-load_dotenv('.env.local')
+# Service key if available to bypass RLS, otherwise anon key (clients.py)
+supabase = clients.supabase_admin
 
-url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
-key = os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY")
-service_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+PAPER_COLUMNS = ['name', 'department', 'paper']
 
-if not url or not key:
-    print("Error: Missing environment variables.")
-    exit(1)
+def researcher_papers(df):
+    """(name, department, paper topics) for rows with a name and at least one topic."""
+    rows = [(str(n).strip(), str(d).strip(), p) for n, d, p in
+            zip(values(df, 'name'), values(df, 'department'), values(df, 'paper')) if str(n).strip()]
+    topics = paper_topic_lists([p for _, _, p in rows], [n for n, _, _ in rows])
+    return [(n, d, t) for (n, d, _), t in zip(rows, topics) if t]
 
-# Use service key if available to bypass RLS, otherwise anon key
-supabase = create_client(url, service_key if service_key else key)
+def update_researcher(row):
+    """(row, response or the exception) for one per-row update."""
+    name, department, paper_topics = row
+    try:
+        # Update matching Name AND Department
+        # Using match on name and department to handle homonyms
+        return row, supabase.table('researchers').update({
+            'paper_topics': paper_topics
+        }).eq('name', name).eq('department', department).execute()
+    except Exception as e:
+        return row, e
 
-def update_paper_topics():
+def update_paper_topics(depth=DEFAULT_PIPELINE_DEPTH):
     print("Updating paper topics...")
     try:
         # Read from temp file to avoid permission issues
-        df = pd.read_excel('temp_total_df.xlsx')
+        df = read_workbook('temp_total_df.xlsx', PAPER_COLUMNS)
         df = df.fillna('')
         
         success_count = 0
         fail_count = 0
         
-        for index, row in df.iterrows():
-            name = row.get('name', '').strip()
-            department = row.get('department', '').strip()
-            paper_raw = row.get('paper', '')
-            
-            if not name:
-                continue
-                
-            # Parse paper column
-            paper_topics = []
-            if paper_raw:
-                try:
-                    # It looks like a stringified list: "['Title 1', 'Title 2']"
-                    if str(paper_raw).startswith('['):
-                        paper_topics = ast.literal_eval(str(paper_raw))
-                    else:
-                        # Fallback if it's just a single string or other format
-                        paper_topics = [str(paper_raw)]
-                except Exception as e:
-                    print(f"Error parsing paper for {name}: {e}")
-                    paper_topics = []
-            
-            # Clean up topics (remove newlines, extra spaces)
-            paper_topics = [str(t).strip() for t in paper_topics if t]
-            
-            if not paper_topics:
-                continue
-
-            try:
-                # Update matching Name AND Department
-                # Using match on name and department to handle homonyms
-                response = supabase.table('researchers').update({
-                    'paper_topics': paper_topics
-                }).eq('name', name).eq('department', department).execute()
-                
-                if response.data:
-                    success_count += 1
-                    if success_count % 50 == 0:
-                        print(f"Updated {success_count} researchers...")
-                else:
-                    print(f"Researcher not found: {name} ({department})")
-                    fail_count += 1
-                    
-            except Exception as e:
-                print(f"Error updating {name}: {e}")
+        # Up to `depth` updates in flight on the shared connection pool; results come back in row order
+        for (name, department, _), response in pipelined(update_researcher, researcher_papers(df), depth):
+            if isinstance(response, Exception):
+                print(f"Error updating {name}: {response}")
+                fail_count += 1
+            elif response.data:
+                success_count += 1
+                if success_count % 50 == 0:
+                    print(f"Updated {success_count} researchers...")
+            else:
+                print(f"Researcher not found: {name} ({department})")
                 fail_count += 1
 
         print(f"Update complete. Success: {success_count}, Failed/Not Found: {fail_count}")
@@ -81,5 +61,70 @@ def update_paper_topics():
     except Exception as e:
         print(f"Error reading Excel or executing update: {e}")
 
+def update_paper_topics_bulk(batch_size=200):
+    print("Updating paper topics (bulk)...")
+    started = time.perf_counter()
+    try:
+        df = read_workbook('temp_total_df.xlsx', PAPER_COLUMNS)
+        df = df.fillna('')
+
+        # One query for the whole id mapping; rows are resolved locally instead of filtered server-side.
+        # The name index tolerates spacing variants and uses the department to separate homonyms.
+        # Only exact names are written; one-jamo matches (confidence < 1) are listed for review.
+        researchers = fetch_all(supabase, 'researchers', 'id,name,department')
+        matcher = NameIndex((r.get('name'), r.get('department')) for r in researchers)
+
+        # Upsert by primary key. name/department ride along because the insert half of
+        # an upsert is checked against NOT NULL constraints before the conflict resolves.
+        writer = ChunkedWriter(supabase, 'researchers', chunk_size=batch_size, vector_columns=(), upsert=True)
+        resolved = 0
+        unresolved = []
+        ambiguous = 0
+        review = []
+        for name, department, paper_topics in researcher_papers(df):
+            status, confidence, ids = matcher.resolve(name, department)
+            if status != MATCHED:
+                ambiguous += status == AMBIGUOUS
+                unresolved.append(f"{name} ({department})")
+                continue
+            if confidence < 1.0:
+                matched = ", ".join(sorted({researchers[i]['name'] for i in ids}))
+                review.append(f"{name} ({department}) -> {matched}")
+                continue
+            resolved += 1
+            # Homonyms in the same department all get the topics, as the per-row update did
+            for r in (researchers[i] for i in ids):
+                writer.add({'id': r['id'], 'name': r['name'], 'department': r['department'],
+                            'paper_topics': paper_topics})
+
+        written = writer.close()
+        elapsed = time.perf_counter() - started
+        rate = resolved / elapsed if elapsed > 0 else 0
+        print(f"Update complete in {elapsed:.1f}s ({rate:.1f} rows/s). "
+              f"Resolved: {resolved}, Rows written: {written}, Failed: {writer.failed}, "
+              f"Not Found: {len(unresolved) - ambiguous}, Ambiguous: {ambiguous}, Needs review: {len(review)}")
+        if unresolved:
+            print("Unresolved researchers: " + ", ".join(unresolved))
+        if review:
+            print("Similar names not written (check by hand): " + "; ".join(review))
+        matcher.write_report()
+
+    except Exception as e:
+        print(f"Error reading Excel or executing bulk update: {e}")
+
 if __name__ == "__main__":
-    update_paper_topics()
+    parser = argparse.ArgumentParser(description="Update researchers.paper_topics from temp_total_df.xlsx.")
+    parser.add_argument('--bulk', action='store_true',
+                        help="Resolve ids locally and write batched upserts instead of one update per row")
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--pipeline', type=int, default=DEFAULT_PIPELINE_DEPTH,
+                        help="Per-row updates in flight at once (1 for one at a time)")
+    args = parser.parse_args()
+    clients.require_env(*SUPABASE_ENV)
+
+    if args.bulk:
+        update_paper_topics_bulk(args.batch_size)
+    else:
+        update_paper_topics(args.pipeline)
+    if clients.latencies.samples:
+        print(clients.latencies.report())
@@ -0,0 +1,241 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from embedding_batcher import DEFAULT_MODEL
+from embedding_cache import DEFAULT_CACHE_PATH, EmbeddingCache
+from embedding_classifier import normalized_matrix, project_text, unit_rows
+from name_matcher import MATCHED, NameIndex
+from near_duplicates import find_near_duplicates, project_groups
+from quantization import KINDS, Quantizer
+from record_builder import RESEARCHER_TEXT_COLUMNS, researcher_texts
+from spreadsheet_cache import read_workbook
+from table_sync import natural_key
+
+INDEX_DIR = '.cache/vector_index'
+# The defaults app/api/search/route.ts passes to match_researchers / match_projects
+MATCH_THRESHOLD = 0.3
+MATCH_COUNT = 5
+# Rows scored per product, so int8 / float16 rows are widened one block at a time
+SCAN_ROWS = 65536
+
+
+class VectorIndex:
+    """In-process stand-in for the match_researchers / match_projects RPCs.
+
+    Rows are unit vectors (memory-mapped when loaded from disk), stored as float32 or in
+    a `quantizer` format, with the columns the RPC returns. `search` keeps rows whose
+    cosine similarity is above `threshold`, optionally only those of one department,
+    best first, at most `count` of them. With `probes` an unfiltered search only scans
+    the partitions whose centroids are closest to the query (IVF) after `partition`
+    has clustered the rows; otherwise every row is scored.
+    """
+
+    def __init__(self, matrix, rows, centroids=None, offsets=None, quantizer=None):
+        self.matrix = matrix
+        self.rows = rows
+        self.centroids = centroids
+        self.offsets = offsets
+        self.quantizer = quantizer or Quantizer()
+        self.by_department = {}
+        for i, row in enumerate(rows):
+            self.by_department.setdefault(row.get('department') or '', []).append(i)
+        self.by_department = {d: np.array(ids, dtype=np.int64) for d, ids in self.by_department.items()}
+
+    @classmethod
+    def build(cls, vectors, rows, quantizer=None):
+        """Index of the rows that have a vector (None where the text was never embedded)."""
+        matrix, present = normalized_matrix(vectors)
+        quantizer = (quantizer or Quantizer()).fit(matrix[present])
+        return cls(quantizer.encode(matrix[present]), [row for row, p in zip(rows, present.tolist()) if p],
+                   quantizer=quantizer)
+
+    def partition(self, lists=None, iterations=10, sample=256, seed=0):
+        """Cluster rows into `lists` partitions (spherical k-means) and store them contiguously."""
+        n = len(self.matrix)
+        lists = max(1, min(n, lists or int(n ** 0.5)))
+        rng = np.random.default_rng(seed)
+        matrix = self.quantizer.decode(self.matrix)
+        training = matrix[rng.choice(n, min(n, lists * sample), replace=False)]
+        centroids = training[rng.choice(len(training), lists, replace=False)]
+        for _ in range(iterations):
+            assignment = nearest_centroid(training, centroids)
+            sums = np.zeros_like(centroids)
+            order = np.argsort(assignment, kind='stable')
+            sizes = np.bincount(assignment, minlength=lists)
+            filled = np.flatnonzero(sizes)
+            sums[filled] = np.add.reduceat(training[order], (np.cumsum(sizes) - sizes)[filled], axis=0)
+            empty = ~sums.any(axis=1)
+            # An emptied partition restarts at a random training row
+            sums[empty] = training[rng.choice(len(training), int(empty.sum()))]
+            centroids = unit_rows(sums)
+        assignment = nearest_centroid(matrix, centroids)
+        order = np.argsort(assignment, kind='stable')
+        return VectorIndex(np.asarray(self.matrix)[order], [self.rows[i] for i in order.tolist()], centroids,
+                           np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=lists))]), self.quantizer)
+
+    def candidates(self, query, department=None, probes=None):
+        """Row ids to score, or None for every row.
+
+        A department filter scans that department's rows exactly: they are a small slice
+        already, and filtering the probed partitions instead loses matches that sit in others.
+        """
+        if department is not None:
+            return self.by_department.get(department, np.empty(0, dtype=np.int64))
+        if probes is None or self.centroids is None:
+            return None
+        closest = np.argsort(-(self.centroids @ query))[:probes]
+        return np.concatenate([np.arange(self.offsets[c], self.offsets[c + 1]) for c in closest.tolist()])
+
+    def search(self, query, threshold=MATCH_THRESHOLD, count=MATCH_COUNT, department=None, probes=None):
+        """[row with 'similarity'] best first: `1 - (embedding <=> query) > threshold`, at most `count`."""
+        if count <= 0:
+            return []
+        query = self.quantizer.query(query)
+        ids = self.candidates(query, department, probes)
+        if ids is None:
+            scores = np.concatenate([self.quantizer.scores(self.matrix[i:i + SCAN_ROWS], query)
+                                     for i in range(0, len(self.matrix), SCAN_ROWS)] or [np.empty(0, np.float32)])
+        else:
+            scores = self.quantizer.scores(self.matrix[ids], query)
+        hits = np.flatnonzero(scores > threshold)
+        if len(hits) > count:
+            hits = hits[np.argpartition(-scores[hits], count - 1)[:count]]
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        rows = hits if ids is None else ids[hits]
+        return [dict(self.rows[r], similarity=float(s)) for r, s in zip(rows.tolist(), scores[hits].tolist())]
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, 'vectors.npy'), np.asarray(self.matrix))
+        if self.centroids is not None:
+            np.save(os.path.join(directory, 'centroids.npy'), self.centroids)
+        if self.quantizer.scale is not None:
+            np.save(os.path.join(directory, 'scale.npy'), self.quantizer.scale)
+        meta = {'rows': self.rows, 'offsets': None if self.offsets is None else self.offsets.tolist(),
+                'quantize': self.quantizer.kind, 'dimensions': self.quantizer.dims}
+        with open(os.path.join(directory, 'rows.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, 'rows.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        centroids = load_optional(os.path.join(directory, 'centroids.npy'))
+        offsets = None if meta['offsets'] is None else np.array(meta['offsets'], dtype=np.int64)
+        quantizer = Quantizer(meta.get('quantize', 'float32'), meta.get('dimensions'),
+                              load_optional(os.path.join(directory, 'scale.npy')))
+        return cls(np.load(os.path.join(directory, 'vectors.npy'), mmap_mode='r'), meta['rows'], centroids, offsets,
+                   quantizer)
+
+
+def load_optional(path):
+    return np.load(path) if os.path.exists(path) else None
+
+
+def nearest_centroid(matrix, centroids, block=16384):
+    return np.concatenate([(matrix[i:i + block] @ centroids.T).argmax(axis=1)
+                           for i in range(0, len(matrix), block)] or [np.empty(0, dtype=np.int64)])
+
+
+def text_columns(df, columns):
+    # Cleaned strings per column; columns the workbook does not have are empty, as row.get(col, '') in migrate_data.py
+    return [df[c].fillna('').astype(str).str.strip().tolist() if c in df else [''] * len(df) for c in columns]
+
+
+def researcher_rows(df):
+    # The columns match_researchers returns; sync_key identifies the Supabase row
+    return [{'sync_key': natural_key(name, department), 'name': name, 'department': department,
+             'specialty': specialty, 'profile_url': href}
+            for name, department, specialty, href in zip(*text_columns(df, ['name', 'department', 'specialty', 'href']))]
+
+
+def project_rows(df, matcher, departments):
+    # The columns match_projects returns, plus the PI's department as match_projects' filter_department sees it:
+    # the name resolves to researchers in exactly one department (homonyms across departments have none)
+    rows = []
+    for title, project, researcher_name, pi, year, budget in zip(
+            *text_columns(df, ['title', 'project', 'researcher_name', 'pi', 'year', 'budget'])):
+        status, _, ids = matcher.resolve(pi)
+        rows.append({'sync_key': natural_key(title, project, year, pi), 'title': title,
+                     'researcher_name': researcher_name, 'year': year, 'budget': budget,
+                     'department': departments[ids[0]] if status == MATCHED else ''})
+    return rows
+
+
+def build_indexes(cache_path, directory=INDEX_DIR, model=DEFAULT_MODEL, quantize='float32', dimensions=None):
+    """Researcher and project indexes from the vectors migrate_data.py left in the embedding cache."""
+    cache = EmbeddingCache(cache_path)
+    total = read_workbook('total_df.xlsx', RESEARCHER_TEXT_COLUMNS + ['href'])
+    ntis = read_workbook('ntis_results.xlsx', ['title', 'project', 'researcher_name', 'pi', 'year', 'budget']).fillna('')
+    # The projects migrate_data.py keeps
+    duplicate_of, _ = find_near_duplicates(ntis['title'].tolist(), project_groups(ntis))
+    ntis = ntis[[d is None for d in duplicate_of]]
+    departments, = text_columns(total, ['department'])
+    matcher = NameIndex(zip(total['name'], departments))
+    sources = {
+        'researchers': (researcher_texts(total), researcher_rows(total)),
+        'projects': ([project_text(t, p) for t, p in zip(ntis['title'], ntis['project'])],
+                     project_rows(ntis, matcher, departments)),
+    }
+    for name, (texts, rows) in sources.items():
+        started = time.perf_counter()
+        index = VectorIndex.build(cache.get_many(model, texts), rows, Quantizer(quantize, dimensions))
+        if len(index.rows):
+            index = index.partition()
+        index.save(os.path.join(directory, name))
+        print(f"{name}: {len(index.rows)} of {len(rows)} rows embedded, {index.quantizer.name} "
+              f"({index.matrix.nbytes / 1024:.0f} KB), {0 if index.centroids is None else len(index.centroids)} partitions "
+              f"({time.perf_counter() - started:.2f}s) -> {directory}/{name}")
+
+
+def benchmark(n, dims, queries=200, probes=(1, 2, 4, 8, 16, 32), quantize='float32'):
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((max(1, n // 50), dims)).astype(np.float32)
+    labels = rng.integers(0, len(centers), n)
+    # Loose clusters, so the closest matches of a query spread over several partitions
+    vectors = centers[labels] + 1.5 * rng.standard_normal((n, dims)).astype(np.float32)
+    sample = centers[labels[rng.integers(0, n, queries)]] + 1.5 * rng.standard_normal((queries, dims)).astype(np.float32)
+    rows = [{'sync_key': str(i), 'department': f"dept{i % 40}"} for i in range(n)]
+    full = VectorIndex.build(list(vectors), rows)
+    # Threshold 0 so every query has `count` true matches to recall
+    expected = [{r['sync_key'] for r in full.search(q, 0.0, 10)} for q in sample]
+    started = time.perf_counter()
+    built = VectorIndex.build(list(vectors), rows, Quantizer(quantize)).partition()
+    print(f"{n} rows x {dims} dims, {quantize} ({built.matrix.nbytes / 2 ** 20:.0f} MB): "
+          f"{len(built.centroids)} partitions built in {time.perf_counter() - started:.2f}s")
+    with tempfile.TemporaryDirectory() as directory:
+        # Searched as built indexes are: memory-mapped from disk
+        built.save(directory)
+        index = VectorIndex.load(directory)
+        for p in (None,) + tuple(probes):
+            started = time.perf_counter()
+            got = [{r['sync_key'] for r in index.search(q, 0.0, 10, probes=p)} for q in sample]
+            elapsed = (time.perf_counter() - started) / queries
+            recall = sum(len(a & b) for a, b in zip(got, expected)) / max(1, sum(len(b) for b in expected))
+            print(f"  {'exact' if p is None else f'probes={p}'}: {elapsed * 1000:.2f} ms/query, recall@10 {recall:.3f}")
+        started = time.perf_counter()
+        for q in sample:
+            index.search(q, 0.0, 10, department='dept0')
+        print(f"  department filter: {(time.perf_counter() - started) / queries * 1000:.2f} ms/query")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or benchmark the local researcher / project vector indexes.")
+    parser.add_argument('--build', action='store_true',
+                        help="Build .cache/vector_index/ from the embedding cache migrate_data.py fills")
+    parser.add_argument('--quantize', choices=KINDS, default='float32', help="Stored vector format")
+    parser.add_argument('--dimensions', type=int, help="With --build, truncate embeddings to this many dimensions")
+    parser.add_argument('--benchmark', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--dims', type=int, default=256, help="1536 for text-embedding-3-small")
+    args = parser.parse_args()
+    if args.build:
+        build_indexes(os.environ.get("EMBEDDING_CACHE_PATH", DEFAULT_CACHE_PATH),
+                      quantize=args.quantize, dimensions=args.dimensions)
+    else:
+        for n in args.benchmark:
+            benchmark(n, args.dims, quantize=args.quantize)